@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+LLM 응답 형식(json / structured / compact) 비교 벤치마크
+
+- 예시 퀴즈 파일을 형식별로 인코딩했을 때의 글자 수, UTF-8 바이트 수 (--count-tokens: Gemini 토큰 수)
+- cassette 기록이 있으면 형식별 실제 출력 토큰 수와 파싱 실패율
+
+    uv run python benchmarks/output_format.py 용돈_easy.json --cassette cassettes/llm.jsonl.gz
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+
+def compare_samples(paths: list[str], count_tokens: bool) -> None:
+    from src.models import DifficultyLevel
+    from src.services.output_format import encode_compact
+
+    llm = None
+    if count_tokens:
+        from src.services import get_quiz_service
+        llm = get_quiz_service().llm
+
+    print("=== 예시 파일 형식별 크기 ===")
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            raw = f.read()
+        quiz_data = json.loads(raw)
+        difficulty = DifficultyLevel(quiz_data.get("difficulty", 0))
+        encodings = {
+            "json": raw.strip(),
+            "json(minified)": json.dumps(quiz_data, ensure_ascii=False, separators=(",", ":")),
+            "compact": encode_compact(quiz_data, difficulty)
+        }
+        base = len(encodings["json"].encode("utf-8"))
+        print(f"{os.path.basename(path)} (난이도 {int(difficulty)})")
+        for name, text in encodings.items():
+            size = len(text.encode("utf-8"))
+            line = f"  {name:<16} {len(text):6d}자 {size:6d}B ({size / base:6.1%})"
+            if llm is not None:
+                line += f" {llm.get_num_tokens(text):6d} tokens"
+            print(line)
+
+
+def summarize_cassette(path: str) -> None:
+    from src.models import DifficultyLevel
+    from src.services import get_quiz_service
+    from src.services.cassette import load_entries
+
+    service = get_quiz_service()
+    groups: dict[tuple[int, str], list[dict]] = defaultdict(list)
+    for entry in load_entries(path):
+        if entry["kind"] == "set":
+            groups[(entry["d"], entry.get("f", "json"))].append(entry)
+    if not groups:
+        print(f"cassette에 세트 생성 기록이 없습니다: {path}")
+        return
+
+    print("=== cassette 형식별 출력 토큰 / 파싱 실패율 ===")
+    for (difficulty, output_format), entries in sorted(groups.items()):
+        failures = 0
+        for entry in entries:
+            try:
+                # 서비스와 같은 경로로 파싱 (compact만 decode_compact, json/structured는 JSON 추출)
+                service._parse_quiz(entry["r"], DifficultyLevel(difficulty), output_format)
+            except ValueError:
+                failures += 1
+        tokens = [entry["u"]["output_tokens"] for entry in entries if (entry.get("u") or {}).get("output_tokens")]
+        latencies = [entry["ms"] for entry in entries]
+        token_text = f"출력 토큰 평균 {statistics.mean(tokens):.0f}" if tokens else "출력 토큰 정보 없음"
+        print(
+            f"  난이도 {difficulty} {output_format:<10} {len(entries):4d}건, {token_text}, "
+            f"지연 중앙값 {statistics.median(latencies):.0f}ms, 파싱 실패 {failures / len(entries):.1%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LLM 응답 형식 비교 벤치마크")
+    parser.add_argument("samples", nargs="*", default=[os.path.join(ROOT, "용돈_easy.json")], help="예시 퀴즈 JSON 파일")
+    parser.add_argument("--count-tokens", action="store_true", help="Gemini API로 토큰 수 계산 (API 키 필요)")
+    parser.add_argument("--cassette", default=None, help="형식별 실제 응답을 집계할 cassette 파일")
+    args = parser.parse_args()
+
+    compare_samples(args.samples, args.count_tokens)
+    if args.cassette:
+        summarize_cassette(args.cassette)
+
+
+if __name__ == "__main__":
+    main()
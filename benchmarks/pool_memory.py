@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+퀴즈 풀 보관 형식별 메모리 벤치마크
+
+같은 세트 N개를 pydantic 응답 모델 / dict / QuizRecord(압축 표현)로 보관했을 때
+tracemalloc으로 잰 세트당 바이트 수와 QuizRecord → dict 복원 시간을 비교합니다.
+세트마다 문자열 내용을 조금씩 바꿔 문자열 공유 없이 실제 풀과 같은 조건으로 측정합니다.
+
+    uv run python benchmarks/pool_memory.py --count 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+TOPICS = ("용돈", "저축", "소비", "투자", "은행", "화폐", "물가", "시장")
+
+QUESTION = "용돈을 저금통에 차곡차곡 모아두면, 나중에 더 비싸고 멋진 장난감을 살 수 있어요"
+DESCRIPTION = "딩동댕! 저금통에 돈을 모으면 작은 돈들이 쌓여서 큰 돈이 돼요. 그러면 나중에 정말 갖고 싶었던 장난감을 살 수 있어요!"
+CHOICES = ("저금통에 모으기", "바로 과자 사기", "친구에게 빌려주기", "은행에 맡기기")
+
+
+def sample_quiz(difficulty: int, n: int) -> dict:
+    """n번째 예시 세트 (세트마다 다른 문자열)"""
+    quiz_data = {"difficulty": difficulty}
+    for i in range(1, 4):
+        quiz_data[f"Q{i}"] = f"{QUESTION} ({n}-{i})"
+        if difficulty == 0:
+            quiz_data[f"A{i}"] = "O" if (n + i) % 2 else "X"
+        else:
+            count = 3 if difficulty == 1 else 4
+            quiz_data[f"Q{i}_choices"] = [f"{choice} {n}" for choice in CHOICES[:count]]
+            quiz_data[f"A{i}"] = (n + i) % count + 1
+        quiz_data[f"D{i}"] = f"{DESCRIPTION} ({n}-{i})"
+    return quiz_data
+
+
+def measure(name: str, build, count: int) -> list:
+    """build(n)로 count개를 만들어 보관했을 때 늘어난 메모리 (입력 dict는 측정에서 제외)"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    stored = [build(n) for n in range(count)]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_set = (after - before) / count
+    print(f"  {name:<10} {per_set:8.0f} B/세트  (합계 {(after - before) / 1024 / 1024:7.1f} MiB)")
+    return stored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="퀴즈 풀 보관 형식별 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=100000, help="난이도별 보관할 세트 수")
+    args = parser.parse_args()
+
+    from src.models import EasyQuizResponse, MediumQuizResponse, HardQuizResponse
+    from src.services.quiz_record import QuizRecord
+
+    models = {0: EasyQuizResponse, 1: MediumQuizResponse, 2: HardQuizResponse}
+    for difficulty, model in models.items():
+        print(f"=== 난이도 {difficulty} - {args.count}세트 ===")
+        topic = TOPICS[difficulty]
+        measure("pydantic", lambda n: model(**sample_quiz(difficulty, n)), args.count)
+        measure("dict", lambda n: sample_quiz(difficulty, n), args.count)
+        records = measure("record", lambda n: QuizRecord.from_quiz(sample_quiz(difficulty, n), topic), args.count)
+
+        started = time.perf_counter()
+        for record in records:
+            record.to_quiz()
+        elapsed = time.perf_counter() - started
+        print(f"  record → dict 복원 {elapsed / len(records) * 1e6:.1f}us/세트")
+        del records
+
+
+if __name__ == "__main__":
+    main()
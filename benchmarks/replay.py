@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+cassette 재생 기반 오프라인 부하 벤치마크
+
+record 모드(LLM_CASSETTE_MODE=record)로 모아 둔 실제 Gemini 응답을 네트워크 없이 재생하면서
+QuizGeneratorService.generate_quiz 전체 경로(대기열, 파싱, 검증, 문항 재생성)를 실행합니다.
+
+    uv run python benchmarks/replay.py --cassette cassettes/llm.jsonl.gz --requests 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run(args) -> None:
+    from src.models import QuizRequest, DifficultyLevel
+    from src.services import get_quiz_service
+    from src.services.cassette import load_entries
+
+    entries = [entry for entry in load_entries(args.cassette) if entry["kind"] == "set"]
+    if not entries:
+        raise SystemExit(f"재생할 기록이 없습니다: {args.cassette}")
+    difficulties = sorted({entry["d"] for entry in entries})
+
+    service = get_quiz_service()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    outcomes: Counter = Counter()
+
+    async def one(i: int) -> None:
+        request = QuizRequest(difficulty=DifficultyLevel(difficulties[i % len(difficulties)]))
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await service.generate_quiz(request, timeout=args.timeout)
+                outcomes["ok"] += 1
+            except Exception as e:
+                outcomes[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    print(f"=== 재생 벤치마크: 기록 {len(entries)}건, 요청 {args.requests}건, 동시성 {args.concurrency} ===")
+    print(f"결과: {dict(outcomes)}")
+    print(f"처리량: {args.requests / elapsed:.1f} req/s")
+    print(
+        f"지연(ms): 평균 {statistics.mean(latencies):.1f}, p50 {percentile(latencies, 0.5):.1f}, "
+        f"p95 {percentile(latencies, 0.95):.1f}, p99 {percentile(latencies, 0.99):.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="cassette 재생 부하 벤치마크")
+    parser.add_argument("--cassette", default="cassettes/llm.jsonl.gz", help="cassette 파일 경로")
+    parser.add_argument("--requests", type=int, default=100, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="기록된 지연 시간 배율 (0이면 지연 없음)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청당 타임아웃 (초)")
+    args = parser.parse_args()
+
+    os.environ["LLM_CASSETTE_MODE"] = "replay"
+    os.environ["LLM_CASSETTE_PATH"] = args.cassette
+    os.environ["LLM_CASSETTE_TIME_SCALE"] = str(args.time_scale)
+    os.environ.setdefault("GOOGLE_API_KEY", "replay")
+    os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+API 프로세스 시작 시간 벤치마크
+
+- 모듈별 import 시간 (python -X importtime)
+- 프로세스 실행부터 첫 요청 응답까지 걸린 시간 (uvicorn 실행 후 / 폴링)
+
+예산(--import-budget-ms, --ready-budget-ms)을 넘으면 종료 코드 1을 반환하므로
+CI에서 시작 시간 회귀 검사로 사용할 수 있습니다.
+
+    uv run python benchmarks/startup.py --runs 5 --ready-budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    # 시작 경로는 API 키 없이도 동작해야 함 (실제 호출은 하지 않음)
+    env.setdefault("GOOGLE_API_KEY", "benchmark")
+    env["WARMUP_ON_STARTUP"] = "false"
+    return env
+
+
+def measure_imports(module: str) -> tuple[float, list[tuple[str, float]]]:
+    """모듈 import 시간 측정 - (전체 ms, 최상위 패키지별 자체 import 시간 합계 목록)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=_env(), capture_output=True, text=True, check=True
+    )
+    packages: dict[str, float] = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_time, cumulative, name = line[len("import time:"):].split("|")
+            self_us, cumulative_us = int(self_time), int(cumulative)
+        except ValueError:
+            continue  # 헤더 행
+        name = name.strip()
+        if name == module:
+            total = cumulative_us / 1000
+        # 자체 시간은 중복 없이 합산 가능 (누적 시간은 부모에 중첩 포함됨)
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0.0) + self_us / 1000
+    ranking = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return total, ranking
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_ready(timeout: float = 30.0) -> float:
+    """uvicorn 프로세스 실행부터 첫 200 응답까지 걸린 시간 (ms)"""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=ROOT, env=_env()
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"{timeout}초 안에 서버가 준비되지 않았습니다")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--module", default="src.app", help="import 시간을 측정할 모듈")
+    parser.add_argument("--top", type=int, default=10, help="표시할 패키지 수")
+    parser.add_argument("--import-budget-ms", type=float, default=None, help="import 시간 예산 (ms)")
+    parser.add_argument("--ready-budget-ms", type=float, default=None, help="첫 응답까지 시간 예산 (ms)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    import_runs = [measure_imports(args.module) for _ in range(args.runs)]
+    ready_runs = [measure_ready() for _ in range(args.runs)]
+
+    import_ms = statistics.median(total for total, _ in import_runs)
+    ready_ms = statistics.median(ready_runs)
+    ranking = import_runs[-1][1][:args.top]
+
+    if args.json:
+        print(json.dumps({
+            "import_ms": round(import_ms, 1),
+            "ready_ms": round(ready_ms, 1),
+            "packages": {name: round(ms, 1) for name, ms in ranking}
+        }, ensure_ascii=False))
+    else:
+        print(f"=== {args.module} import: {import_ms:.1f}ms (중앙값, {args.runs}회) ===")
+        for name, ms in ranking:
+            print(f"  {name:<30} {ms:8.1f}ms")
+        print(f"=== 첫 응답까지: {ready_ms:.1f}ms ===")
+
+    failed = False
+    if args.import_budget_ms is not None and import_ms > args.import_budget_ms:
+        print(f"import 시간 예산 초과: {import_ms:.1f}ms > {args.import_budget_ms}ms", file=sys.stderr)
+        failed = True
+    if args.ready_budget_ms is not None and ready_ms > args.ready_budget_ms:
+        print(f"첫 응답 시간 예산 초과: {ready_ms:.1f}ms > {args.ready_budget_ms}ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,39 +4,72 @@ Quiz LLM API Server
 10세 이하 어린이를 위한 경제 교육 퀴즈 생성 서버
 """
 
+import argparse
 import uvicorn
 import sys
 import os
+import shutil
+import tempfile
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.app import app
-from src.config import settings
+from src.config import settings, get_settings
 
 
 def main():
     """메인 함수 - API 서버 실행"""
+    parser = argparse.ArgumentParser(description="Quiz LLM API Server")
+    parser.add_argument("--production", action="store_true",
+                        help="운영 모드 (reload 없이 멀티 워커로 실행)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="운영 모드 워커 프로세스 수 (기본값: WORKERS 환경 변수)")
+    args = parser.parse_args()
+    
+    workers = 1
+    state_dir = None
+    if args.production:
+        workers = args.workers if args.workers is not None else settings.workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        
+        # 워커가 여러 개면 동시 호출 제한과 퀴즈 풀을 공유 (워커 프로세스는 환경 변수를 상속)
+        # 경로를 지정하지 않았으면 실행마다 새 임시 디렉터리를 사용 - 같은 호스트의 다른 인스턴스나
+        # 이전 실행에서 강제 종료된 워커의 임대가 섞이지 않음 (종료 시 삭제)
+        if workers > 1 and not settings.shared_state_path:
+            state_dir = tempfile.mkdtemp(prefix="quiz_llm_state_")
+            os.environ["SHARED_STATE_PATH"] = os.path.join(state_dir, "state.sqlite3")
+    
+    # 워커별 스케줄러가 전체 동시 호출 수를 나눠 갖도록 실제 워커 수 전달 (개발 모드는 1개)
+    os.environ["WORKERS"] = str(workers)
+    get_settings.cache_clear()
+    
     print("=" * 50)
     print("Quiz LLM API Server Starting...")
     print(f"Model: {settings.model_name}")
+    print(f"Mode: {'production' if args.production else 'development'} (workers={workers})")
     print(f"Server: http://{settings.host}:{settings.port}")
     print(f"Docs: http://{settings.host}:{settings.port}/docs")
     print("=" * 50)
     
-    uvicorn.run(
-        "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-        log_level="info",
-        # 비동기 성능 최적화 설정
-        workers=1,  # 개발 모드에서는 1개
-        loop="asyncio",
-        access_log=True,
-        timeout_keep_alive=30,
-        timeout_graceful_shutdown=30
-    )
+    try:
+        uvicorn.run(
+            "main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=not args.production,
+            log_level="info",
+            # 비동기 성능 최적화 설정
+            workers=workers,  # 개발 모드에서는 1개
+            loop="asyncio",
+            access_log=True,
+            timeout_keep_alive=30,
+            timeout_graceful_shutdown=30
+        )
+    finally:
+        if state_dir is not None:
+            shutil.rmtree(state_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
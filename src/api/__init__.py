@@ -1,3 +1,6 @@
 from .quiz import router as quiz_router
+from .jobs import router as jobs_router
+from .session import router as session_router
+from .admin import router as admin_router
 
-__all__ = ["quiz_router"]
+__all__ = ["quiz_router", "jobs_router", "session_router", "admin_router"]
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+from fastapi.responses import FileResponse
+from src.models import ErrorResponse, ProfilingUpdate
+from src.services.loop_monitor import loop_monitor
+from src.services.profiler import get_profiler
+from src.config import settings
+from typing import Optional
+import asyncio
+import logging
+import secrets
+
+logger = logging.getLogger(__name__)
+
+
+def admin_token_valid(token: Optional[str]) -> bool:
+    """관리자 토큰 확인 (ADMIN_TOKEN 미설정 시 항상 False)"""
+    return bool(settings.admin_token and token and secrets.compare_digest(token, settings.admin_token))
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다 (ADMIN_TOKEN 미설정).")
+    if not admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+    responses={
+        401: {"model": ErrorResponse, "description": "관리자 토큰 불일치"},
+        403: {"model": ErrorResponse, "description": "관리자 API 비활성화"}
+    }
+)
+
+
+@router.get(
+    "/profiling",
+    summary="요청 프로파일링 상태",
+    description="느린 요청 자동 수집 설정, 예약된 프로파일링 요청 수, 저장 위치를 반환합니다."
+)
+async def get_profiling_status():
+    """요청 프로파일링 상태 반환"""
+    return get_profiler().status()
+
+
+@router.put(
+    "/profiling",
+    summary="요청 프로파일링 설정 변경",
+    description="느린 요청 자동 수집을 켜고 끄거나 기준 시간/표본 비율을 바꾸고, 다음 N개 요청의 프로파일링을 예약합니다. "
+                "변경은 이 워커 프로세스에만 적용되며 재시작하면 설정값으로 돌아갑니다."
+)
+async def update_profiling(update: ProfilingUpdate):
+    """요청 프로파일링 설정 변경"""
+    return get_profiler().configure(**update.model_dump())
+
+
+@router.get(
+    "/profiles",
+    summary="저장된 프로파일 목록",
+    description="저장된 요청 프로파일의 메타데이터(경로, 상태 코드, 처리 시간, 수집 이유)를 최신 순으로 반환합니다."
+)
+async def list_profiles():
+    """저장된 프로파일 목록"""
+    return {"profiles": await asyncio.to_thread(get_profiler().store.list)}
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 프로파일 ID"},
+        404: {"model": ErrorResponse, "description": "프로파일 없음 (또는 삭제됨)"}
+    },
+    summary="프로파일 조회",
+    description="누적 시간/자체 시간 기준 상위 함수 요약을 반환합니다. format=pstats이면 snakeviz 등에서 열 수 있는 "
+                "pstats 파일을 내려받습니다."
+)
+async def get_profile(
+    profile_id: str = Path(..., description="프로파일 ID (X-Profile-Id 응답 헤더 값)"),
+    format: str = Query(default="json", pattern="^(json|pstats)$", description="json 또는 pstats")
+):
+    """프로파일 요약 또는 pstats 파일 반환"""
+    store = get_profiler().store
+    try:
+        if format == "pstats":
+            path = store.pstats_path(profile_id)
+            if path is None:
+                raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+            return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
+        record = await asyncio.to_thread(store.get, profile_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if record is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return record
+
+
+@router.get(
+    "/event-loop",
+    summary="이벤트 루프 지연 / 블로킹 기록",
+    description="이벤트 루프 지연 통계와, LOOP_BLOCK_THRESHOLD 설정 시 감시 스레드가 기록한 최근 블로킹의 "
+                "루프 스레드 스택(최신 순)을 반환합니다."
+)
+async def get_event_loop_status():
+    """이벤트 루프 지연 통계와 최근 블로킹 기록"""
+    return {**loop_monitor.stats(), "reports": list(reversed(loop_monitor.reports))}
@@ -0,0 +1,76 @@
+"""
+GET 응답 HTTP 캐시 처리
+
+JSON 본문을 한 번 직렬화해 강한 ETag와 gzip 본문을 함께 계산해 두고,
+If-None-Match가 일치하면 본문 없이 304를 반환합니다. gzip 본문은 인코딩별로 다른 ETag를 사용합니다.
+캐시하지 않는 큰 응답(퀴즈 묶음 등)은 compressed_json으로 gzip 압축만 적용합니다.
+"""
+
+from fastapi import Request, Response
+from src.config import settings
+from typing import Optional
+import gzip
+import hashlib
+import json
+
+
+def _matches(if_none_match: Optional[str], etags: tuple[str, ...]) -> bool:
+    """If-None-Match 비교 (약한 비교 - W/ 접두사 무시)"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or any(etag in candidates for etag in etags)
+
+
+def accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _encode(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _gzip(body: bytes) -> Optional[bytes]:
+    """http_gzip_min_size 이상인 본문만 압축 (설정이 None이면 압축하지 않음)"""
+    min_size = settings.http_gzip_min_size
+    if min_size is None or len(body) < min_size:
+        return None
+    return gzip.compress(body, compresslevel=6)
+
+
+def compressed_json(request: Request, content) -> Response:
+    """캐시하지 않는 JSON 응답 - 클라이언트가 gzip을 받으면 압축해서 반환"""
+    body = _encode(content)
+    headers = {"Cache-Control": "no-store", "Vary": "Accept-Encoding"}
+    gzip_body = _gzip(body) if accepts_gzip(request) else None
+    if gzip_body is not None:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gzip_body, media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class CachedJson:
+    """ETag/Cache-Control/gzip을 미리 계산한 JSON 응답 본문"""
+
+    def __init__(self, content, max_age: int, public: bool = True):
+        self.body = _encode(content)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+        self.gzip_body = _gzip(self.body)
+        self.cache_control = f"{'public' if public else 'private'}, max-age={max_age}"
+
+    def response(self, request: Request) -> Response:
+        """요청 헤더에 맞는 응답 (200, gzip 200 또는 304)"""
+        use_gzip = self.gzip_body is not None and accepts_gzip(request)
+        headers = {
+            "ETag": self.gzip_etag if use_gzip else self.etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding"
+        }
+        if _matches(request.headers.get("if-none-match"), (self.etag, self.gzip_etag)):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type="application/json", headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, HTTPException, Query, Path
+from src.models import QuizJobRequest, QuizJobResponse, ErrorResponse
+from src.services import ServiceUnavailableError
+from src.services.job_queue import get_job_manager
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/quiz/jobs", tags=["Quiz Jobs"])
+
+
+def _job_response(job: dict) -> QuizJobResponse:
+    return QuizJobResponse(**{key: job[key] for key in QuizJobResponse.model_fields})
+
+
+@router.post(
+    "",
+    status_code=202,
+    response_model=QuizJobResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        503: {"model": ErrorResponse, "description": "대기 작업이 가득 참"}
+    },
+    summary="퀴즈 생성 작업 등록",
+    description="퀴즈 생성을 백그라운드 작업으로 등록하고 작업 ID를 즉시 반환합니다. "
+                "결과는 작업 조회(long-poll 가능) 또는 callback_url로 받을 수 있습니다."
+)
+async def submit_quiz_job(request: QuizJobRequest) -> QuizJobResponse:
+    """퀴즈 생성 작업 등록 API"""
+    try:
+        if request.quiz_count != 3:
+            raise ValueError("현재 버전에서는 3개 퀴즈만 지원합니다.")
+        job = await get_job_manager().submit(request)
+        logger.info("퀴즈 생성 작업 등록 - ID: %s, 난이도: %s, 주제: %s", job['job_id'], request.difficulty, request.topic)
+        return _job_response(job)
+    except ServiceUnavailableError as e:
+        headers = {"Retry-After": str(math.ceil(e.retry_after))} if e.retry_after else None
+        raise HTTPException(status_code=503, detail=str(e), headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get(
+    "/{job_id}",
+    response_model=QuizJobResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "작업 없음 (또는 만료)"}
+    },
+    summary="퀴즈 생성 작업 조회",
+    description="작업 상태와 결과를 조회합니다. wait를 지정하면 작업이 끝날 때까지 최대 wait초 기다립니다."
+)
+async def get_quiz_job(
+    job_id: str = Path(..., description="작업 ID"),
+    wait: float = Query(default=0.0, ge=0.0, le=30.0, description="완료 대기 시간 (초, long-poll)")
+) -> QuizJobResponse:
+    """퀴즈 생성 작업 조회 API"""
+    job = await get_job_manager().get(job_id, wait=wait)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return _job_response(job)
@@ -0,0 +1,55 @@
+"""
+요청 프로파일링 미들웨어
+
+/quiz 아래 HTTP 요청 중 프로파일링 대상(X-Profile 헤더, 관리자 예약, 느린 요청 자동 수집 표본)을
+cProfile로 감싸 실행합니다. 헤더나 관리자 예약으로 프로파일링한 응답에는 X-Profile-Id 헤더를 붙입니다.
+"""
+
+from starlette.datastructures import Headers
+from src.api.admin import admin_token_valid
+from src.services.profiler import get_profiler
+import time
+
+
+class ProfilingMiddleware:
+    """프로파일링 대상 요청을 cProfile로 감싸 실행 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/quiz"):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        header_requested = headers.get("x-profile") == "1" and admin_token_valid(headers.get("x-admin-token"))
+        profiler = get_profiler()
+        trigger = profiler.trigger(header_requested)
+        profile = profiler.start() if trigger else None
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiler.new_id()
+        status_code = None
+
+        async def send_with_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if trigger != "slow":
+                    message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.finish(profile_id, profile, trigger, {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status_code,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            })
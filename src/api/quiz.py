@@ -1,28 +1,119 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request, Response
 from src.models import (
     QuizRequest, 
     EasyQuizResponse, 
     MediumQuizResponse, 
     HardQuizResponse,
-    QuizResponse,
     ErrorResponse, 
-    DifficultyLevel
+    DifficultyLevel,
+    QuizBundleRequest,
+    QuizBundleResponse
 )
-from src.services import QuizGeneratorService
+from src.services import QuizGeneratorService, ServiceUnavailableError, get_quiz_service
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.readiness import readiness_prober
+from src.services.metrics import metrics
+from src.services.output_format import OUTPUT_FORMATS
+from src.services.loop_monitor import loop_monitor
+from src.services.pool_snapshot import pool_snapshotter
+from src.services.pool_warmer import pool_warmer
+from src.services.popularity import popularity
+from src.api.http_cache import CachedJson, compressed_json
+from src.api.rate_limit import enforce_rate_limit, popularity_client
+from src.services.rate_limiter import get_rate_limiter
 from src.config import settings
 from pydantic import BaseModel, Field
+from functools import lru_cache
 from typing import Optional, Union
 import logging
 import asyncio
+import math
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/quiz", tags=["Quiz"])
 
-# QuizGeneratorService 의존성
-def get_quiz_service() -> QuizGeneratorService:
-    return QuizGeneratorService()
 
+# 클라이언트 연결 끊김 확인 간격 (초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# 경로의 난이도 이름 매핑
+DIFFICULTY_BY_NAME = {
+    "easy": DifficultyLevel.EASY,
+    "medium": DifficultyLevel.MEDIUM,
+    "hard": DifficultyLevel.HARD
+}
+
+
+async def _generate_until_disconnect(
+    http_request: Request,
+    quiz_service: QuizGeneratorService,
+    quiz_request: QuizRequest,
+    timeout: float
+) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
+    """퀴즈 생성 - 생성 중 클라이언트 연결이 끊기면 취소해 슬롯을 반납
+    
+    finish_into_pool_on_disconnect 설정 시에는 취소하지 않고 끝까지 생성해 퀴즈 풀에 보관합니다.
+    """
+    popularity.record(quiz_request.difficulty, quiz_request.topic, client=popularity_client(http_request.scope))
+    task = asyncio.create_task(quiz_service.generate_quiz(quiz_request, timeout=timeout))
+    detached = False
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                break
+        
+        if settings.finish_into_pool_on_disconnect:
+            quiz_service.finish_into_pool(task, quiz_request)
+            detached = True
+            metrics.increment("disconnect.finished_into_pool")
+        else:
+            metrics.increment("disconnect.cancelled")
+        logger.info("클라이언트 연결 끊김 - 난이도: %s, 주제: %s", quiz_request.difficulty, quiz_request.topic)
+        raise HTTPException(status_code=499, detail="클라이언트가 요청을 취소했습니다.")
+    finally:
+        if not detached and not task.done():
+            task.cancel()
+
+
+def _service_unavailable(e: ServiceUnavailableError) -> HTTPException:
+    """일시적 처리 불가 → 503 응답 (Retry-After 헤더 포함)"""
+    headers = {"Retry-After": str(math.ceil(e.retry_after))} if e.retry_after else None
+    return HTTPException(status_code=503, detail=str(e), headers=headers)
+
+
+def _route_stats() -> dict:
+    """모델 경로별 요청 수 / 승격률"""
+    prefix = "llm.route_requests."
+    stats = {}
+    for name, requests in metrics.snapshot()["counters"].items():
+        if not name.startswith(prefix):
+            continue
+        route = name[len(prefix):]
+        escalations = metrics.counter(f"llm.route_escalations.{route}")
+        stats[route] = {
+            "requests": int(requests),
+            "escalations": int(escalations),
+            "escalation_rate": round(escalations / requests, 4) if requests else None
+        }
+    return stats
+
+
+def _output_format_stats(output_format: str) -> dict:
+    """응답 형식별 파싱 실패율 / 검증 실패율"""
+    responses = metrics.counter(f"llm.responses.{output_format}")
+    parse_failures = metrics.counter(f"llm.parse_failures.{output_format}")
+    invalid_sets = metrics.counter(f"llm.invalid_sets.{output_format}")
+    return {
+        "responses": int(responses),
+        "parse_failures": int(parse_failures),
+        "parse_failure_rate": round(parse_failures / responses, 4) if responses else None,
+        "invalid_sets": int(invalid_sets),
+        "invalid_set_rate": round(invalid_sets / responses, 4) if responses else None
+    }
 
 class SimplifiedQuizRequest(BaseModel):
     """간소화된 퀴즈 요청 모델 (난이도별 엔드포인트용)"""
@@ -38,19 +129,21 @@ class SimplifiedQuizRequest(BaseModel):
     responses={
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         408: {"model": ErrorResponse, "description": "요청 타임아웃"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
     },
     summary="경제 퀴즈 생성 (범용)",
     description="10세 이하 어린이를 위한 경제 교육 퀴즈를 생성합니다. 난이도를 직접 지정할 수 있습니다."
 )
 async def generate_quiz(
+    http_request: Request,
     request: QuizRequest,
     timeout: float = Query(default=30.0, ge=5.0, le=120.0, description="타임아웃 시간 (초)"),
     quiz_service: QuizGeneratorService = Depends(get_quiz_service)
 ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
     """경제 퀴즈 생성 API (범용)"""
     try:
-        logger.info(f"퀴즈 생성 요청 - 난이도: {request.difficulty}, 개수: {request.quiz_count}, 주제: {request.topic}, 타임아웃: {timeout}초")
+        logger.info("퀴즈 생성 요청 - 난이도: %s, 개수: %s, 주제: %s, 타임아웃: %s초", request.difficulty, request.quiz_count, request.topic, timeout)
         
         # 현재는 3개 퀴즈만 지원
         if request.quiz_count != 3:
@@ -59,19 +152,24 @@ async def generate_quiz(
                 detail="현재 버전에서는 3개 퀴즈만 지원합니다."
             )
         
-        quiz_response = await quiz_service.generate_quiz(request, timeout=timeout)
+        quiz_response = await _generate_until_disconnect(http_request, quiz_service, request, timeout)
         return quiz_response
         
     except asyncio.TimeoutError:
-        logger.error(f"퀴즈 생성 타임아웃: {timeout}초")
+        logger.error("퀴즈 생성 타임아웃: %s초", timeout)
         raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
     except ValueError as e:
-        logger.error(f"퀴즈 생성 중 값 오류: {str(e)}")
+        logger.error("퀴즈 생성 중 값 오류: %s", e)
         if "타임아웃" in str(e) or "시간이 걸렸습니다" in str(e):
             raise HTTPException(status_code=408, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"퀴즈 생성 중 서버 오류: {str(e)}")
+        logger.error("퀴즈 생성 중 서버 오류: %s", e)
         raise HTTPException(status_code=500, detail="퀴즈 생성 중 오류가 발생했습니다.")
 
 
@@ -81,19 +179,21 @@ async def generate_quiz(
     responses={
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         408: {"model": ErrorResponse, "description": "요청 타임아웃"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
     },
     summary="쉬운 난이도 퀴즈 생성 (OX 퀴즈)",
     description="5-7세 어린이를 위한 쉬운 난이도의 경제 교육 OX 퀴즈를 생성합니다."
 )
 async def generate_easy_quiz(
+    http_request: Request,
     request: SimplifiedQuizRequest = SimplifiedQuizRequest(),
     timeout: float = Query(default=25.0, ge=5.0, le=120.0, description="타임아웃 시간 (초)"),
     quiz_service: QuizGeneratorService = Depends(get_quiz_service)
 ) -> EasyQuizResponse:
     """쉬운 난이도 퀴즈 생성 API"""
     try:
-        logger.info(f"쉬운 난이도 퀴즈 생성 요청 - 주제: {request.topic}, 타임아웃: {timeout}초")
+        logger.info("쉬운 난이도 퀴즈 생성 요청 - 주제: %s, 타임아웃: %s초", request.topic, timeout)
         
         quiz_request = QuizRequest(
             difficulty=DifficultyLevel.EASY,
@@ -101,19 +201,24 @@ async def generate_easy_quiz(
             topic=request.topic
         )
         
-        quiz_response = await quiz_service.generate_quiz(quiz_request, timeout=timeout)
+        quiz_response = await _generate_until_disconnect(http_request, quiz_service, quiz_request, timeout)
         return quiz_response
         
     except asyncio.TimeoutError:
-        logger.error(f"쉬운 퀴즈 생성 타임아웃: {timeout}초")
+        logger.error("쉬운 퀴즈 생성 타임아웃: %s초", timeout)
         raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
     except ValueError as e:
-        logger.error(f"쉬운 퀴즈 생성 중 값 오류: {str(e)}")
+        logger.error("쉬운 퀴즈 생성 중 값 오류: %s", e)
         if "타임아웃" in str(e) or "시간이 걸렸습니다" in str(e):
             raise HTTPException(status_code=408, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"쉬운 퀴즈 생성 중 서버 오류: {str(e)}")
+        logger.error("쉬운 퀴즈 생성 중 서버 오류: %s", e)
         raise HTTPException(status_code=500, detail="쉬운 퀴즈 생성 중 오류가 발생했습니다.")
 
 
@@ -123,19 +228,21 @@ async def generate_easy_quiz(
     responses={
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         408: {"model": ErrorResponse, "description": "요청 타임아웃"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
     },
     summary="보통 난이도 퀴즈 생성 (3지선다)",
     description="8-9세 어린이를 위한 보통 난이도의 경제 교육 3지선다 퀴즈를 생성합니다."
 )
 async def generate_medium_quiz(
+    http_request: Request,
     request: SimplifiedQuizRequest = SimplifiedQuizRequest(),
     timeout: float = Query(default=30.0, ge=5.0, le=120.0, description="타임아웃 시간 (초)"),
     quiz_service: QuizGeneratorService = Depends(get_quiz_service)
 ) -> MediumQuizResponse:
     """보통 난이도 퀴즈 생성 API"""
     try:
-        logger.info(f"보통 난이도 퀴즈 생성 요청 - 주제: {request.topic}, 타임아웃: {timeout}초")
+        logger.info("보통 난이도 퀴즈 생성 요청 - 주제: %s, 타임아웃: %s초", request.topic, timeout)
         
         quiz_request = QuizRequest(
             difficulty=DifficultyLevel.MEDIUM,
@@ -143,19 +250,24 @@ async def generate_medium_quiz(
             topic=request.topic
         )
         
-        quiz_response = await quiz_service.generate_quiz(quiz_request, timeout=timeout)
+        quiz_response = await _generate_until_disconnect(http_request, quiz_service, quiz_request, timeout)
         return quiz_response
         
     except asyncio.TimeoutError:
-        logger.error(f"보통 퀴즈 생성 타임아웃: {timeout}초")
+        logger.error("보통 퀴즈 생성 타임아웃: %s초", timeout)
         raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
     except ValueError as e:
-        logger.error(f"보통 퀴즈 생성 중 값 오류: {str(e)}")
+        logger.error("보통 퀴즈 생성 중 값 오류: %s", e)
         if "타임아웃" in str(e) or "시간이 걸렸습니다" in str(e):
             raise HTTPException(status_code=408, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"보통 퀴즈 생성 중 서버 오류: {str(e)}")
+        logger.error("보통 퀴즈 생성 중 서버 오류: %s", e)
         raise HTTPException(status_code=500, detail="보통 퀴즈 생성 중 오류가 발생했습니다.")
 
 
@@ -165,19 +277,21 @@ async def generate_medium_quiz(
     responses={
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         408: {"model": ErrorResponse, "description": "요청 타임아웃"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
     },
     summary="어려운 난이도 퀴즈 생성 (4지선다)",
     description="10세 어린이를 위한 어려운 난이도의 경제 교육 4지선다 퀴즈를 생성합니다."
 )
 async def generate_hard_quiz(
+    http_request: Request,
     request: SimplifiedQuizRequest = SimplifiedQuizRequest(),
     timeout: float = Query(default=35.0, ge=5.0, le=120.0, description="타임아웃 시간 (초)"),
     quiz_service: QuizGeneratorService = Depends(get_quiz_service)
 ) -> HardQuizResponse:
     """어려운 난이도 퀴즈 생성 API"""
     try:
-        logger.info(f"어려운 난이도 퀴즈 생성 요청 - 주제: {request.topic}, 타임아웃: {timeout}초")
+        logger.info("어려운 난이도 퀴즈 생성 요청 - 주제: %s, 타임아웃: %s초", request.topic, timeout)
         
         quiz_request = QuizRequest(
             difficulty=DifficultyLevel.HARD,
@@ -185,19 +299,24 @@ async def generate_hard_quiz(
             topic=request.topic
         )
         
-        quiz_response = await quiz_service.generate_quiz(quiz_request, timeout=timeout)
+        quiz_response = await _generate_until_disconnect(http_request, quiz_service, quiz_request, timeout)
         return quiz_response
         
     except asyncio.TimeoutError:
-        logger.error(f"어려운 퀴즈 생성 타임아웃: {timeout}초")
+        logger.error("어려운 퀴즈 생성 타임아웃: %s초", timeout)
         raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
     except ValueError as e:
-        logger.error(f"어려운 퀴즈 생성 중 값 오류: {str(e)}")
+        logger.error("어려운 퀴즈 생성 중 값 오류: %s", e)
         if "타임아웃" in str(e) or "시간이 걸렸습니다" in str(e):
             raise HTTPException(status_code=408, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"어려운 퀴즈 생성 중 서버 오류: {str(e)}")
+        logger.error("어려운 퀴즈 생성 중 서버 오류: %s", e)
         raise HTTPException(status_code=500, detail="어려운 퀴즈 생성 중 오류가 발생했습니다.")
 
 
@@ -207,12 +326,14 @@ async def generate_hard_quiz(
     responses={
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         408: {"model": ErrorResponse, "description": "요청 타임아웃"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
     },
     summary="난이도와 주제별 퀴즈 생성",
     description="URL 경로로 난이도와 주제를 지정하여 경제 퀴즈를 생성합니다."
 )
 async def generate_quiz_by_path(
+    http_request: Request,
     difficulty: str = Path(..., description="퀴즈 난이도 (easy/medium/hard)"),
     topic: str = Path(..., description="퀴즈 주제 (예: 용돈, 저축, 소비 등)"),
     timeout: float = Query(default=30.0, ge=5.0, le=120.0, description="타임아웃 시간 (초)"),
@@ -221,57 +342,172 @@ async def generate_quiz_by_path(
     """URL 경로로 난이도와 주제를 지정한 퀴즈 생성"""
     try:
         # 난이도 매핑
-        difficulty_map = {
-            "easy": DifficultyLevel.EASY,
-            "medium": DifficultyLevel.MEDIUM,
-            "hard": DifficultyLevel.HARD
-        }
-        
-        if difficulty.lower() not in difficulty_map:
+        if difficulty.lower() not in DIFFICULTY_BY_NAME:
             raise HTTPException(
                 status_code=400,
-                detail=f"지원하지 않는 난이도입니다. 사용 가능한 난이도: {list(difficulty_map.keys())}"
+                detail=f"지원하지 않는 난이도입니다. 사용 가능한 난이도: {list(DIFFICULTY_BY_NAME.keys())}"
             )
         
         # URL 디코딩 (한글 주제 처리)
         from urllib.parse import unquote
         decoded_topic = unquote(topic)
         
-        logger.info(f"경로 기반 퀴즈 생성 요청 - 난이도: {difficulty}, 주제: {decoded_topic}, 타임아웃: {timeout}초")
+        logger.info("경로 기반 퀴즈 생성 요청 - 난이도: %s, 주제: %s, 타임아웃: %s초", difficulty, decoded_topic, timeout)
         
         # QuizRequest 객체 생성
         quiz_request = QuizRequest(
-            difficulty=difficulty_map[difficulty.lower()],
+            difficulty=DIFFICULTY_BY_NAME[difficulty.lower()],
             quiz_count=3,
             topic=decoded_topic
         )
         
         # 퀴즈 생성
-        quiz_response = await quiz_service.generate_quiz(quiz_request, timeout=timeout)
+        quiz_response = await _generate_until_disconnect(http_request, quiz_service, quiz_request, timeout)
         return quiz_response
         
     except asyncio.TimeoutError:
-        logger.error(f"퀴즈 생성 타임아웃: {timeout}초")
+        logger.error("퀴즈 생성 타임아웃: %s초", timeout)
         raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
     except HTTPException:
         raise
     except ValueError as e:
-        logger.error(f"퀴즈 생성 중 값 오류: {str(e)}")
+        logger.error("퀴즈 생성 중 값 오류: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"퀴즈 생성 중 서버 오류: {str(e)}")
+        logger.error("퀴즈 생성 중 서버 오류: %s", e)
         raise HTTPException(status_code=500, detail="퀴즈 생성 중 오류가 발생했습니다.")
 
 
+@router.post(
+    "/bundle",
+    response_model=QuizBundleResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        408: {"model": ErrorResponse, "description": "요청 타임아웃"},
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
+    },
+    summary="퀴즈 묶음 다운로드 (오프라인용)",
+    description=(
+        "여러 난이도/주제의 퀴즈 세트를 한 번의 응답으로 반환합니다. 퀴즈 풀에 있는 세트를 먼저 채우고 "
+        "부족한 세트만 병렬로 생성하며, Accept-Encoding: gzip 요청에는 압축된 본문을 보냅니다. "
+        "일부 세트 생성에 실패하면 받은 세트와 함께 failed에 실패 내역을 담습니다."
+    )
+)
+async def generate_quiz_bundle(
+    http_request: Request,
+    request: QuizBundleRequest,
+    quiz_service: QuizGeneratorService = Depends(get_quiz_service)
+) -> Response:
+    """퀴즈 묶음 API"""
+    try:
+        total = sum(item.count for item in request.items)
+        if total > settings.bundle_max_sets:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 요청할 수 있는 세트는 최대 {settings.bundle_max_sets}개입니다 (요청: {total}개)."
+            )
+        
+        client = popularity_client(http_request.scope)
+        for item in request.items:
+            popularity.record(item.difficulty, item.topic, item.count, client=client)
+        bundle = await quiz_service.generate_bundle(request)
+        return compressed_json(http_request, bundle)
+        
+    except asyncio.TimeoutError:
+        logger.error("퀴즈 묶음 생성 타임아웃: %s초", request.timeout)
+        raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({request.timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 묶음 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error("퀴즈 묶음 생성 중 값 오류: %s", e)
+        if "타임아웃" in str(e) or "시간이 걸렸습니다" in str(e):
+            raise HTTPException(status_code=408, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("퀴즈 묶음 생성 중 서버 오류: %s", e)
+        raise HTTPException(status_code=500, detail="퀴즈 묶음 생성 중 오류가 발생했습니다.")
+
+
 @router.get(
-    "/difficulty-levels",
-    response_model=dict,
-    summary="지원되는 난이도 목록",
-    description="퀴즈 생성 시 사용할 수 있는 난이도 레벨을 반환합니다."
+    "/{difficulty}/{topic}",
+    response_model=Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse],
+    responses={
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        408: {"model": ErrorResponse, "description": "요청 타임아웃"},
+        429: {"model": ErrorResponse, "description": "요청 빈도 제한 초과"},
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        503: {"model": ErrorResponse, "description": "일시적으로 처리할 수 없음"}
+    },
+    summary="난이도와 주제별 퀴즈 조회 (캐시 가능)",
+    description=(
+        "퀴즈 풀에 있는 난이도/주제별 세트를 꺼내지 않고 반환합니다. 풀이 비어 있으면 생성해 풀에 넣은 뒤 반환하므로 "
+        "같은 세트가 소비되기 전까지 반복 조회는 같은 ETag를 가지며, CDN/브라우저 캐시와 If-None-Match(304)로 처리됩니다."
+    )
 )
-async def get_difficulty_levels():
-    """지원되는 난이도 레벨 목록 반환"""
-    return {
+async def get_quiz_by_path(
+    http_request: Request,
+    difficulty: str = Path(..., description="퀴즈 난이도 (easy/medium/hard)"),
+    topic: str = Path(..., description="퀴즈 주제 (예: 용돈, 저축, 소비 등)"),
+    timeout: float = Query(default=30.0, ge=5.0, le=120.0, description="풀이 비어 있을 때 생성 타임아웃 (초)"),
+    quiz_service: QuizGeneratorService = Depends(get_quiz_service)
+) -> Response:
+    """난이도와 주제별 퀴즈 조회 (ETag/Cache-Control 포함)"""
+    try:
+        if difficulty.lower() not in DIFFICULTY_BY_NAME:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 난이도입니다. 사용 가능한 난이도: {list(DIFFICULTY_BY_NAME.keys())}"
+            )
+        
+        from urllib.parse import unquote
+        quiz_request = QuizRequest(
+            difficulty=DIFFICULTY_BY_NAME[difficulty.lower()],
+            quiz_count=3,
+            topic=unquote(topic)
+        )
+        
+        quiz_data = await quiz_service.pool.peek(quiz_request.difficulty, quiz_request.topic)
+        if quiz_data is None:
+            logger.info("조회할 세트가 없어 생성 - 난이도: %s, 주제: %s", difficulty, quiz_request.topic)
+            # 조회(read) 한도와 별도로 생성(generate) 한도 적용
+            await enforce_rate_limit(http_request, "generate")
+            quiz_response = await _generate_until_disconnect(http_request, quiz_service, quiz_request, timeout)
+            quiz_data = quiz_response.model_dump()
+            # 다음 조회에서도 같은 세트(같은 ETag)를 제공하도록 풀에 보관
+            await quiz_service.pool.put(quiz_request.difficulty, quiz_request.topic, quiz_data)
+        else:
+            popularity.record(quiz_request.difficulty, quiz_request.topic, client=popularity_client(http_request.scope))
+            metrics.increment("http.quiz_get.pool_hit")
+        
+        return CachedJson(quiz_data, settings.quiz_get_max_age).response(http_request)
+        
+    except asyncio.TimeoutError:
+        logger.error("퀴즈 조회 타임아웃: %s초", timeout)
+        raise HTTPException(status_code=408, detail=f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
+    except ServiceUnavailableError as e:
+        logger.warning("퀴즈 생성 일시 거절: %s", e)
+        raise _service_unavailable(e)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error("퀴즈 조회 중 값 오류: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("퀴즈 조회 중 서버 오류: %s", e)
+        raise HTTPException(status_code=500, detail="퀴즈 조회 중 오류가 발생했습니다.")
+
+
+@lru_cache(maxsize=1)
+def _difficulty_levels() -> CachedJson:
+    return CachedJson({
         "difficulty_levels": [
             {
                 "level": 0,
@@ -292,50 +528,73 @@ async def get_difficulty_levels():
                 "format": "Multiple Choice (4 options)"
             }
         ]
-    }
+    }, settings.http_cache_max_age)
+
+
+@lru_cache(maxsize=1)
+def _quiz_topics() -> CachedJson:
+    return CachedJson({
+        "topics": settings.recommended_topics,
+        "description": "어린이 경제 교육에 적합한 주제들입니다. 이외의 주제도 자유롭게 입력할 수 있습니다."
+    }, settings.http_cache_max_age)
+
+
+@router.get(
+    "/difficulty-levels",
+    response_model=dict,
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}},
+    summary="지원되는 난이도 목록",
+    description="퀴즈 생성 시 사용할 수 있는 난이도 레벨을 반환합니다."
+)
+async def get_difficulty_levels(http_request: Request) -> Response:
+    """지원되는 난이도 레벨 목록 반환 (미리 직렬화된 본문, ETag/Cache-Control 포함)"""
+    return _difficulty_levels().response(http_request)
 
 
 @router.get(
     "/topics",
     response_model=dict,
+    responses={304: {"description": "변경 없음 (If-None-Match 일치)"}},
     summary="추천 퀴즈 주제 목록",
     description="퀴즈 생성 시 사용할 수 있는 추천 경제 교육 주제를 반환합니다."
 )
-async def get_quiz_topics():
-    """추천 퀴즈 주제 목록 반환"""
-    return {
-        "topics": [
-            "용돈", "저축", "소비", "투자", "은행",
-            "화폐", "물가", "시장"
-        ],
-        "description": "어린이 경제 교육에 적합한 주제들입니다. 이외의 주제도 자유롭게 입력할 수 있습니다."
-    }
+async def get_quiz_topics(http_request: Request) -> Response:
+    """추천 퀴즈 주제 목록 반환 (미리 직렬화된 본문, ETag/Cache-Control 포함)"""
+    return _quiz_topics().response(http_request)
+
+
+@router.get(
+    "/warming",
+    summary="퀴즈 풀 예열 상태",
+    description="추천 주제 × 난이도 풀 예열 작업의 상태, 최근 실행 진행 상황, 대상별 풀 보유 수를 반환합니다."
+)
+async def get_pool_warming_status():
+    """퀴즈 풀 예열 상태 반환"""
+    return await pool_warmer.status()
 
 
 @router.get(
     "/health",
     summary="서비스 상태 확인",
-    description="Quiz 생성 서비스의 상태를 확인합니다."
+    description="Quiz 생성 서비스의 상태를 확인합니다. 주기적으로 갱신된 상태를 반환하며 LLM을 호출하지 않습니다."
 )
 async def health_check():
     """서비스 헬스체크"""
-    try:
-        # 간단한 서비스 가용성 테스트
-        quiz_service = QuizGeneratorService()
-        return {
-            "status": "healthy",
-            "service": "quiz-generator",
-            "message": "Quiz LLM 서비스가 정상적으로 작동중입니다.",
-            "async_mode": True,
-            "max_concurrent_requests": settings.max_concurrent_requests,
-            "default_timeout": settings.default_timeout
-        }
-    except Exception as e:
-        logger.error(f"헬스체크 실패: {str(e)}")
+    snapshot = readiness_prober.snapshot
+    if snapshot.get("breaker_state") == CircuitBreaker.OPEN:
         raise HTTPException(
             status_code=503,
-            detail=f"Quiz 생성 서비스가 사용할 수 없습니다: {str(e)}"
+            detail="Quiz 생성 서비스가 사용할 수 없습니다: LLM 호출이 일시적으로 중단되었습니다."
         )
+    return {
+        "status": "healthy",
+        "service": "quiz-generator",
+        "message": "Quiz LLM 서비스가 정상적으로 작동중입니다.",
+        "async_mode": True,
+        "max_concurrent_requests": settings.max_concurrent_requests,
+        "default_timeout": settings.default_timeout,
+        "readiness": snapshot
+    }
 
 
 @router.get(
@@ -343,14 +602,31 @@ async def health_check():
     summary="비동기 성능 정보",
     description="현재 비동기 처리 성능 및 설정 정보를 반환합니다."
 )
-async def get_performance_info():
+async def get_performance_info(
+    quiz_service: QuizGeneratorService = Depends(get_quiz_service)
+):
     """비동기 성능 정보 반환"""
     return {
         "async_settings": {
             "max_concurrent_requests": settings.max_concurrent_requests,
             "default_timeout": settings.default_timeout,
-            "llm_timeout": settings.llm_timeout
+            "llm_timeout": settings.llm_timeout,
+            "traffic_class_weights": settings.traffic_class_weights
+        },
+        "model_routes": {
+            "routes": settings.model_routes,
+            "escalation": settings.model_escalation,
+            "stats": _route_stats()
+        },
+        "event_loop": loop_monitor.stats(),
+        "scheduler": quiz_service.scheduler.stats(),
+        "api_keys": quiz_service.keys.stats(),
+        "pool_snapshot": pool_snapshotter.stats(),
+        "rate_limit": get_rate_limiter().stats() if get_rate_limiter() else {"enabled": False},
+        "output_formats": {
+            output_format: _output_format_stats(output_format) for output_format in OUTPUT_FORMATS
         },
+        "metrics": metrics.snapshot(),
         "performance_tips": [
             "타임아웃 값을 조정하여 응답 속도를 최적화할 수 있습니다",
             "동시 요청 수가 제한되어 서버 안정성을 보장합니다",
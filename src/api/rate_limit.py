@@ -0,0 +1,131 @@
+"""
+클라이언트별 요청 빈도 제한 미들웨어
+
+/quiz 아래 요청을 경로 종류로 나눠 검사합니다.
+    read      GET 조회 (난이도/주제 목록, 작업 상태, 풀에 있는 세트 조회 등)
+    generate  POST 생성 요청과 세션(WebSocket) 연결
+
+GET /quiz/{difficulty}/{topic}은 read로 들어오지만 풀이 비어 있어 실제로 생성할 때는
+라우트에서 enforce_rate_limit으로 generate 토큰을 한 번 더 씁니다.
+한도를 넘으면 Retry-After와 함께 429를 반환하고, 세션 연결은 수락하지 않고 닫습니다(1008).
+"""
+
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from src.config import settings
+from src.services.rate_limiter import get_rate_limiter
+from functools import lru_cache
+from typing import Optional
+import hashlib
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+
+def route_class(scope: dict) -> Optional[str]:
+    """요청의 경로 종류 (제한 대상이 아니면 None)"""
+    if not scope["path"].startswith("/quiz"):
+        return None
+    if scope["type"] == "websocket":
+        return "generate"
+    method = scope["method"]
+    if method in ("GET", "HEAD"):
+        return "read"
+    if method == "POST":
+        return "generate"
+    return None
+
+
+def _key_digest(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:24]
+
+
+@lru_cache(maxsize=1)
+def _known_keys() -> frozenset[str]:
+    """발급한 클라이언트 키의 해시 (설정에 있는 키만 버킷 구분에 사용)"""
+    return frozenset(_key_digest(api_key) for api_key in settings.rate_limit_client_keys)
+
+
+def client_ip(scope: dict, headers: Headers) -> str:
+    """클라이언트 IP - 신뢰하는 프록시 수만큼 X-Forwarded-For 뒤에서부터 셈 (앞쪽 값은 클라이언트가 조작 가능)"""
+    hops = settings.rate_limit_trusted_proxy_hops
+    if hops > 0:
+        forwarded = [address.strip() for address in headers.get("x-forwarded-for", "").split(",") if address.strip()]
+        if forwarded:
+            return forwarded[max(0, len(forwarded) - hops)]
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def client_id(scope: dict) -> str:
+    """클라이언트 구분 값 - 발급한 키면 키의 해시, 아니면 IP (임의의 키로 제한을 피하거나 버킷을 채울 수 없음)"""
+    headers = Headers(scope=scope)
+    api_key = headers.get(settings.rate_limit_client_header)
+    if api_key:
+        digest = _key_digest(api_key)
+        if digest in _known_keys():
+            return "key:" + digest
+    return "ip:" + client_ip(scope, headers)
+
+
+def popularity_client(scope: dict) -> Optional[str]:
+    """인기도 중복 집계 방지용 클라이언트 구분 값 - 발급한 키, 또는 신뢰하는 프록시 설정이 있을 때의 IP
+
+    프록시 수를 설정하지 않았으면 앞단 프록시 뒤의 모든 사용자가 같은 IP로 보일 수 있으므로 None(요청마다 집계)
+    """
+    client = client_id(scope)
+    if client.startswith("ip:") and settings.rate_limit_trusted_proxy_hops <= 0:
+        return None
+    return client
+
+
+def _limit_message(retry_after: int) -> str:
+    return f"요청이 너무 많습니다. {retry_after}초 후 다시 시도해 주세요."
+
+
+class RateLimitMiddleware:
+    """경로 종류별 토큰 버킷 검사 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        limited_class = route_class(scope) if scope["type"] in ("http", "websocket") else None
+        limiter = get_rate_limiter() if limited_class else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = client_id(scope)
+        # 라우트에서 추가 검사(enforce_rate_limit)할 때 같은 클라이언트 값을 사용
+        scope.setdefault("state", {})["rate_limit_client"] = client
+        retry_after = await limiter.check(client, limited_class)
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        logger.warning("요청 빈도 제한 - 클라이언트: %s, 종류: %s, 경로: %s", client, limited_class, scope["path"])
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1008, "reason": "rate limited"})
+            return
+        seconds = math.ceil(retry_after)
+        response = JSONResponse(
+            {"detail": _limit_message(seconds)},
+            status_code=429,
+            headers={"Retry-After": str(seconds)}
+        )
+        await response(scope, receive, send)
+
+
+async def enforce_rate_limit(request: Request, limited_class: str) -> None:
+    """라우트 안에서 다른 종류의 토큰을 추가로 사용 - 한도를 넘으면 429"""
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return
+    client = getattr(request.state, "rate_limit_client", None) or client_id(request.scope)
+    retry_after = await limiter.check(client, limited_class)
+    if retry_after:
+        seconds = math.ceil(retry_after)
+        raise HTTPException(status_code=429, detail=_limit_message(seconds), headers={"Retry-After": str(seconds)})
@@ -0,0 +1,95 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from src.services import get_quiz_service
+from src.services.quiz_session import QuizSession
+from src.services.metrics import metrics
+from src.api.quiz import DIFFICULTY_BY_NAME
+from src.api.rate_limit import popularity_client
+from src.config import settings
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/quiz", tags=["Quiz Session"])
+
+
+@router.websocket("/session")
+async def quiz_session(
+    websocket: WebSocket,
+    difficulty: str = Query(default="easy", description="시작 난이도 (easy/medium/hard)"),
+    topics: Optional[str] = Query(default=None, description="라운드마다 순환할 주제 (쉼표로 구분)"),
+    adaptive: bool = Query(default=True, description="라운드 결과에 따라 난이도 조정"),
+    lookahead: Optional[int] = Query(default=None, ge=0, le=5, description="미리 보낼 세트 수"),
+    rounds: Optional[int] = Query(default=None, ge=1, description="최대 라운드 수")
+):
+    """실시간 퀴즈 세션
+
+    서버 → 클라이언트: {"type": "session"}, {"type": "quiz", "round": n, ...}, {"type": "error", ...}, {"type": "complete"}
+    클라이언트 → 서버: {"type": "result", "round": n, "correct": 0~3}, {"type": "retry"}, {"type": "end"}
+    """
+    await websocket.accept()
+    if difficulty.lower() not in DIFFICULTY_BY_NAME:
+        await websocket.send_json({
+            "type": "error",
+            "status": 400,
+            "detail": f"지원하지 않는 난이도입니다. 사용 가능한 난이도: {list(DIFFICULTY_BY_NAME.keys())}"
+        })
+        await websocket.close(code=1008)
+        return
+
+    session = QuizSession(
+        get_quiz_service(),
+        websocket.send_json,
+        difficulty=DIFFICULTY_BY_NAME[difficulty.lower()],
+        topics=[topic.strip() for topic in topics.split(",") if topic.strip()] if topics else [],
+        adaptive=adaptive,
+        lookahead=lookahead,
+        max_rounds=min(rounds or settings.session_max_rounds, settings.session_max_rounds),
+        client=popularity_client(websocket.scope)
+    )
+    metrics.increment("session.opened")
+    logger.info("퀴즈 세션 시작 - 난이도: %s, 주제: %s, 미리 생성: %s", difficulty, session.topics, session.lookahead)
+    await session.send({"type": "session", "lookahead": session.lookahead, "max_rounds": session.max_rounds})
+
+    producer = asyncio.create_task(session.run())
+    try:
+        while not session.finished:
+            try:
+                message = await asyncio.wait_for(websocket.receive_json(), timeout=settings.session_idle_timeout)
+            except asyncio.TimeoutError:
+                logger.info("퀴즈 세션 유휴 시간 초과 - %s라운드 완료", session.completed)
+                await websocket.close(code=1001)
+                return
+            except (KeyError, ValueError):
+                # 잘못된 JSON(ValueError)과 바이너리 프레임(텍스트 모드 수신 시 KeyError)은 연결을 유지한 채 거절
+                await session.send({"type": "error", "status": 400, "detail": "JSON 메시지만 지원합니다."})
+                continue
+
+            kind = message.get("type") if isinstance(message, dict) else None
+            if kind == "end":
+                break
+            if kind == "retry":
+                session.retry()
+            elif kind == "result":
+                try:
+                    session.record_result(int(message.get("round", 0)), int(message.get("correct", -1)))
+                except (TypeError, ValueError) as e:
+                    await session.send({"type": "error", "status": 400, "detail": str(e)})
+            else:
+                await session.send({"type": "error", "status": 400, "detail": f"알 수 없는 메시지 유형입니다: {kind}"})
+
+        await session.send({"type": "complete", "rounds": session.completed})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info("퀴즈 세션 연결 끊김 - %s라운드 완료", session.completed)
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("퀴즈 세션 생성 작업 오류: %s", e)
+        await session.close()
+        metrics.increment("session.closed")
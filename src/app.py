@@ -1,16 +1,79 @@
-from fastapi import FastAPI, HTTPException
+import time
+
+# 시작 시간 측정 기준점 (앱 모듈 import 시작 시각)
+_IMPORT_STARTED_AT = time.perf_counter()
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from src.api import quiz_router
-from src.config import settings
+from contextlib import asynccontextmanager
+from src.api import quiz_router, jobs_router, session_router, admin_router
+from src.api.profiling import ProfilingMiddleware
+from src.api.rate_limit import RateLimitMiddleware
+from src.config import settings, setup_logging, shutdown_logging
+from src.services import get_quiz_service
+from src.services.cassette import get_cassette
+from src.services.readiness import readiness_prober
+from src.services.job_queue import get_job_manager
+from src.services.loop_monitor import loop_monitor
+from src.services.pool_snapshot import pool_snapshotter
+from src.services.pool_warmer import pool_warmer
+import asyncio
 import logging
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# 시작 시간 리포트 (import 완료, 요청 수신 가능, LLM 클라이언트 준비 시점)
+startup_report: dict = {}
+
+# liveness 응답은 미리 만들어 두고 재사용 (요청마다 직렬화하지 않음)
+_LIVE_RESPONSE = Response(content=b'{"status":"alive"}', media_type="application/json")
+
+
+async def _warmup_llm() -> None:
+    """무거운 LLM 클라이언트 로드를 이벤트 루프 밖에서 미리 수행"""
+    started = time.perf_counter()
+    try:
+        await asyncio.to_thread(get_quiz_service().warmup)
+        startup_report["llm_warmup_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("LLM 클라이언트 준비 완료 - %sms", startup_report['llm_warmup_ms'])
+        await readiness_prober.refresh()
+    except Exception as e:
+        logger.error("LLM 클라이언트 준비 실패: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 처리"""
+    # 로깅 설정 (큐 기반 비동기 핸들러 - 설정 로드가 필요하므로 import 시점이 아닌 시작 시 적용)
+    setup_logging()
+    startup_report["ready_ms"] = round((time.perf_counter() - _IMPORT_STARTED_AT) * 1000, 1)
+    logger.info(
+        "서버 준비 완료 - import %sms, 요청 수신까지 %sms", startup_report['import_ms'], startup_report['ready_ms']
+    )
+    
+    # 이전 프로세스의 퀴즈 풀 스냅샷 연결 (헤더/인덱스만 읽음)
+    pool_snapshotter.load()
+    
+    warmup_task = None
+    if settings.warmup_on_startup:
+        warmup_task = asyncio.create_task(_warmup_llm())
+    loop_monitor.start()
+    readiness_prober.start()
+    get_job_manager().start()
+    pool_snapshotter.start()
+    # 스냅샷을 연결한 뒤 부족한 세트만 예열
+    pool_warmer.start()
+    yield
+    await pool_warmer.stop()
+    await get_job_manager().stop()
+    await pool_snapshotter.stop()
+    await readiness_prober.stop()
+    await loop_monitor.stop()
+    await asyncio.to_thread(get_cassette().flush)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    shutdown_logging()
+
 
 def create_app() -> FastAPI:
     """FastAPI 앱 생성 및 설정"""
@@ -20,9 +83,16 @@ def create_app() -> FastAPI:
         description="10세 이하 어린이를 위한 경제 교육 퀴즈 생성 API",
         version="0.1.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
     
+    # 요청 프로파일링 (빈도 제한을 통과한 요청만 대상)
+    app.add_middleware(ProfilingMiddleware)
+    
+    # 클라이언트별 요청 빈도 제한 (CORS 안쪽에 두어 429 응답에도 CORS 헤더 포함)
+    app.add_middleware(RateLimitMiddleware)
+    
     # CORS 설정
     app.add_middleware(
         CORSMiddleware,
@@ -32,8 +102,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
-    # 라우터 등록
+    # 라우터 등록 (작업 경로가 /quiz/{difficulty}/{topic}보다 먼저 매칭되도록 먼저 등록)
+    app.include_router(jobs_router)
+    app.include_router(session_router)
     app.include_router(quiz_router)
+    app.include_router(admin_router)
     
     # 헬스 체크 엔드포인트
     @app.get("/", tags=["Health"])
@@ -45,6 +118,20 @@ def create_app() -> FastAPI:
             "status": "healthy"
         }
     
+    @app.get("/health/live", tags=["Health"])
+    async def liveness():
+        """liveness 프로브 - 프로세스가 요청을 받을 수 있는지만 확인"""
+        return _LIVE_RESPONSE
+    
+    @app.get("/health/ready", tags=["Health"])
+    async def readiness():
+        """readiness 프로브 - 백그라운드에서 주기적으로 갱신한 상태를 그대로 반환"""
+        return Response(
+            content=readiness_prober.body,
+            status_code=200 if readiness_prober.ready else 503,
+            media_type="application/json"
+        )
+    
     @app.get("/health", tags=["Health"])
     async def health_check():
         """상세 헬스 체크"""
@@ -59,10 +146,11 @@ def create_app() -> FastAPI:
             return {
                 "status": "healthy",
                 "message": "모든 서비스가 정상 작동 중입니다.",
-                "model": settings.model_name
+                "model": settings.model_name,
+                "startup": startup_report
             }
         except Exception as e:
-            logger.error(f"헬스 체크 실패: {str(e)}")
+            logger.error("헬스 체크 실패: %s", e)
             raise HTTPException(status_code=500, detail="서비스 상태 확인 중 오류가 발생했습니다.")
     
     return app
@@ -70,11 +158,12 @@ def create_app() -> FastAPI:
 
 # 앱 인스턴스 생성
 app = create_app()
+startup_report["import_ms"] = round((time.perf_counter() - _IMPORT_STARTED_AT) * 1000, 1)
 
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"Starting Quiz LLM API server on {settings.host}:{settings.port}")
+    logger.info("Starting Quiz LLM API server on %s:%s", settings.host, settings.port)
     uvicorn.run(
         "src.app:app",
         host=settings.host,
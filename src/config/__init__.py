@@ -1,3 +1,4 @@
-from .settings import settings
+from .settings import settings, get_settings
+from .logging_config import setup_logging, shutdown_logging
 
-__all__ = ["settings"]
+__all__ = ["settings", "get_settings", "setup_logging", "shutdown_logging"]
@@ -0,0 +1,179 @@
+"""
+비동기 로깅 설정
+
+요청 처리 중의 로그 호출은 레벨별 샘플링을 거친 뒤 LogRecord를 큐에 넣기만 하고,
+메시지 포맷팅(지연 %-포맷팅), JSON 직렬화, 긴 페이로드 자르기/파일 저장, 출력은
+QueueListener 스레드에서 처리하므로 로깅이 이벤트 루프를 막지 않습니다.
+
+uvicorn.access/uvicorn.error 로거의 자체 핸들러도 제거해 같은 큐로 보내므로 요청별 access 로그도 큐를 거칩니다.
+
+긴 데이터(LLM 원문 응답 등)는 메시지에 넣지 말고 extra={"payload": text}로 전달합니다.
+"""
+
+from src.config.settings import settings
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import time
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord 기본 속성 - 이외의 속성(extra)은 JSON 로그의 필드로 출력
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "payload"}
+
+# 페이로드 파일 이름 (저장 시각-내용 해시) - 이름 순서가 저장 순서
+PAYLOAD_FILE_PATTERN = re.compile(r"^\d+-[0-9a-f]{12}\.txt$")
+
+# 자체 StreamHandler를 두는 uvicorn 로거 - 루트의 큐 핸들러로 보내도록 바꿈 (access 로그도 루프에서 쓰지 않음)
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def _prune_payloads(directory: str) -> None:
+    """페이로드 파일을 최대 보관 수만큼만 남기고 오래된 파일 삭제"""
+    names = sorted(name for name in os.listdir(directory) if PAYLOAD_FILE_PATTERN.match(name))
+    for name in names[:max(0, len(names) - settings.log_payload_max_files)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+
+def _render_payload(payload) -> str:
+    """페이로드를 최대 길이로 자르고, 저장 경로가 설정되면 전체 내용을 파일로 저장"""
+    text = payload if isinstance(payload, str) else repr(payload)
+    limit = settings.log_payload_max_chars
+    if len(text) <= limit:
+        return text
+
+    suffix = f"... ({len(text)}자 중 {limit}자)"
+    if settings.log_payload_dir:
+        try:
+            os.makedirs(settings.log_payload_dir, exist_ok=True)
+            name = f"{int(time.time())}-{hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]}.txt"
+            path = os.path.join(settings.log_payload_dir, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            _prune_payloads(settings.log_payload_dir)
+            suffix += f" 전체: {path}"
+        except OSError:
+            pass
+    return text[:limit] + suffix
+
+
+class TextFormatter(logging.Formatter):
+    """기존 텍스트 형식 + 페이로드"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            line += f" | payload: {_render_payload(payload)}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (extra로 전달한 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            entry["payload"] = _render_payload(payload)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """레벨별 샘플링 - settings.log_sample_rates에 지정된 비율만 기록 (지정되지 않은 레벨은 모두 기록)"""
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = {name.upper(): rate for name, rate in rates.items()}
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelname)
+        if rate is None or rate >= 1.0 or random.random() < rate:
+            return True
+        self.dropped += 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (포맷팅은 리스너 스레드에서)"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 호출 스레드에서 메시지를 포맷팅하므로 그대로 넘김
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging() -> None:
+    """루트 로거를 큐 기반 비동기 핸들러로 설정하고 uvicorn 로거도 루트로 보냄 (여러 번 호출해도 한 번만 적용)"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(JsonFormatter() if settings.log_format == "json" else TextFormatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(settings.log_sample_rates))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.log_level.upper())
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        for existing in list(uvicorn_logger.handlers):
+            uvicorn_logger.removeHandler(existing)
+        uvicorn_logger.propagate = True
+
+    _queue_handler = handler
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 모두 출력하고 리스너 스레드 종료 (이후 로그는 출력 핸들러로 직접 기록)"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _listener.stop()
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for output in _listener.handlers:
+        root.addHandler(output)
+    _listener = None
+    _queue_handler = None
@@ -1,5 +1,8 @@
 from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional
+import math
+import os
 
 
 class Settings(BaseSettings):
@@ -7,6 +10,9 @@ class Settings(BaseSettings):
     
     # Google AI API Configuration
     google_api_key: str
+    google_api_keys: list[str] = []  # 추가 API 키 (다른 프로젝트) - google_api_key와 함께 부하 분산
+    key_requests_per_minute: Optional[float] = None  # API 키당 분당 요청 한도 (미설정 시 제한 없음)
+    key_throttle_cooldown: float = 30.0  # 할당량 초과(429) 응답을 받은 키를 제외하는 시간 (초)
     
     # Server Configuration
     host: str = "0.0.0.0"
@@ -20,16 +26,163 @@ class Settings(BaseSettings):
     model_name: str = "gemini-2.5-flash"
     max_tokens: Optional[int] = None
     temperature: float = 0.7
+    quiz_output_formats: dict[str, str] = {"easy": "json", "medium": "json", "hard": "json"}  # 난이도별 LLM 응답 형식 (json, compact, structured)
+    model_routes: dict[str, dict] = {}  # 난이도("easy") 또는 "난이도:주제"별 모델/생성 파라미터 (미지정 시 위 기본 모델)
+    model_escalation: bool = True  # 라우팅된 모델의 결과가 파싱/검증에 실패하면 기본 모델로 다시 생성
     
     # 비동기 처리 설정
-    max_concurrent_requests: int = 5  # 최대 동시 요청 수
+    max_concurrent_requests: int = 5  # API 키당 최대 동시 요청 수
     default_timeout: float = 30.0  # 기본 타임아웃 (초)
     llm_timeout: float = 25.0  # LLM 응답 타임아웃 (초)
+    admission_control: bool = True  # 마감 시간 안에 끝날 수 없는 요청은 대기 없이 503으로 거절
+    queue_high_watermark: Optional[int] = 64  # 생성 대기열이 이 길이에 닿으면 새 생성 요청을 받지 않음 (None이면 제한 없음)
+    queue_low_watermark: Optional[int] = 32  # 대기열이 이 길이 이하로 줄면 다시 받음 (미설정 시 high의 절반)
+    shed_fallback_to_pool: bool = True  # 과부하로 거절할 요청에 같은 난이도의 주제 없는 풀 세트가 있으면 대신 제공
+    traffic_class_weights: dict[str, float] = {"interactive": 4.0, "batch": 1.0}  # 클래스별 슬롯 배분 가중치 (background는 유휴 용량만 사용)
+    
+    # 운영 모드 / 워커 간 공유 상태 설정
+    workers: int = 1  # 운영 모드 워커 프로세스 수 (0이면 CPU 코어 수)
+    shared_state_path: Optional[str] = None  # 설정 시 동시 호출 제한과 퀴즈 풀을 SQLite로 워커 간 공유
+    pool_max_per_key: int = 20  # 난이도/주제별 퀴즈 풀 최대 보관 수
+    pool_max_keys: int = 256  # 퀴즈 풀에 보관할 최대 난이도/주제 수 (초과 시 가장 오래 쓰이지 않은 주제부터 삭제)
+    finish_into_pool_on_disconnect: bool = False  # 클라이언트가 끊겨도 생성을 끝까지 진행해 풀에 보관 (기본: 즉시 취소)
+    pool_snapshot_path: Optional[str] = None  # 설정 시 프로세스 내 퀴즈 풀을 주기적으로/종료 시 저장하고 시작 시 불러옴
+    pool_snapshot_interval: float = 300.0  # 퀴즈 풀 스냅샷 저장 주기 (초)
+    
+    # 클라이언트별 요청 빈도 제한 (토큰 버킷, 공유 상태 경로가 설정되면 워커 간 공유)
+    rate_limit_enabled: bool = False  # 켜기 전에 프록시 뒤라면 rate_limit_trusted_proxy_hops 설정 필요
+    rate_limits: dict[str, dict] = {
+        "read": {"per_minute": 600, "burst": 60},
+        "generate": {"per_minute": 30, "burst": 10}
+    }  # 경로 종류별 분당 보충량/순간 허용량 (read: 조회, generate: LLM 생성) - 지정하지 않은 종류는 제한 없음
+    rate_limit_client_header: str = "X-API-Key"  # 클라이언트 키 헤더 (rate_limit_client_keys에 있는 키만 인정)
+    rate_limit_client_keys: list[str] = []  # 발급한 클라이언트 키 - 키별로 버킷을 따로 둠 (그 외 요청은 IP로 구분)
+    rate_limit_trusted_proxy_hops: int = 0  # 앞단 프록시 수 - X-Forwarded-For의 뒤에서 이 번째 주소를 클라이언트 IP로 사용
+    rate_limit_max_buckets: int = 10000  # 보관할 최대 버킷 수 (클라이언트 × 경로 종류, 초과 시 가장 오래된 버킷부터 삭제)
+    
+    # 추천 주제 / 퀴즈 풀 예열 설정
+    recommended_topics: list[str] = ["용돈", "저축", "소비", "투자", "은행", "화폐", "물가", "시장"]  # /quiz/topics 응답, 예열 기본 대상
+    pool_warm_enabled: bool = False  # 시작 시와 주기적으로 주제 × 난이도 세트를 풀에 미리 생성 (LLM 할당량 사용)
+    pool_warm_topics: Optional[list[str]] = None  # 예열 주제 (미설정 시 추천 주제)
+    pool_warm_difficulties: list[int] = [0, 1, 2]  # 예열 난이도
+    pool_warm_target: int = 2  # 난이도/주제별로 채워 둘 세트 수 (pool_max_per_key 이하)
+    pool_warm_interval: float = 900.0  # 예열 주기 (초)
+    pool_warm_budget: int = 48  # 예열 1회당 최대 LLM 세트 생성 수
+    pool_warm_concurrency: int = 2  # 예열 동시 생성 수
+    pool_warm_timeout: float = 180.0  # 예열 세트 1개 생성 타임아웃 (초, 유휴 슬롯만 쓰므로 대기 시간 포함)
+    pool_warm_trending: int = 16  # 예열 대상에 앞쪽으로 추가할 인기 난이도/주제 수 (0이면 사용 안 함)
+    pool_warm_trending_min_score: float = 3.0  # 인기 키로 볼 최소 점수 (감쇠 반영 서로 다른 클라이언트 수)
+    
+    # 요청 인기도 추정 (count-min sketch + 상위 K)
+    popularity_width: int = 2048  # sketch 행당 카운터 수
+    popularity_depth: int = 4  # sketch 행 수 (해시 함수 수)
+    popularity_top_k: int = 64  # 유지할 상위 키 수
+    popularity_half_life: float = 21600.0  # 요청 비중이 절반이 되는 시간 (초, 같은 클라이언트의 같은 주제는 이 동안 1번만 셈)
+    popularity_max_clients: int = 50000  # 중복 집계 방지를 위해 보관할 최근 (난이도/주제, 클라이언트) 쌍 수
+    
+    # LLM 호출 기록/재생 (cassette) - 오프라인 벤치마크/파싱 테스트용
+    llm_cassette_mode: str = "off"  # off, record, replay
+    llm_cassette_path: str = "cassettes/llm.jsonl.gz"
+    llm_cassette_time_scale: float = 1.0  # 재생 시 기록된 지연 시간 배율 (0이면 지연 없음)
+    
+    # 퀴즈 묶음(bundle) 설정
+    bundle_max_sets: int = 30  # 묶음 요청 1건의 최대 세트 수
+    
+    # 퀴즈 세션(WebSocket) 설정
+    session_lookahead: int = 2  # 진행 중인 라운드 외에 미리 만들어 보내 둘 세트 수
+    session_max_rounds: int = 30  # 세션 1개의 최대 라운드 수
+    session_idle_timeout: float = 600.0  # 클라이언트 메시지가 없으면 세션을 닫는 시간 (초)
+    session_round_timeout: float = 60.0  # 라운드 1개의 세트 생성 타임아웃 (초)
+    
+    # 업스트림 장애 대응 / 상태 확인 설정
+    breaker_failure_threshold: int = 5  # 연속 실패 시 서킷 open
+    breaker_reset_timeout: float = 30.0  # open 유지 시간 (초)
+    readiness_probe_interval: float = 5.0  # readiness 상태 갱신 주기 (초)
+    
+    # 비동기 작업(job) API 설정
+    job_workers: int = 2  # 프로세스당 작업 처리 워커 수
+    job_queue_max_size: int = 100  # 대기 중인 작업 최대 수 (초과 시 503)
+    job_ttl: float = 3600.0  # 작업 정보 보관 시간 (초)
+    job_max_attempts: int = 5  # 작업 최대 실행 횟수 (일시적 거절로 재대기하거나 워커 중단으로 다시 실행한 횟수 포함, 넘으면 실패)
+    job_store_path: Optional[str] = None  # 작업 저장 SQLite 경로 (미설정 시 공유 상태 경로 또는 임시 디렉터리)
+    job_webhook_allowed_hosts: list[str] = ["localhost", "127.0.0.1"]  # 완료 알림을 보낼 수 있는 호스트
+    
+    # HTTP 캐시 설정 (GET 조회 응답)
+    http_cache_max_age: int = 86400  # 난이도/주제 목록 같은 정적 응답의 Cache-Control max-age (초)
+    quiz_get_max_age: int = 300  # GET /quiz/{difficulty}/{topic} 응답의 max-age (초)
+    http_gzip_min_size: Optional[int] = 512  # 이 크기(바이트) 이상이면 gzip 응답 (미설정 시 압축 안 함)
+    
+    # 로깅 설정 (큐 기반 비동기 출력)
+    log_level: str = "INFO"
+    log_format: str = "text"  # text, json (한 줄 JSON)
+    log_sample_rates: dict[str, float] = {}  # 레벨별 기록 비율 (예: {"INFO": 0.1}) - 지정하지 않은 레벨은 모두 기록
+    log_queue_size: int = 10000  # 출력 대기 로그 최대 수 (초과분은 버림)
+    log_payload_max_chars: int = 500  # 로그에 넣는 LLM 응답 등 페이로드 최대 길이
+    log_payload_dir: Optional[str] = None  # 설정 시 잘린 페이로드 전체를 이 디렉터리에 파일로 저장
+    log_payload_max_files: int = 200  # 페이로드 디렉터리에 보관할 최대 파일 수 (초과 시 오래된 파일부터 삭제)
+    
+    # 관리자 API / 요청 프로파일링 설정
+    admin_token: Optional[str] = None  # /admin API와 X-Profile 헤더에 필요한 토큰 (미설정 시 관리자 API 비활성화)
+    profile_slow_threshold: Optional[float] = None  # 설정 시 표본 요청 중 이 시간(초)보다 오래 걸린 요청의 프로파일을 자동 보관
+    profile_sample_rate: float = 0.05  # 느린 요청 자동 수집 시 프로파일링할 요청 비율
+    profile_dir: str = "profiles"  # 프로파일 저장 디렉터리
+    profile_max_files: int = 50  # 보관할 최대 프로파일 수 (초과 시 오래된 것부터 삭제)
+    
+    # 이벤트 루프 지연 모니터
+    loop_monitor_enabled: bool = True  # 이벤트 루프 지연을 주기적으로 측정해 event_loop.lag_ms 히스토그램에 기록
+    loop_monitor_interval: float = 0.5  # 지연 측정 주기 (초)
+    loop_block_threshold: Optional[float] = None  # 디버그용 - 설정 시 루프가 이 시간(초) 이상 블로킹되면 루프 스레드 스택 기록
+    
+    # 시작 설정
+    warmup_on_startup: bool = True  # 시작 직후 백그라운드에서 LLM 클라이언트 미리 로드
+    
+    # 생성 결과 검증 설정
+    max_item_regenerations: int = 1  # 검증 실패 시 개별 재생성할 최대 문항 수
+    
+    @property
+    def api_keys(self) -> list[str]:
+        """부하 분산에 사용할 API 키 목록 (중복 제거, google_api_key가 첫 번째)"""
+        return list(dict.fromkeys([self.google_api_key, *self.google_api_keys]))
+    
+    @property
+    def upstream_capacity(self) -> int:
+        """전체 업스트림 동시 호출 수 (API 키 수에 비례)"""
+        return self.max_concurrent_requests * len(self.api_keys)
+    
+    @property
+    def worker_capacity(self) -> int:
+        """워커 1개의 스케줄러 슬롯 수 - 공유 상태를 쓰면 전체 동시 호출 수를 워커 수로 나눈 몫 (올림)"""
+        if not self.shared_state_path:
+            return self.upstream_capacity
+        workers = self.workers if self.workers > 0 else (os.cpu_count() or 1)
+        return max(1, math.ceil(self.upstream_capacity / workers))
+    
+    @property
+    def worker_key_concurrency(self) -> int:
+        """워커 1개가 API 키 하나에 동시에 보낼 수 있는 호출 수 - 공유 상태를 쓰면 키당 한도를 워커 수로 나눈 몫 (올림)"""
+        if not self.shared_state_path:
+            return self.max_concurrent_requests
+        workers = self.workers if self.workers > 0 else (os.cpu_count() or 1)
+        return max(1, math.ceil(self.max_concurrent_requests / workers))
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        protected_namespaces = ("settings_",)  # model_name, model_routes 등 필드 이름 경고 방지
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 (첫 호출 시 환경 변수/.env 로드)"""
+    return Settings()
+
+
+class _LazySettings:
+    """첫 속성 접근 시 Settings를 생성하는 프록시 - import 시점에 .env를 읽지 않음"""
+    
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
 
 
 # Global settings instance
-settings = Settings()
+settings: Settings = _LazySettings()  # type: ignore[assignment]
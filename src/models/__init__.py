@@ -5,7 +5,16 @@ from .quiz import (
     HardQuizResponse,
     QuizResponse,
     ErrorResponse, 
-    DifficultyLevel
+    DifficultyLevel,
+    TrafficClass,
+    JobStatus,
+    QuizJobRequest,
+    QuizJobResponse,
+    QuizBundleItem,
+    QuizBundleRequest,
+    QuizBundleSet,
+    QuizBundleResponse,
+    ProfilingUpdate
 )
 
 __all__ = [
@@ -15,5 +24,14 @@ __all__ = [
     "HardQuizResponse", 
     "QuizResponse",
     "ErrorResponse", 
-    "DifficultyLevel"
+    "DifficultyLevel",
+    "TrafficClass",
+    "JobStatus",
+    "QuizJobRequest",
+    "QuizJobResponse",
+    "QuizBundleItem",
+    "QuizBundleRequest",
+    "QuizBundleSet",
+    "QuizBundleResponse",
+    "ProfilingUpdate"
 ]
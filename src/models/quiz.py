@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Literal, Union
-from enum import IntEnum
+from enum import IntEnum, Enum
 
 
 class DifficultyLevel(IntEnum):
@@ -10,6 +10,13 @@ class DifficultyLevel(IntEnum):
     HARD = 2    # 상 - 4지선다
 
 
+class TrafficClass(str, Enum):
+    """LLM 호출 우선순위 클래스"""
+    INTERACTIVE = "interactive"  # 화면 앞에서 기다리는 사용자 요청
+    BATCH = "batch"              # 작업(job) API, 커리큘럼 사전 생성 등
+    BACKGROUND = "background"    # 풀 채우기 등 유휴 용량만 사용하는 작업
+
+
 class QuizRequest(BaseModel):
     """퀴즈 생성 요청 모델"""
     difficulty: DifficultyLevel = Field(
@@ -26,6 +33,10 @@ class QuizRequest(BaseModel):
         default=None,
         description="특정 경제 주제 (예: 용돈, 저축, 소비 등)"
     )
+    traffic_class: TrafficClass = Field(
+        default=TrafficClass.INTERACTIVE,
+        description="LLM 호출 우선순위 (interactive, batch, background)"
+    )
 
 
 class EasyQuizResponse(BaseModel):
@@ -84,3 +95,101 @@ class ErrorResponse(BaseModel):
     """에러 응답 모델"""
     error: str = Field(description="에러 메시지")
     detail: Optional[str] = Field(default=None, description="에러 상세 정보")
+
+
+class JobStatus(str, Enum):
+    """비동기 퀴즈 생성 작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QuizJobRequest(QuizRequest):
+    """비동기 퀴즈 생성 작업 요청 모델"""
+    traffic_class: TrafficClass = Field(
+        default=TrafficClass.BATCH,
+        description="LLM 호출 우선순위 (작업은 기본적으로 batch)"
+    )
+    timeout: float = Field(
+        default=60.0,
+        ge=5.0,
+        le=120.0,
+        description="작업 1건의 생성 타임아웃 (초)"
+    )
+    callback_url: Optional[str] = Field(
+        default=None,
+        description="작업 완료 시 결과를 POST할 URL (허용된 내부 호스트만 가능)"
+    )
+
+
+class QuizJobResponse(BaseModel):
+    """비동기 퀴즈 생성 작업 상태 응답 모델"""
+    job_id: str = Field(description="작업 ID")
+    status: JobStatus = Field(description="작업 상태")
+    created_at: float = Field(description="작업 생성 시각 (epoch 초)")
+    updated_at: float = Field(description="마지막 상태 변경 시각 (epoch 초)")
+    expires_at: float = Field(description="작업 정보 만료 시각 (epoch 초)")
+    result: Optional[dict] = Field(default=None, description="생성된 퀴즈 (성공 시)")
+    error: Optional[str] = Field(default=None, description="실패 사유 (실패 시)")
+
+
+class QuizBundleItem(BaseModel):
+    """묶음 요청의 난이도/주제별 세트 수"""
+    difficulty: DifficultyLevel = Field(
+        default=DifficultyLevel.EASY,
+        description="퀴즈 난이도 (0: 하-OX, 1: 중-3지선다, 2: 상-4지선다)"
+    )
+    topic: Optional[str] = Field(
+        default=None,
+        description="특정 경제 주제 (예: 용돈, 저축, 소비 등)"
+    )
+    count: int = Field(
+        default=1,
+        ge=1,
+        le=10,
+        description="받을 퀴즈 세트 수"
+    )
+
+
+class QuizBundleRequest(BaseModel):
+    """퀴즈 묶음(오프라인 사전 다운로드) 요청 모델"""
+    items: list[QuizBundleItem] = Field(
+        min_length=1,
+        max_length=20,
+        description="난이도/주제별 세트 수 목록"
+    )
+    timeout: float = Field(
+        default=60.0,
+        ge=5.0,
+        le=120.0,
+        description="부족한 세트 생성까지 포함한 전체 타임아웃 (초)"
+    )
+    traffic_class: TrafficClass = Field(
+        default=TrafficClass.INTERACTIVE,
+        description="부족한 세트 생성 시 LLM 호출 우선순위"
+    )
+
+
+class QuizBundleSet(BaseModel):
+    """묶음에 포함된 퀴즈 세트"""
+    difficulty: int = Field(description="퀴즈 난이도")
+    topic: Optional[str] = Field(default=None, description="퀴즈 주제")
+    source: Literal["pool", "generated"] = Field(description="풀에서 제공 또는 새로 생성")
+    quiz: dict = Field(description="퀴즈 세트 (난이도별 응답 모델과 같은 형식)")
+
+
+class QuizBundleResponse(BaseModel):
+    """퀴즈 묶음 응답 모델"""
+    requested: int = Field(description="요청한 세트 수")
+    delivered: int = Field(description="포함된 세트 수")
+    sets: list[QuizBundleSet] = Field(description="퀴즈 세트 목록")
+    failed: list[dict] = Field(default_factory=list, description="생성하지 못한 세트 (난이도, 주제, 사유)")
+
+
+class ProfilingUpdate(BaseModel):
+    """요청 프로파일링 설정 변경 요청 모델 (지정한 값만 변경)"""
+    auto_enabled: Optional[bool] = Field(default=None, description="느린 요청 자동 수집 사용 여부")
+    slow_threshold: Optional[float] = Field(default=None, ge=0.1, description="자동 수집 시 보관할 최소 처리 시간 (초)")
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="자동 수집 시 프로파일링할 요청 비율")
+    capture_next: Optional[int] = Field(default=None, ge=0, le=100, description="다음 N개 요청을 프로파일링")
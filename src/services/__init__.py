@@ -1,3 +1,4 @@
-from .quiz_generator import QuizGeneratorService
+from .quiz_generator import QuizGeneratorService, get_quiz_service, peek_quiz_service
+from .errors import ServiceUnavailableError
 
-__all__ = ["QuizGeneratorService"]
+__all__ = ["QuizGeneratorService", "get_quiz_service", "peek_quiz_service", "ServiceUnavailableError"]
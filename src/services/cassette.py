@@ -0,0 +1,181 @@
+"""
+LLM 호출 기록/재생 (cassette)
+
+record 모드에서는 모든 프롬프트/응답 쌍을 지연 시간, 토큰 사용량과 함께 JSON Lines 파일
+(경로가 .gz로 끝나면 gzip)에 추가하고, replay 모드에서는 네트워크 없이 기록된 응답을
+원래 지연 시간(또는 time_scale 배율)으로 돌려줍니다. 파싱에 실패했던 응답도 그대로 기록/재생됩니다.
+
+기록은 메모리에 모았다가 FLUSH_LINES개 또는 FLUSH_INTERVAL초마다(그리고 종료 시 flush()로) 한 번에 씁니다.
+gzip이면 모은 줄 전체가 gzip 멤버 하나가 되고, 쓰는 동안 파일에 배타적 잠금(fcntl)을 걸어
+같은 파일에 기록하는 여러 워커 프로세스의 줄이 섞이지 않습니다.
+"""
+
+from src.config import settings
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 기록 (단일 프로세스에서만 사용)
+    fcntl = None
+
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+# 기록 버퍼를 파일에 쓰는 기준 (줄 수 / 가장 오래된 줄이 버퍼에 머문 시간)
+FLUSH_LINES = 32
+FLUSH_INTERVAL = 5.0
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_entries(path: str) -> list[dict]:
+    """cassette 파일의 모든 기록 읽기"""
+    if not os.path.exists(path):
+        return []
+    with _open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class Cassette:
+    """LLM 응답 기록/재생기"""
+
+    def __init__(self, mode: str, path: str, time_scale: float = 1.0):
+        if mode not in (OFF, RECORD, REPLAY):
+            raise ValueError(f"지원하지 않는 cassette 모드입니다: {mode}")
+        self.mode = mode
+        self.path = path
+        self.time_scale = time_scale
+        self._write_lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._buffered_since = 0.0
+
+        # 재생용 색인 - 프롬프트 일치 우선, 없으면 같은 종류(난이도/세트·문항/응답 형식)의 기록을 순서대로 사용
+        self._by_key: dict[str, list[dict]] = defaultdict(list)
+        self._by_kind: dict[tuple[int, str, str], list[dict]] = defaultdict(list)
+        self._cursor: dict = defaultdict(int)
+        if mode == REPLAY:
+            for entry in load_entries(path):
+                self._by_key[entry["k"]].append(entry)
+                self._by_kind[(entry["d"], entry["kind"], entry.get("f", "json"))].append(entry)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def _next(self, bucket_key, entries: list[dict]) -> dict:
+        index = self._cursor[bucket_key]
+        self._cursor[bucket_key] = index + 1
+        return entries[index % len(entries)]
+
+    async def replay(
+        self,
+        prompt: str,
+        difficulty: int,
+        kind: str,
+        output_format: str = "json"
+    ) -> tuple[str, Optional[dict]]:
+        """기록된 응답 재생 - (응답 텍스트, 토큰 사용량)"""
+        key = prompt_key(prompt)
+        bucket = (int(difficulty), kind, output_format)
+        if self._by_key.get(key):
+            entry = self._next(key, self._by_key[key])
+        elif self._by_kind.get(bucket):
+            entry = self._next(bucket, self._by_kind[bucket])
+        else:
+            raise LookupError(
+                f"cassette에 재생할 기록이 없습니다 (난이도: {difficulty}, 종류: {kind}, 형식: {output_format})"
+            )
+
+        delay = entry["ms"] / 1000 * self.time_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return entry["r"], entry.get("u")
+
+    def _write(self, lines: list[str]) -> None:
+        """모은 줄을 한 번에 추가 (파일 잠금으로 다른 프로세스의 쓰기와 직렬화)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        if self.path.endswith(".gz"):
+            data = gzip.compress(data)
+        with open(self.path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(data)
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _append(self, line: str) -> None:
+        with self._write_lock:
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+            self._buffer.append(line)
+            if len(self._buffer) >= FLUSH_LINES or time.monotonic() - self._buffered_since >= FLUSH_INTERVAL:
+                lines, self._buffer = self._buffer, []
+                self._write(lines)
+
+    def flush(self) -> None:
+        """버퍼에 남은 기록을 파일에 씀 (종료 시 호출)"""
+        with self._write_lock:
+            if self._buffer:
+                lines, self._buffer = self._buffer, []
+                self._write(lines)
+
+    async def record(
+        self,
+        prompt: str,
+        response_text: str,
+        difficulty: int,
+        kind: str,
+        latency_ms: float,
+        usage: Optional[dict],
+        model: str,
+        output_format: str = "json"
+    ) -> None:
+        """프롬프트/응답 쌍 기록 (파일 쓰기는 스레드에서)"""
+        entry = {
+            "k": prompt_key(prompt),
+            "d": int(difficulty),
+            "kind": kind,
+            "f": output_format,
+            "m": model,
+            "ms": round(latency_ms, 1),
+            "u": usage,
+            "t": round(time.time(), 3),
+            "p": prompt,
+            "r": response_text
+        }
+        await asyncio.to_thread(self._append, json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+
+
+@lru_cache(maxsize=1)
+def get_cassette() -> Cassette:
+    """설정에 따른 cassette (기본: off)"""
+    return Cassette(settings.llm_cassette_mode, settings.llm_cassette_path, settings.llm_cassette_time_scale)
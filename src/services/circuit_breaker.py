@@ -0,0 +1,69 @@
+from src.services.errors import ServiceUnavailableError
+import time
+
+
+class CircuitBreaker:
+    """업스트림 LLM 호출 서킷 브레이커
+    
+    연속 실패가 임계값에 도달하면 open 상태가 되어 reset_timeout 동안 호출을 즉시 거절하고,
+    이후 half_open 상태에서 시험 호출 하나의 결과로 닫을지 다시 열지 결정합니다.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._state = self.CLOSED
+    
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+    
+    def retry_after(self) -> float:
+        """다시 시도할 수 있을 때까지 남은 시간 (초)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+    
+    def allows_call(self) -> bool:
+        """지금 호출하면 허용되는지 여부 (상태를 바꾸지 않음)"""
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._probe_in_flight)
+    
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 - 거절 시 ServiceUnavailableError"""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        raise ServiceUnavailableError(
+            "LLM 서비스 호출이 일시적으로 중단되었습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=self.retry_after() or self.reset_timeout
+        )
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        self._state = self.CLOSED
+    
+    def record_cancelled(self) -> None:
+        """결과 없이 취소된 호출 - 실패로 세지 않고 시험 호출 자리만 반납"""
+        self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,9 @@
+from typing import Optional
+
+
+class ServiceUnavailableError(Exception):
+    """일시적으로 요청을 처리할 수 없음 (HTTP 503 + Retry-After로 변환)"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
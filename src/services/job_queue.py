@@ -0,0 +1,326 @@
+"""
+비동기 퀴즈 생성 작업(job) 큐
+
+작업은 SQLite에 저장되어 워커 프로세스 간에 공유되고 재시작 후에도 남아 있으며,
+job_ttl이 지나면 삭제됩니다. 각 프로세스의 작업 워커(job_workers개)가 대기 중인 작업을
+가져가 QuizGeneratorService.generate_quiz로 처리하므로 HTTP 요청 처리와 분리됩니다.
+
+일시적 거절(503)로 다시 대기하거나 워커가 비정상 종료되어 임대가 만료된 작업도 실행 횟수에 포함되며,
+job_max_attempts번 실행해도 끝나지 않은 작업은 실패로 처리합니다.
+"""
+
+from src.config import settings
+from src.models import QuizJobRequest, JobStatus
+from src.services.errors import ServiceUnavailableError
+from src.services.quiz_generator import get_quiz_service
+from src.services.shared_state import SharedStateStore, get_shared_store
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import urllib.request
+import uuid
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value)
+
+# 실행 중 작업 임대 여유 시간 - 워커가 비정상 종료되면 임대 만료 후 다른 워커가 다시 실행
+RUNNING_LEASE_MARGIN = 30.0
+IDLE_POLL_INTERVAL = 1.0
+PURGE_INTERVAL = 60.0
+WEBHOOK_TIMEOUT = 5.0
+
+_COLUMNS = (
+    "job_id", "status", "request", "result", "error", "callback_url",
+    "created_at", "updated_at", "expires_at", "attempts"
+)
+
+
+def validate_callback_url(url: str) -> None:
+    """완료 알림 URL 검증 - 허용된 내부 호스트의 http(s) URL만 허용"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("callback_url은 http(s) URL이어야 합니다.")
+    if parsed.hostname not in settings.job_webhook_allowed_hosts:
+        raise ValueError(
+            f"허용되지 않은 callback_url 호스트입니다: {parsed.hostname} "
+            f"(허용: {settings.job_webhook_allowed_hosts})"
+        )
+
+
+class JobStore:
+    """작업 상태 저장소 (SQLite)"""
+
+    def __init__(self, store: SharedStateStore):
+        self._store = store
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS quiz_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                request TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                callback_url TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                not_before REAL NOT NULL DEFAULT 0,
+                lease_until REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_quiz_jobs_status ON quiz_jobs (status, created_at);
+            CREATE INDEX IF NOT EXISTS idx_quiz_jobs_expires ON quiz_jobs (expires_at);
+        """)
+        # attempts 컬럼이 없던 이전 작업 저장소 파일 갱신
+        with self._store.transaction() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(quiz_jobs)")}
+            if "attempts" not in columns:
+                conn.execute("ALTER TABLE quiz_jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        job = dict(zip(_COLUMNS, row))
+        job["request"] = json.loads(job["request"])
+        if job["result"] is not None:
+            job["result"] = json.loads(job["result"])
+        return job
+
+    def create(self, request: dict, callback_url: Optional[str], max_queued: int) -> Optional[dict]:
+        """작업 등록 - 대기 작업이 가득 찼으면 None"""
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._store.transaction() as conn:
+            (queued,) = conn.execute(
+                "SELECT COUNT(*) FROM quiz_jobs WHERE status = ?", (JobStatus.QUEUED.value,)
+            ).fetchone()
+            if queued >= max_queued:
+                return None
+            conn.execute(
+                "INSERT INTO quiz_jobs (job_id, status, request, callback_url, created_at, updated_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, JobStatus.QUEUED.value, json.dumps(request, ensure_ascii=False),
+                 callback_url, now, now, now + settings.job_ttl)
+            )
+        return self.get(job_id)
+
+    def claim(self, max_attempts: int) -> Optional[dict]:
+        """실행할 작업 하나를 가져와 running으로 표시 (임대가 만료된 running 작업 포함)
+
+        이미 max_attempts번 실행한 작업(임대가 반복해서 만료된 작업)은 실패로 처리하고 건너뜀
+        """
+        now = time.time()
+        with self._store.transaction() as conn:
+            while True:
+                row = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM quiz_jobs "
+                    "WHERE expires_at > ? AND ((status = ? AND not_before <= ?) OR (status = ? AND lease_until < ?)) "
+                    "ORDER BY created_at LIMIT 1",
+                    (now, JobStatus.QUEUED.value, now, JobStatus.RUNNING.value, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                job = self._to_dict(row)
+                if job["attempts"] < max_attempts:
+                    break
+                logger.error("작업 %s 실패 - 실행 %s회 후에도 완료되지 않음", job["job_id"], job["attempts"])
+                conn.execute(
+                    "UPDATE quiz_jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                    (JobStatus.FAILED.value, "작업 처리 중 워커가 반복해서 중단되었습니다.", now, job["job_id"])
+                )
+            timeout = job["request"].get("timeout", settings.default_timeout)
+            conn.execute(
+                "UPDATE quiz_jobs SET status = ?, updated_at = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE job_id = ?",
+                (JobStatus.RUNNING.value, now, now + timeout + RUNNING_LEASE_MARGIN, job["job_id"])
+            )
+        job["status"] = JobStatus.RUNNING.value
+        job["attempts"] += 1
+        return job
+
+    def finish(self, job_id: str, status: JobStatus, result: Optional[dict] = None,
+               error: Optional[str] = None) -> None:
+        with self._store.transaction() as conn:
+            conn.execute(
+                "UPDATE quiz_jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (status.value, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error, time.time(), job_id)
+            )
+
+    def requeue(self, job_id: str, delay: float) -> None:
+        now = time.time()
+        with self._store.transaction() as conn:
+            conn.execute(
+                "UPDATE quiz_jobs SET status = ?, not_before = ?, updated_at = ? WHERE job_id = ?",
+                (JobStatus.QUEUED.value, now + delay, now, job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._store.transaction() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM quiz_jobs WHERE job_id = ? AND expires_at > ?",
+                (job_id, time.time())
+            ).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def purge_expired(self) -> int:
+        with self._store.transaction() as conn:
+            return conn.execute("DELETE FROM quiz_jobs WHERE expires_at <= ?", (time.time(),)).rowcount
+
+
+class JobManager:
+    """작업 등록/조회와 작업 워커 관리"""
+
+    def __init__(self, store: JobStore):
+        self.store = store
+        self._work_available = asyncio.Event()
+        self._finished: dict[str, asyncio.Event] = {}  # long-poll 대기 중인 작업의 완료 이벤트
+        self._waiters: dict[str, int] = {}  # 작업별 대기 중인 long-poll 수 (마지막 대기자가 나갈 때 이벤트 삭제)
+        self._tasks: list[asyncio.Task] = []
+
+    async def submit(self, request: QuizJobRequest) -> dict:
+        """작업 등록 - 대기열이 가득 차면 ServiceUnavailableError"""
+        if request.callback_url:
+            validate_callback_url(request.callback_url)
+        job = await asyncio.to_thread(
+            self.store.create,
+            request.model_dump(mode="json", exclude={"callback_url"}),
+            request.callback_url,
+            settings.job_queue_max_size
+        )
+        if job is None:
+            raise ServiceUnavailableError(
+                "대기 중인 퀴즈 생성 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=settings.default_timeout
+            )
+        self._work_available.set()
+        return job
+
+    async def get(self, job_id: str, wait: float = 0.0) -> Optional[dict]:
+        """작업 조회 - wait초 동안 완료를 기다림 (long-poll)"""
+        deadline = time.monotonic() + wait
+        if wait <= 0:
+            return await asyncio.to_thread(self.store.get, job_id)
+
+        # 같은 프로세스에서 끝나면 즉시 깨어나고, 다른 워커 프로세스 완료는 주기적으로 재조회
+        event = self._finished.setdefault(job_id, asyncio.Event())
+        self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+        try:
+            while True:
+                job = await asyncio.to_thread(self.store.get, job_id)
+                remaining = deadline - time.monotonic()
+                if job is None or job["status"] in TERMINAL_STATUSES or remaining <= 0:
+                    return job
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=min(remaining, IDLE_POLL_INTERVAL))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                del self._waiters[job_id]
+                del self._finished[job_id]
+
+    async def _run_job(self, job: dict) -> None:
+        job_id = job["job_id"]
+        try:
+            request = QuizJobRequest(**job["request"])
+            quiz = await get_quiz_service().generate_quiz(request, timeout=request.timeout)
+        except ServiceUnavailableError as e:
+            if job["attempts"] < settings.job_max_attempts:
+                # 일시적 거절은 실패로 끝내지 않고 나중에 다시 실행
+                logger.warning("작업 %s 재대기 (%s/%s회) - %s", job_id, job["attempts"], settings.job_max_attempts, e)
+                await asyncio.to_thread(self.store.requeue, job_id, e.retry_after or IDLE_POLL_INTERVAL)
+                return
+            logger.error("작업 %s 실패 - %s회 시도 후에도 처리하지 못함: %s", job_id, job["attempts"], e)
+            await asyncio.to_thread(self.store.finish, job_id, JobStatus.FAILED, None, str(e))
+        except Exception as e:
+            logger.error("작업 %s 실패: %s", job_id, e)
+            await asyncio.to_thread(self.store.finish, job_id, JobStatus.FAILED, None, str(e))
+        else:
+            await asyncio.to_thread(self.store.finish, job_id, JobStatus.SUCCEEDED, quiz.model_dump())
+
+        event = self._finished.get(job_id)
+        if event is not None:
+            event.set()
+        if job["callback_url"]:
+            await self._notify(job["callback_url"], job_id)
+
+    async def _notify(self, callback_url: str, job_id: str) -> None:
+        """완료 알림 webhook 전송 (실패해도 작업 결과에는 영향 없음)"""
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            return
+        body = json.dumps(
+            {key: job[key] for key in ("job_id", "status", "result", "error")},
+            ensure_ascii=False
+        ).encode()
+
+        def post() -> None:
+            http_request = urllib.request.Request(
+                callback_url, data=body, method="POST",
+                headers={"Content-Type": "application/json"}
+            )
+            with urllib.request.urlopen(http_request, timeout=WEBHOOK_TIMEOUT):
+                pass
+
+        try:
+            await asyncio.to_thread(post)
+        except Exception as e:
+            logger.warning("작업 %s 완료 알림 실패: %s", job_id, e)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.store.claim, settings.job_max_attempts)
+            except Exception as e:
+                logger.error("작업 가져오기 실패: %s", e)
+                job = None
+            if job is None:
+                self._work_available.clear()
+                try:
+                    await asyncio.wait_for(self._work_available.wait(), timeout=IDLE_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._run_job(job)
+            except Exception:
+                # 저장소 갱신/알림 중 오류로 워커가 멈추지 않도록 기록만 하고 계속 (작업은 임대 만료 후 다시 실행)
+                logger.exception("작업 %s 처리 중 오류", job["job_id"])
+
+    async def _purge(self) -> None:
+        while True:
+            try:
+                purged = await asyncio.to_thread(self.store.purge_expired)
+                if purged:
+                    logger.info("만료된 작업 %s건 삭제", purged)
+            except Exception as e:
+                logger.error("만료 작업 삭제 실패: %s", e)
+            await asyncio.sleep(PURGE_INTERVAL)
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(settings.job_workers)]
+        self._tasks.append(asyncio.create_task(self._purge()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    """작업 관리자 (프로세스 단위)"""
+    path = settings.job_store_path or settings.shared_state_path or os.path.join(
+        tempfile.gettempdir(), "quiz_llm_jobs.sqlite3"
+    )
+    return JobManager(JobStore(get_shared_store(path)))
@@ -0,0 +1,204 @@
+"""
+Google API 키(프로젝트) 풀
+
+키마다 LLM 클라이언트, 분당 요청 버킷, 서킷 브레이커를 따로 두고, 호출할 때마다
+사용 가능한 키 중 진행 중인 호출이 가장 적은 키를 고릅니다. 429(ResourceExhausted)를 받은 키는
+key_throttle_cooldown 동안, 연속 실패로 브레이커가 열린 키는 reset_timeout 동안 선택에서 제외됩니다.
+키마다 진행 중인 호출은 max_concurrent_requests(다중 워커면 워커별 몫)를 넘지 않으므로, 일부 키가 제외되어도
+남은 키에 전체 용량이 몰리지 않고 호출이 대기합니다.
+
+분당 요청 한도는 키의 할당량이므로 공유 상태(SHARED_STATE_PATH)를 쓰면 버킷을 SQLite에 두어
+워커 수와 무관하게 키당 key_requests_per_minute를 지킵니다. 브레이커와 429 제외 시간은 워커별로 관리합니다.
+"""
+
+from src.config import settings
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.errors import ServiceUnavailableError
+from src.services.metrics import metrics
+from src.services.shared_state import SharedStateStore, get_shared_store
+from typing import Optional
+import asyncio
+import hashlib
+import time
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """할당량 초과(429) 오류 여부 - 래핑된 원인 예외까지 확인"""
+    while error is not None:
+        if type(error).__name__ in ("ResourceExhausted", "TooManyRequests") or getattr(error, "code", None) == 429:
+            return True
+        error = error.__cause__
+    return False
+
+
+class TokenBucket:
+    """분당 요청 수 제한 버킷 (rate가 None이면 제한 없음)"""
+
+    def __init__(self, rate_per_minute: Optional[float]):
+        self.rate = rate_per_minute / 60 if rate_per_minute else None
+        self.capacity = max(1.0, rate_per_minute / 60) if rate_per_minute else 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self) -> float:
+        """토큰 1개를 쓸 수 있을 때까지 남은 시간 (초)"""
+        if self.rate is None:
+            return 0.0
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    def take(self) -> None:
+        if self.rate is not None:
+            self._refill()
+            self._tokens -= 1
+
+    async def try_take(self) -> float:
+        """토큰이 있으면 1개 쓰고 0, 없으면 쓸 수 있을 때까지 남은 시간 (초)"""
+        wait = self.wait_time()
+        if wait == 0.0:
+            self.take()
+        return wait
+
+
+class SharedTokenBucket:
+    """워커 간 공유되는 분당 요청 수 제한 버킷 (SQLite, 키 해시별 1행)"""
+
+    def __init__(self, store: SharedStateStore, api_key: str, rate_per_minute: Optional[float]):
+        self.rate = rate_per_minute / 60 if rate_per_minute else None
+        self.capacity = max(1.0, rate_per_minute / 60) if rate_per_minute else 0.0
+        self._key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:24]
+        self._store = store
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS key_buckets (
+                key_hash TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+
+    def _try_take(self) -> float:
+        now = time.time()
+        with self._store.transaction() as conn:
+            row = conn.execute("SELECT tokens, updated_at FROM key_buckets WHERE key_hash = ?", (self._key,)).fetchone()
+            tokens, updated = row if row is not None else (self.capacity, now)
+            tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+            if tokens < 1:
+                return (1 - tokens) / self.rate
+            conn.execute(
+                "INSERT OR REPLACE INTO key_buckets (key_hash, tokens, updated_at) VALUES (?, ?, ?)",
+                (self._key, tokens - 1, now)
+            )
+            return 0.0
+
+    async def try_take(self) -> float:
+        """토큰이 있으면 1개 쓰고 0, 없으면 쓸 수 있을 때까지 남은 시간 (초)"""
+        if self.rate is None:
+            return 0.0
+        return await asyncio.to_thread(self._try_take)
+
+
+def key_bucket(api_key: str):
+    """키의 분당 요청 버킷 (공유 상태 경로가 설정되면 워커 간 공유)"""
+    if settings.shared_state_path and settings.key_requests_per_minute:
+        return SharedTokenBucket(get_shared_store(settings.shared_state_path), api_key, settings.key_requests_per_minute)
+    return TokenBucket(settings.key_requests_per_minute)
+
+
+class UpstreamKey:
+    """API 키 하나의 상태"""
+
+    def __init__(self, index: int, api_key: str):
+        self.index = index
+        self.api_key = api_key
+        self.label = f"key{index}"
+        self.bucket = key_bucket(api_key)
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_timeout
+        )
+        self.clients: dict = {}  # 모델 경로별 LLM 클라이언트
+        self.in_flight = 0
+        self.calls = 0
+        self.throttled_until = 0.0
+
+    def blocked(self) -> bool:
+        """할당량 초과나 브레이커 open으로 선택에서 제외된 상태인지"""
+        return self.throttled_until > time.monotonic() or not self.breaker.allows_call()
+
+    def blocked_for(self) -> float:
+        """제외 상태가 풀릴 때까지 남은 시간 (초)"""
+        return max(self.throttled_until - time.monotonic(), self.breaker.retry_after())
+
+    def throttle(self) -> None:
+        self.throttled_until = time.monotonic() + settings.key_throttle_cooldown
+        metrics.increment(f"llm.key_throttled.{self.label}")
+
+    def stats(self) -> dict:
+        return {
+            "key": f"...{self.api_key[-4:]}",
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "breaker_state": self.breaker.state,
+            "throttled_for": round(max(0.0, self.throttled_until - time.monotonic()), 1)
+        }
+
+
+class ApiKeyPool:
+    """API 키 부하 분산 (사용 가능한 키 중 최소 부하 선택)"""
+
+    def __init__(self, api_keys: list[str]):
+        self.keys = [UpstreamKey(index, api_key) for index, api_key in enumerate(api_keys)]
+        self._released = asyncio.Event()  # 진행 중인 호출이 끝날 때마다 설정 (동시 호출 한도 대기용)
+
+    async def acquire(self, exclude: Optional[set[int]] = None) -> UpstreamKey:
+        """호출에 사용할 키 선택 - 동시 호출/분당 한도가 풀릴 때까지는 기다리고, 모든 키가 제외 상태면 ServiceUnavailableError"""
+        exclude = exclude or set()
+        limit = settings.worker_key_concurrency
+        while True:
+            usable = [key for key in self.keys if key.index not in exclude and not key.blocked()]
+            if not usable:
+                remaining = [key for key in self.keys if key.index not in exclude]
+                retry_after = min((key.blocked_for() for key in remaining), default=0.0)
+                raise ServiceUnavailableError(
+                    "사용 가능한 LLM API 키가 없습니다 (할당량 초과 또는 오류). 잠시 후 다시 시도해주세요.",
+                    retry_after=max(1.0, retry_after)
+                )
+
+            candidates = [key for key in usable if key.in_flight < limit]
+            if not candidates:
+                # 사용 가능한 키가 모두 동시 호출 한도에 도달 - 진행 중인 호출이 끝날 때까지 대기
+                self._released.clear()
+                await self._released.wait()
+                continue
+
+            # 부하가 적은 키부터 토큰을 써 봄
+            waits = []
+            for key in sorted(candidates, key=lambda key: (key.in_flight, key.calls)):
+                wait = await key.bucket.try_take()
+                if wait:
+                    waits.append(wait)
+                    continue
+                # 토큰을 받는 동안 다른 요청이 이 키의 프로브/동시 호출 자리를 가져갔으면 다음 키로
+                if key.blocked() or key.in_flight >= limit:
+                    continue
+                key.breaker.before_call()
+                key.in_flight += 1
+                key.calls += 1
+                metrics.increment(f"llm.key_calls.{key.label}")
+                return key
+
+            if waits:
+                # 분당 요청 한도만 찬 경우 가장 빨리 풀리는 키를 기다림 (전체 마감 시간은 호출자가 관리)
+                await asyncio.sleep(min(waits))
+
+    def release(self, key: UpstreamKey) -> None:
+        key.in_flight -= 1
+        self._released.set()
+
+    def stats(self) -> list[dict]:
+        return [key.stats() for key in self.keys]
@@ -0,0 +1,125 @@
+"""
+이벤트 루프 지연 모니터 / 블로킹 감시
+
+모니터 태스크가 loop_monitor_interval마다 잠들었다 깨어나며, 예정보다 늦게 깨어난 시간을
+이벤트 루프 지연(lag)으로 event_loop.lag_ms 히스토그램에 기록합니다. 지연은 그동안 루프에서 실행된
+동기 작업(pydantic 검증, 큰 JSON 파싱, 클라이언트 생성 등)이 다른 요청을 기다리게 한 시간입니다.
+
+loop_block_threshold를 설정하면 감시 스레드가 모니터 태스크의 다음 예정 시각을 확인하고,
+기준 시간보다 늦어지면 그 순간 이벤트 루프 스레드의 스택을 기록합니다(블로킹 1회당 1번).
+루프가 다시 돌면 블로킹이 이어진 전체 시간을 같은 기록에 채웁니다.
+"""
+
+from src.config import settings
+from src.services.metrics import metrics
+from collections import deque
+from typing import Optional
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+# 보관할 최근 블로킹 기록 수
+MAX_BLOCK_REPORTS = 20
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정과 블로킹 감시 스레드"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._deadline: Optional[float] = None  # 모니터 태스크가 깨어나야 하는 시각
+        self._reported_deadline: Optional[float] = None
+        self.reports: deque = deque(maxlen=MAX_BLOCK_REPORTS)
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.blocked = 0
+
+    async def _run(self) -> None:
+        interval = settings.loop_monitor_interval
+        self._loop_thread_id = threading.get_ident()
+        while True:
+            self._deadline = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.monotonic() - self._deadline)
+            self._record(lag * 1000)
+
+    def _record(self, lag_ms: float) -> None:
+        self.last_lag_ms = lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        metrics.observe("event_loop.lag_ms", lag_ms)
+        # 감시 스레드가 기록한 블로킹이면 전체 시간 채움
+        if self._reported_deadline is not None and self._reported_deadline == self._deadline and self.reports:
+            self.reports[-1]["blocked_ms"] = round(lag_ms, 1)
+            logger.warning("이벤트 루프 블로킹 종료 - %.1fms", lag_ms)
+
+    def _watch(self, threshold: float) -> None:
+        """감시 스레드 - 모니터 태스크가 예정보다 threshold 이상 늦으면 루프 스레드 스택 기록"""
+        check_interval = max(0.01, threshold / 4)
+        while not self._stopping.wait(check_interval):
+            deadline = self._deadline
+            if deadline is None or deadline == self._reported_deadline:
+                continue
+            late = time.monotonic() - deadline
+            if late < threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            del frame
+            self._reported_deadline = deadline
+            self.blocked += 1
+            metrics.increment("event_loop.blocked")
+            self.reports.append({
+                "detected_at": time.time(),
+                "late_ms": round(late * 1000, 1),
+                "blocked_ms": None,  # 루프가 다시 돌면 채움
+                "stack": stack
+            })
+            logger.warning("이벤트 루프가 %.1fms 이상 블로킹됨 - 루프 스레드 스택:\n%s", late * 1000, stack)
+
+    def start(self) -> None:
+        if not settings.loop_monitor_enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        threshold = settings.loop_block_threshold
+        if threshold is not None:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, args=(threshold,), name="loop-block-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.loop_monitor_enabled,
+            "interval": settings.loop_monitor_interval,
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "block_threshold": settings.loop_block_threshold,
+            "blocked": self.blocked
+        }
+
+
+loop_monitor = LoopMonitor()
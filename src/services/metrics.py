@@ -0,0 +1,63 @@
+from collections import defaultdict
+import bisect
+
+
+# 지연 시간 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class _Summary:
+    """관측값 요약 (개수/합계/최대 + 누적 히스토그램)"""
+    
+    __slots__ = ("count", "total", "max", "buckets")
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+    
+    def to_dict(self) -> dict:
+        bounds = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 2) if self.count else 0.0,
+            "max": round(self.max, 2),
+            "histogram": {bound: n for bound, n in zip(bounds, self.buckets) if n}
+        }
+
+
+class Metrics:
+    """프로세스 내 간단한 메트릭 저장소 (/quiz/performance로 노출)"""
+    
+    def __init__(self):
+        self._counters: dict[str, float] = defaultdict(float)
+        self._summaries: dict[str, _Summary] = {}
+    
+    def increment(self, name: str, value: float = 1.0) -> None:
+        self._counters[name] += value
+    
+    def observe(self, name: str, value: float) -> None:
+        summary = self._summaries.get(name)
+        if summary is None:
+            summary = self._summaries[name] = _Summary()
+        summary.observe(value)
+    
+    def counter(self, name: str) -> float:
+        return self._counters.get(name, 0.0)
+    
+    def snapshot(self) -> dict:
+        return {
+            "counters": dict(sorted(self._counters.items())),
+            "summaries": {name: summary.to_dict() for name, summary in sorted(self._summaries.items())}
+        }
+
+
+metrics = Metrics()
@@ -0,0 +1,59 @@
+"""
+난이도/주제별 모델 라우팅
+
+settings.model_routes의 키는 난이도 이름("easy", "medium", "hard") 또는 "난이도:주제"이며,
+값은 모델 이름과 생성 파라미터입니다. 주제까지 일치하는 경로가 우선이고, 일치하는 경로가 없으면
+기본 경로(settings.model_name / temperature / max_tokens)를 사용합니다.
+
+    MODEL_ROUTES='{"easy": {"model": "gemini-2.5-flash-lite", "temperature": 0.5}}'
+"""
+
+from src.config import settings
+from src.models import DifficultyLevel
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+DEFAULT_ROUTE = "default"
+
+
+class ModelRoute(BaseModel):
+    """LLM 호출 경로 (모델 + 생성 파라미터)"""
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
+
+    name: str
+    model: str
+    temperature: float
+    max_tokens: Optional[int] = None
+
+    @property
+    def is_default(self) -> bool:
+        return self.name == DEFAULT_ROUTE
+
+
+def default_route() -> ModelRoute:
+    """기본 경로 - 검증 실패 시 승격 대상이 되는 모델"""
+    return ModelRoute(
+        name=DEFAULT_ROUTE,
+        model=settings.model_name,
+        temperature=settings.temperature,
+        max_tokens=settings.max_tokens
+    )
+
+
+def resolve_route(difficulty: DifficultyLevel, topic: Optional[str] = None) -> ModelRoute:
+    """요청에 맞는 경로 선택 (난이도:주제 → 난이도 → 기본 경로)"""
+    name = DifficultyLevel(difficulty).name.lower()
+    candidates = [name]
+    if topic and topic.strip():
+        candidates.insert(0, f"{name}:{topic.strip()}")
+
+    for key in candidates:
+        route = settings.model_routes.get(key)
+        if route is not None:
+            return ModelRoute(
+                name=key,
+                model=route.get("model", settings.model_name),
+                temperature=route.get("temperature", settings.temperature),
+                max_tokens=route.get("max_tokens", settings.max_tokens)
+            )
+    return default_route()
@@ -0,0 +1,162 @@
+"""
+LLM 응답 형식
+
+- json: 기존 JSON 객체 형식 ("Q1", "Q1_choices", "A1", "D1" ...)
+- compact: 한 줄에 문항 1개, 항목을 '|'로 구분하는 간결 형식
+  (쉬움: 문제|정답|해설, 보통/어려움: 문제|선택지...|정답 번호|해설)
+- structured: 응답 모델의 JSON 스키마를 Gemini에 함께 전달해 스키마에 맞는 JSON만 생성하도록 강제
+
+compact 형식은 키 이름과 JSON 문법을 반복하지 않아 출력 토큰 수가 줄어들고,
+서버에서 기존 응답 모델과 같은 dict로 풀어서 이후 검증/재생성 경로를 그대로 사용합니다.
+"""
+
+from src.config import settings
+from src.models import DifficultyLevel, EasyQuizResponse, MediumQuizResponse, HardQuizResponse
+from src.services.quiz_validator import QUIZ_ITEM_COUNT, CHOICE_COUNTS
+from functools import lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+JSON = "json"
+COMPACT = "compact"
+STRUCTURED = "structured"
+OUTPUT_FORMATS = (JSON, COMPACT, STRUCTURED)
+
+FIELD_SEPARATOR = "|"
+
+
+def output_format_for(difficulty: DifficultyLevel) -> str:
+    """난이도별 설정된 응답 형식 (알 수 없는 값이면 json)"""
+    name = DifficultyLevel(difficulty).name.lower()
+    output_format = settings.quiz_output_formats.get(name, JSON)
+    if output_format not in OUTPUT_FORMATS:
+        logger.warning("알 수 없는 응답 형식 '%s' (난이도: %s) - json 사용", output_format, name)
+        return JSON
+    return output_format
+
+
+def _field_count(difficulty: DifficultyLevel) -> int:
+    # 문제 + 선택지 + 정답 + 해설
+    return 3 + CHOICE_COUNTS.get(difficulty, 0)
+
+
+def compact_format_section(difficulty: DifficultyLevel) -> str:
+    """프롬프트의 간결 응답 형식 안내"""
+    choice_count = CHOICE_COUNTS.get(difficulty, 0)
+    if choice_count:
+        header = FIELD_SEPARATOR.join(
+            ["문제"] + [f"선택지 {n}" for n in range(1, choice_count + 1)] + ["정답 번호", "해설"]
+        )
+        answers = ["1", "2", "3"]
+    else:
+        header = FIELD_SEPARATOR.join(["문제", "정답", "해설"])
+        answers = ["O", "X", "O"]
+
+    ordinals = ["첫 번째", "두 번째", "세 번째"]
+    lines = "\n".join(
+        FIELD_SEPARATOR.join(
+            [f"{ordinals[i]} 퀴즈 문제"]
+            + [f"선택지 {n}" for n in range(1, choice_count + 1)]
+            + [answers[i], f"{ordinals[i]} 퀴즈 해설"]
+        )
+        for i in range(QUIZ_ITEM_COUNT)
+    )
+    return f"""**응답 형식:**
+반드시 아래 형식으로만 응답해주세요. JSON, 번호, 머리글, 다른 설명이나 텍스트는 포함하지 마세요.
+한 줄에 퀴즈 1개씩 정확히 {QUIZ_ITEM_COUNT}줄로 작성하고, 각 줄의 항목은 '{FIELD_SEPARATOR}'로 구분합니다.
+각 줄의 순서: {header}
+문제, 선택지, 해설 안에는 '{FIELD_SEPARATOR}'와 줄바꿈을 사용하지 마세요.
+
+{lines}"""
+
+
+def decode_compact(response_text: str, difficulty: DifficultyLevel) -> dict:
+    """간결 형식 응답을 JSON 형식과 같은 퀴즈 dict로 변환 - 형식이 맞지 않으면 ValueError"""
+    lines = [
+        line.strip()
+        for line in response_text.strip().splitlines()
+        if FIELD_SEPARATOR in line and not line.strip().startswith("```")
+    ]
+    if len(lines) != QUIZ_ITEM_COUNT:
+        logger.error("간결 형식 파싱 실패: 문항 줄 수 %d", len(lines), extra={"payload": response_text})
+        raise ValueError(f"LLM 응답에서 퀴즈 {QUIZ_ITEM_COUNT}줄을 찾을 수 없습니다.")
+
+    field_count = _field_count(difficulty)
+    choice_count = CHOICE_COUNTS.get(difficulty, 0)
+    quiz_data: dict = {}
+    for index, line in enumerate(lines, 1):
+        fields = [field.strip() for field in line.split(FIELD_SEPARATOR)]
+        if len(fields) < field_count:
+            logger.error(
+                "간결 형식 파싱 실패: %d번 줄 항목 수 %d", index, len(fields), extra={"payload": response_text}
+            )
+            raise ValueError(f"LLM 응답의 {index}번 퀴즈 항목 수가 올바르지 않습니다.")
+        # 해설에 구분자가 섞여 들어온 경우 마지막 항목으로 합침
+        fields = fields[:field_count - 1] + [FIELD_SEPARATOR.join(fields[field_count - 1:])]
+
+        quiz_data[f"Q{index}"] = fields[0]
+        answer = fields[-2]
+        if choice_count:
+            quiz_data[f"Q{index}_choices"] = fields[1:1 + choice_count]
+            # 숫자가 아닌 정답은 그대로 두어 검증 단계에서 문항 재생성 대상이 되도록 함
+            answer = int(answer) if answer.isdigit() else answer
+        else:
+            answer = answer.upper()
+        quiz_data[f"A{index}"] = answer
+        quiz_data[f"D{index}"] = fields[-1]
+    return quiz_data
+
+
+def encode_compact(quiz_data: dict, difficulty: DifficultyLevel) -> str:
+    """퀴즈 dict를 간결 형식으로 변환 (벤치마크/비교용)"""
+    lines = []
+    for index in range(1, QUIZ_ITEM_COUNT + 1):
+        fields = [quiz_data[f"Q{index}"]]
+        if CHOICE_COUNTS.get(difficulty):
+            fields += quiz_data[f"Q{index}_choices"]
+        fields += [str(quiz_data[f"A{index}"]), quiz_data[f"D{index}"]]
+        lines.append(FIELD_SEPARATOR.join(fields))
+    return "\n".join(lines)
+
+
+_RESPONSE_MODELS = {
+    DifficultyLevel.EASY: EasyQuizResponse,
+    DifficultyLevel.MEDIUM: MediumQuizResponse,
+    DifficultyLevel.HARD: HardQuizResponse
+}
+
+
+@lru_cache(maxsize=None)
+def response_schema(difficulty: DifficultyLevel) -> dict:
+    """난이도별 응답 모델을 Gemini response_schema(OpenAPI 부분 집합) 형식으로 변환
+
+    difficulty는 서버에서 채우므로 제외하고, Gemini가 정수 enum을 지원하지 않으므로
+    정답 번호 범위는 기존 검증 단계에서 확인합니다.
+    """
+    choice_count = CHOICE_COUNTS.get(difficulty, 0)
+    properties = {}
+    for name, field in _RESPONSE_MODELS[DifficultyLevel(difficulty)].model_json_schema()["properties"].items():
+        if name == "difficulty":
+            continue
+        prop = {"type_": field["type"].upper(), "description": field.get("description", "")}
+        if field["type"] == "string" and "enum" in field:
+            prop["enum"] = field["enum"]
+        if field["type"] == "array":
+            prop["items"] = {"type_": "STRING"}
+            prop["min_items"] = prop["max_items"] = choice_count
+        properties[name] = prop
+    return {
+        "type_": "OBJECT",
+        "properties": properties,
+        "required": list(properties),
+        "property_ordering": list(properties)
+    }
+
+
+def structured_generation_config(difficulty: DifficultyLevel) -> dict:
+    """structured 형식 호출에 추가할 Gemini generation_config"""
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": response_schema(difficulty)
+    }
@@ -0,0 +1,257 @@
+"""
+퀴즈 풀 스냅샷 (재시작 후 즉시 제공)
+
+프로세스 내 퀴즈 풀을 주기적으로(그리고 종료 시) 파일로 저장하고, 새 프로세스는 시작할 때 파일을 mmap으로 열어
+헤더와 인덱스만 읽은 뒤 바로 풀에 연결합니다. 세트 본문은 풀에서 꺼낼 때 해당 위치만 읽어 복원합니다.
+
+파일 구조 (little-endian):
+    헤더    magic, 형식 버전, 프롬프트 템플릿 해시, 키 수, 세트 수, 인덱스 위치, 저장 시각, 본문 CRC32
+    세트    (정답 u16, 본문 길이 u32, UTF-8 본문) 반복
+    인덱스  키마다 (난이도 u8, 주제 길이 u16, 세트 수 u32, 주제, 세트 위치 u64 × 세트 수)
+
+형식 버전이나 프롬프트 템플릿 해시가 다르거나 CRC가 맞지 않는 파일은 사용하지 않습니다.
+"""
+
+from src.config import settings
+from src.services.metrics import metrics
+from src.services.quiz_generator import get_quiz_service
+from src.services.quiz_pool import QuizPool, get_quiz_pool
+from src.services.quiz_record import QuizRecord, compact
+from typing import Optional
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"QZPS"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sH2x32sIIQQI")
+RECORD = struct.Struct("<HI")
+KEY = struct.Struct("<BHI")
+OFFSET = struct.Struct("<Q")
+
+
+class SnapshotError(ValueError):
+    """사용할 수 없는 스냅샷 파일"""
+
+
+class SnapshotEntry:
+    """스냅샷 파일 안의 세트 1개 (꺼낼 때만 본문을 읽음)"""
+
+    __slots__ = ("snapshot", "offset", "difficulty", "topic")
+
+    def __init__(self, snapshot: "PoolSnapshot", offset: int, difficulty: int, topic: str):
+        self.snapshot = snapshot
+        self.offset = offset
+        self.difficulty = difficulty
+        self.topic = topic
+
+    def to_record(self) -> QuizRecord:
+        return self.snapshot.record_at(self.offset, self.difficulty, self.topic)
+
+    def to_quiz(self) -> dict:
+        return self.to_record().to_quiz()
+
+
+class PoolSnapshot:
+    """mmap으로 연 스냅샷 파일"""
+
+    def __init__(self, path: str, template_hash: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.entries = self._read_index(template_hash)
+        except (SnapshotError, struct.error, UnicodeDecodeError) as e:
+            self._mm.close()
+            raise SnapshotError(str(e) or "스냅샷 인덱스를 읽을 수 없습니다.")
+
+    def _read_index(self, template_hash: str) -> dict[tuple[int, str], list[SnapshotEntry]]:
+        mm = self._mm
+        if len(mm) < HEADER.size:
+            raise SnapshotError("헤더보다 작은 파일입니다.")
+        magic, version, digest, key_count, record_count, index_offset, saved_at_ms, crc = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise SnapshotError("퀴즈 풀 스냅샷 파일이 아닙니다.")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"지원하지 않는 형식 버전입니다: {version}")
+        if digest.hex() != template_hash:
+            raise SnapshotError("프롬프트 템플릿이 바뀌어 이전 스냅샷을 사용하지 않습니다.")
+        with memoryview(mm) as view, view[HEADER.size:] as body:
+            actual_crc = zlib.crc32(body)
+        if actual_crc != crc:
+            raise SnapshotError("CRC가 일치하지 않습니다 (손상된 파일).")
+        self.saved_at = saved_at_ms / 1000
+
+        entries = {}
+        position = index_offset
+        for _ in range(key_count):
+            difficulty, topic_length, count = KEY.unpack_from(mm, position)
+            position += KEY.size
+            topic = mm[position:position + topic_length].decode("utf-8")
+            position += topic_length
+            offsets = mm[position:position + OFFSET.size * count]
+            position += OFFSET.size * count
+            entries[(difficulty, topic)] = [
+                SnapshotEntry(self, offset, difficulty, topic) for (offset,) in OFFSET.iter_unpack(offsets)
+            ]
+        if sum(len(items) for items in entries.values()) != record_count:
+            raise SnapshotError("인덱스의 세트 수가 헤더와 다릅니다.")
+        return entries
+
+    def record_at(self, offset: int, difficulty: int, topic: str) -> QuizRecord:
+        answers, length = RECORD.unpack_from(self._mm, offset)
+        start = offset + RECORD.size
+        return QuizRecord(difficulty, topic, answers, self._mm[start:start + length].decode("utf-8"))
+
+
+def write_snapshot(path: str, template_hash: str, contents: dict[tuple[int, str], list]) -> int:
+    """풀 내용을 스냅샷 파일로 저장 (임시 파일에 쓴 뒤 교체) - 저장한 세트 수 반환"""
+    body = bytearray()
+    index = bytearray()
+    key_count = 0
+    record_count = 0
+    for (difficulty, topic), items in contents.items():
+        offsets = []
+        for stored in items:
+            if isinstance(stored, SnapshotEntry):
+                record = stored.to_record()
+            else:
+                record = stored if isinstance(stored, QuizRecord) else compact(stored, topic)
+                if not isinstance(record, QuizRecord):
+                    continue  # 압축할 수 없는 데이터는 저장하지 않음
+            text = record.text.encode("utf-8")
+            offsets.append(HEADER.size + len(body))
+            body += RECORD.pack(record.answers, len(text))
+            body += text
+        if not offsets:
+            continue
+        topic_bytes = topic.encode("utf-8")
+        index += KEY.pack(difficulty, len(topic_bytes), len(offsets))
+        index += topic_bytes
+        for offset in offsets:
+            index += OFFSET.pack(offset)
+        key_count += 1
+        record_count += len(offsets)
+
+    payload = bytes(body + index)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, bytes.fromhex(template_hash), key_count, record_count,
+        HEADER.size + len(body), int(time.time() * 1000), zlib.crc32(payload)
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".pool-snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # 이미 mmap으로 연 이전 파일은 교체 후에도 유효 (같은 inode 유지)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return record_count
+
+
+class PoolSnapshotter:
+    """퀴즈 풀 스냅샷 불러오기 / 주기적 저장"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._template_hash: Optional[str] = None
+        self.snapshot: Optional[PoolSnapshot] = None
+        self.loaded = 0
+        self.saved = 0
+        self.last_saved_at: Optional[float] = None
+
+    @staticmethod
+    def _pool():
+        """스냅샷 대상 풀 - 공유 풀(SQLite)은 이미 영속적이므로 제외"""
+        pool = get_quiz_pool()
+        return pool if settings.pool_snapshot_path and isinstance(pool, QuizPool) else None
+
+    def template_hash(self) -> str:
+        if self._template_hash is None:
+            self._template_hash = get_quiz_service().prompt_template_hash()
+        return self._template_hash
+
+    def load(self) -> int:
+        """스냅샷 파일을 열어 풀에 연결 - 연결한 세트 수 반환"""
+        pool = self._pool()
+        if pool is None or not os.path.exists(settings.pool_snapshot_path):
+            return 0
+        started = time.perf_counter()
+        try:
+            snapshot = PoolSnapshot(settings.pool_snapshot_path, self.template_hash())
+        except (OSError, ValueError) as e:
+            metrics.increment("pool_snapshot.rejected")
+            logger.warning("퀴즈 풀 스냅샷을 사용하지 않습니다 (%s): %s", settings.pool_snapshot_path, e)
+            return 0
+
+        self.snapshot = snapshot
+        self.loaded = sum(pool.restore(key, items) for key, items in snapshot.entries.items())
+        logger.info(
+            "퀴즈 풀 스냅샷 연결 - %s세트, %.1fms (저장 시각: %s)",
+            self.loaded, (time.perf_counter() - started) * 1000, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot.saved_at))
+        )
+        return self.loaded
+
+    async def save(self) -> int:
+        """현재 풀 내용을 저장 (내용 복사는 이벤트 루프에서, 인코딩/쓰기는 스레드에서)"""
+        pool = self._pool()
+        if pool is None:
+            return 0
+        contents = pool.contents()
+        try:
+            count = await asyncio.to_thread(write_snapshot, settings.pool_snapshot_path, self.template_hash(), contents)
+        except OSError as e:
+            metrics.increment("pool_snapshot.save_failures")
+            logger.error("퀴즈 풀 스냅샷 저장 실패: %s", e)
+            return 0
+        self.saved = count
+        self.last_saved_at = time.time()
+        logger.info("퀴즈 풀 스냅샷 저장 - %s세트", count)
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.pool_snapshot_interval)
+            await self.save()
+
+    def start(self) -> None:
+        if self._task is None and self._pool() is not None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 저장 중지 후 마지막 스냅샷 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await self.save()
+
+    def stats(self) -> dict:
+        return {
+            "path": settings.pool_snapshot_path,
+            "loaded": self.loaded,
+            "saved": self.saved,
+            "last_saved_at": self.last_saved_at
+        }
+
+
+pool_snapshotter = PoolSnapshotter()
@@ -0,0 +1,186 @@
+"""
+퀴즈 풀 예열
+
+시작할 때와 pool_warm_interval마다 예열 대상(주제 × 난이도)의 풀 보유 수를 확인하고,
+pool_warm_target에 못 미치는 만큼만 background 클래스로 생성해 풀에 넣습니다.
+예열 대상은 최근 인기 난이도/주제(popularity 상위 키)가 앞에 오고, 그 뒤에 설정된 주제 × 난이도가 옵니다.
+background 요청은 다른 클래스 대기열이 비어 있을 때 유휴 슬롯으로만 실행되므로 실시간 요청과 경쟁하지 않으며,
+예열 1회의 생성 수는 pool_warm_budget으로 제한됩니다.
+
+공유 상태(SHARED_STATE_PATH)를 쓰는 경우 풀이 워커 간에 공유되므로 리더 임대를 얻은 워커 한 곳에서만 예열합니다.
+"""
+
+from src.config import settings
+from src.models import QuizRequest, DifficultyLevel, TrafficClass
+from src.services.errors import ServiceUnavailableError
+from src.services.metrics import metrics
+from src.services.popularity import popularity
+from src.services.quiz_generator import get_quiz_service
+from src.services.quiz_pool import pool_key
+from src.services.shared_state import LeaderLease, get_shared_store
+from typing import Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PoolWarmer:
+    """주제 × 난이도 퀴즈 풀 예열 작업"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._lease: Optional[LeaderLease] = None
+        self.state = "idle"  # idle, running, standby(다른 워커가 리더), stopped
+        self.runs = 0
+        self.last_started_at: Optional[float] = None
+        self.last_finished_at: Optional[float] = None
+        self.progress: dict = {}
+
+    def trending(self) -> list[tuple[tuple[int, str], float]]:
+        """예열 대상에 추가할 인기 키와 점수"""
+        if settings.pool_warm_trending <= 0:
+            return []
+        return popularity.top(settings.pool_warm_trending, min_score=settings.pool_warm_trending_min_score)
+
+    def targets(self) -> list[tuple[int, str]]:
+        """예열 대상 (난이도, 주제) - 앞에 있을수록 예산이 부족할 때 먼저 채움"""
+        topics = settings.pool_warm_topics if settings.pool_warm_topics is not None else settings.recommended_topics
+        catalog = [
+            pool_key(difficulty, topic)
+            for topic in topics
+            for difficulty in settings.pool_warm_difficulties
+        ]
+        # 인기 키 먼저 (점수 순), 중복 제거
+        return list(dict.fromkeys([key for key, _ in self.trending()] + catalog))
+
+    async def _is_leader(self) -> bool:
+        if not settings.shared_state_path:
+            return True
+        if self._lease is None:
+            self._lease = LeaderLease(get_shared_store(settings.shared_state_path), "pool_warmer")
+        # 다음 예열 전까지 유지되도록 주기보다 길게 임대
+        return await self._lease.acquire(ttl=settings.pool_warm_interval * 2)
+
+    def _plan(self, depths: dict[tuple[int, str], int]) -> list[tuple[int, str]]:
+        """부족한 세트 목록 - 예산이 부족하면 모든 대상이 1개씩 먼저 채워지도록 차례로 배분"""
+        target = min(settings.pool_warm_target, settings.pool_max_per_key)
+        missing = {key: max(0, target - depths.get(pool_key(*key), 0)) for key in self.targets()}
+        plan = []
+        while len(plan) < settings.pool_warm_budget and any(missing.values()):
+            for key, count in missing.items():
+                if count and len(plan) < settings.pool_warm_budget:
+                    plan.append(key)
+                    missing[key] -= 1
+        return plan
+
+    async def run_once(self) -> dict:
+        """예열 1회 실행 - 진행 상황(progress) 반환"""
+        if not await self._is_leader():
+            self.state = "standby"
+            return self.progress
+
+        quiz_service = get_quiz_service()
+        plan = self._plan(await quiz_service.pool.depths())
+        self.state = "running"
+        self.runs += 1
+        self.last_started_at = time.time()
+        self.progress = {"planned": len(plan), "generated": 0, "failed": 0, "stored": 0, "stopped_reason": None}
+        logger.info("퀴즈 풀 예열 시작 - %s세트 생성 예정 (대상 %s개)", len(plan), len(self.targets()))
+
+        pending = list(plan)
+        stop = asyncio.Event()
+
+        async def worker() -> None:
+            while pending and not stop.is_set():
+                difficulty, topic = pending.pop(0)
+                request = QuizRequest(
+                    difficulty=difficulty,
+                    quiz_count=3,
+                    topic=topic,
+                    traffic_class=TrafficClass.BACKGROUND
+                )
+                try:
+                    quiz = await quiz_service.generate_quiz(request, timeout=settings.pool_warm_timeout, use_pool=False)
+                    self.progress["generated"] += 1
+                    metrics.increment("pool_warm.generated")
+                    if await quiz_service.pool.put(difficulty, topic, quiz.model_dump()):
+                        self.progress["stored"] += 1
+                except ServiceUnavailableError as e:
+                    # 서킷 open / 모든 키 할당량 초과 - 이번 예열은 중단하고 다음 주기에 다시 시도
+                    self.progress["stopped_reason"] = str(e)
+                    stop.set()
+                    return
+                except Exception as e:
+                    # 그 밖의 오류(검증 실패, 타임아웃, 업스트림/저장소 오류)는 이 세트만 건너뜀 - 다른 워커는 계속 진행
+                    self.progress["failed"] += 1
+                    metrics.increment("pool_warm.failed")
+                    logger.warning("예열 세트 생성 실패 - 난이도: %s, 주제: %s: %s", difficulty, topic, e)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, settings.pool_warm_concurrency))))
+        finally:
+            self.state = "idle"
+            self.last_finished_at = time.time()
+        logger.info(
+            "퀴즈 풀 예열 완료 - 생성 %s, 실패 %s, 보관 %s",
+            self.progress["generated"], self.progress["failed"], self.progress["stored"]
+        )
+        return self.progress
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.state = "idle"
+                logger.error("퀴즈 풀 예열 오류: %s", e)
+            await asyncio.sleep(settings.pool_warm_interval)
+
+    def start(self) -> None:
+        if settings.pool_warm_enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.state = "stopped"
+        if self._lease is not None:
+            await self._lease.release()
+
+    async def status(self) -> dict:
+        """예열 설정, 진행 상황, 대상별 풀 보유 수"""
+        depths = await get_quiz_service().pool.depths()
+        target = min(settings.pool_warm_target, settings.pool_max_per_key)
+        targets = self.targets()
+        filled = sum(1 for key in targets if depths.get(pool_key(*key), 0) >= target)
+        return {
+            "enabled": settings.pool_warm_enabled,
+            "state": self.state if settings.pool_warm_enabled else "disabled",
+            "runs": self.runs,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "interval": settings.pool_warm_interval,
+            "budget": settings.pool_warm_budget,
+            "target_per_key": target,
+            "targets": len(targets),
+            "targets_filled": filled,
+            "progress": self.progress,
+            "trending": [
+                {"difficulty": difficulty, "topic": topic, "score": round(score, 2)}
+                for (difficulty, topic), score in self.trending()
+            ],
+            "depths": {
+                f"{DifficultyLevel(difficulty).name.lower()}:{topic}": depths.get(pool_key(difficulty, topic), 0)
+                for difficulty, topic in targets
+            }
+        }
+
+
+pool_warmer = PoolWarmer()
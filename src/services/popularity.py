@@ -0,0 +1,173 @@
+"""
+난이도/주제별 요청 인기도 추정
+
+퀴즈 라우트로 들어온 요청을 count-min sketch(고정 크기 카운터 표)에 기록하고,
+추정 횟수가 큰 상위 K개 키만 힙으로 유지합니다. 주제 종류가 아무리 많아도 메모리는 고정입니다.
+
+오래된 요청의 비중은 반감기(popularity_half_life)마다 절반으로 줄어듭니다. 카운터를 매번 줄이는 대신
+새 요청의 가중치를 2^(경과 시간 / 반감기)로 키우고(forward decay), 가중치가 커지면 전체를 한 번에 나눠 정규화합니다.
+풀 예열은 상위 키를 예열 대상 앞쪽에 두어 실제로 많이 찾는 주제에 할당량을 먼저 씁니다.
+
+클라이언트를 믿을 수 있게 구분할 수 있는 요청(발급한 키, 신뢰하는 프록시 뒤의 IP)은
+같은 클라이언트의 같은 키를 반감기 동안 한 번만 셉니다. 그 밖의 요청은 요청 수(count)대로 셉니다.
+따라서 점수는 요청 수가 아니라 (감쇠를 반영한) 서로 다른 클라이언트 수에 가깝고, 한 클라이언트가
+요청을 반복해 임의의 주제를 예열 대상으로 올릴 수 없습니다. 최근 센 (키, 클라이언트) 쌍은
+popularity_max_clients개까지만 보관합니다.
+"""
+
+from src.config import settings
+from src.services.quiz_pool import pool_key
+from array import array
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import heapq
+import time
+
+# 이보다 긴 주제는 기록하지 않음 (자유 입력 문장 등)
+MAX_TOPIC_LENGTH = 30
+
+# 가중치가 이 값을 넘으면 카운터 정규화
+RENORMALIZE_AT = 2.0 ** 40
+
+
+class CountMinSketch:
+    """count-min sketch - 항목별 횟수의 상한 추정 (고정 메모리)"""
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self._rows = [array("d", bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.width for i in range(self.depth))
+
+    def add(self, item: str, weight: float = 1.0) -> float:
+        """가중치를 더하고 갱신된 추정값 반환"""
+        estimate = float("inf")
+        for row, index in zip(self._rows, self._indexes(item)):
+            row[index] += weight
+            estimate = min(estimate, row[index])
+        return estimate
+
+    def estimate(self, item: str) -> float:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(item)))
+
+    def scale(self, factor: float) -> None:
+        for row in self._rows:
+            for index in range(self.width):
+                row[index] *= factor
+
+
+class PopularityTracker:
+    """난이도/주제별 인기도 (count-min sketch + 상위 K 힙, 시간 감쇠)"""
+
+    def __init__(
+        self,
+        width: Optional[int] = None,
+        depth: Optional[int] = None,
+        top_k: Optional[int] = None,
+        half_life: Optional[float] = None,
+        max_clients: Optional[int] = None
+    ):
+        self.sketch = CountMinSketch(width or settings.popularity_width, depth or settings.popularity_depth)
+        self.top_k = top_k or settings.popularity_top_k
+        self.half_life = half_life or settings.popularity_half_life
+        self._epoch = time.monotonic()
+        self._top: dict[tuple[int, str], float] = {}  # 상위 키 → 추정값 (정규화 전 단위)
+        self._heap: list[tuple[float, tuple[int, str]]] = []  # (추정값, 키) - 갱신 전 값이 남아 있을 수 있음
+        self.max_clients = max_clients or settings.popularity_max_clients
+        self._counted: OrderedDict[tuple, float] = OrderedDict()  # (키, 클라이언트) → 센 시각 (오래된 순)
+        self.recorded = 0
+        self.duplicates = 0
+
+    def _weight(self, now: float) -> float:
+        return 2.0 ** ((now - self._epoch) / self.half_life)
+
+    def _renormalize(self, now: float) -> None:
+        factor = 1.0 / self._weight(now)
+        self.sketch.scale(factor)
+        self._top = {key: score * factor for key, score in self._top.items()}
+        self._heap = [(score, key) for key, score in self._top.items()]
+        heapq.heapify(self._heap)
+        self._epoch = now
+
+    def _pop_min(self) -> tuple[float, tuple[int, str]]:
+        """상위 K 중 최솟값 (갱신 전 값은 건너뜀)"""
+        while True:
+            score, key = self._heap[0]
+            current = self._top.get(key)
+            if current == score:
+                return score, key
+            heapq.heappop(self._heap)
+            if current is not None:
+                heapq.heappush(self._heap, (current, key))
+
+    def _offer(self, key: tuple[int, str], estimate: float) -> None:
+        if key in self._top or len(self._top) < self.top_k:
+            self._top[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+        else:
+            score, weakest = self._pop_min()
+            if estimate <= score:
+                return
+            del self._top[weakest]
+            heapq.heappop(self._heap)
+            self._top[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+
+        if len(self._heap) > 4 * self.top_k:
+            self._heap = [(score, key) for key, score in self._top.items()]
+            heapq.heapify(self._heap)
+
+    def _first_from_client(self, key: tuple[int, str], client: str, now: float) -> bool:
+        """반감기 안에 이 클라이언트의 같은 키 요청을 센 적이 없으면 True (세는 것으로 기록)"""
+        counted = self._counted
+        # 센 지 반감기가 지난 쌍은 앞에서부터 정리 (각 쌍은 한 번만 지워지므로 요청당 평균 O(1))
+        while counted:
+            oldest = next(iter(counted.values()))
+            if now - oldest < self.half_life:
+                break
+            counted.popitem(last=False)
+
+        pair = (key, client)
+        if pair in counted:
+            return False
+        counted[pair] = now
+        if len(counted) > self.max_clients:
+            counted.popitem(last=False)
+        return True
+
+    def record(self, difficulty: int, topic: Optional[str], count: int = 1, client: Optional[str] = None) -> None:
+        """요청 기록 - client가 있으면 반감기 동안 클라이언트당 1번만 셈, 없으면 count만큼 셈"""
+        key = pool_key(difficulty, topic)
+        if len(key[1]) > MAX_TOPIC_LENGTH:
+            return
+        now = time.monotonic()
+        if client is not None:
+            if not self._first_from_client(key, client, now):
+                self.duplicates += 1
+                return
+            count = 1
+        weight = self._weight(now)
+        if weight > RENORMALIZE_AT:
+            self._renormalize(now)
+            weight = 1.0
+        self.recorded += count
+        self._offer(key, self.sketch.add(f"{key[0]}:{key[1]}", weight * count))
+
+    def top(self, n: Optional[int] = None, min_score: float = 0.0) -> list[tuple[tuple[int, str], float]]:
+        """감쇠를 반영한 현재 점수 기준 상위 키 (점수 내림차순)"""
+        weight = self._weight(time.monotonic())
+        ranked = sorted(
+            ((key, score / weight) for key, score in self._top.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        return [(key, score) for key, score in ranked if score >= min_score][:n]
+
+
+popularity = PopularityTracker()
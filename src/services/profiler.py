@@ -0,0 +1,214 @@
+"""
+요청 단위 프로파일링 (cProfile)
+
+다음 경우에 /quiz 요청 1개를 처리하는 동안 cProfile을 켜서 QuizGeneratorService, 프롬프트 생성, 응답 파싱/검증까지의
+호출별 시간(벽시계 기준)을 기록합니다.
+    header   X-Profile 헤더 + 관리자 토큰
+    admin    관리자 API로 예약한 다음 N개 요청
+    slow     자동 수집 - 표본(sample_rate) 요청을 프로파일링하고 slow_threshold보다 오래 걸린 경우만 보관
+
+cProfile은 한 번에 하나만 켤 수 있으므로 동시에 1개 요청만 프로파일링합니다. 프로파일에는 같은 시간 동안
+이벤트 루프에서 실행된 다른 요청의 작업도 포함되며, LLM 응답 대기는 이벤트 루프의 select 시간으로 나타납니다.
+
+결과는 profile_dir에 (pstats 파일, 요약 JSON) 쌍으로 저장하고 profile_max_files개를 넘으면 오래된 것부터 지웁니다.
+"""
+
+from src.config import settings
+from src.services.metrics import metrics
+from typing import Optional
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 요약에 넣을 함수 수
+SUMMARY_LINES = 40
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$")
+
+
+def _summary(stats: pstats.Stats, sort: str, lines: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(sort).print_stats(lines)
+    return stream.getvalue()
+
+
+class ProfileStore:
+    """프로파일 파일 보관 (디렉터리 하나, 개수 제한 링)"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+
+    def _path(self, profile_id: str, suffix: str) -> str:
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            raise ValueError(f"잘못된 프로파일 ID입니다: {profile_id}")
+        return os.path.join(self.directory, profile_id + suffix)
+
+    def save(self, profile_id: str, profile: cProfile.Profile, meta: dict) -> dict:
+        """pstats 파일과 요약 JSON 저장 후 오래된 프로파일 정리 (스레드에서 실행)"""
+        os.makedirs(self.directory, exist_ok=True)
+        stats = pstats.Stats(profile)
+        stats.dump_stats(self._path(profile_id, ".prof"))
+        record = {
+            **meta,
+            "functions": len(stats.stats),
+            "cumulative": _summary(stats, "cumulative", SUMMARY_LINES),
+            "tottime": _summary(stats, "tottime", SUMMARY_LINES // 2)
+        }
+        with open(self._path(profile_id, ".json"), "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        self._prune()
+        return record
+
+    def _ids(self) -> list[str]:
+        """저장된 프로파일 ID (오래된 순 - ID가 저장 시각으로 시작)"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name[:-len(".json")] for name in os.listdir(self.directory)
+            if name.endswith(".json") and PROFILE_ID_PATTERN.match(name[:-len(".json")])
+        )
+
+    def _prune(self) -> None:
+        ids = self._ids()
+        for profile_id in ids[:max(0, len(ids) - self.max_files)]:
+            for suffix in (".json", ".prof"):
+                try:
+                    os.remove(self._path(profile_id, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> list[dict]:
+        """저장된 프로파일 메타데이터 (최신 순, 요약 제외)"""
+        profiles = []
+        for profile_id in reversed(self._ids()):
+            record = self.get(profile_id)
+            if record is not None:
+                profiles.append({key: value for key, value in record.items() if key not in ("cumulative", "tottime")})
+        return profiles
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        try:
+            with open(self._path(profile_id, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def pstats_path(self, profile_id: str) -> Optional[str]:
+        path = self._path(profile_id, ".prof")
+        return path if os.path.exists(path) else None
+
+
+class RequestProfiler:
+    """프로파일링 대상 요청 선택과 cProfile 실행 (자동 수집 설정은 관리자 API로 변경 가능)"""
+
+    def __init__(self):
+        self.store = ProfileStore(settings.profile_dir, settings.profile_max_files)
+        self.auto_enabled = settings.profile_slow_threshold is not None
+        self.slow_threshold = settings.profile_slow_threshold or 5.0
+        self.sample_rate = settings.profile_sample_rate
+        self.capture_next = 0  # 관리자가 예약한 남은 요청 수
+        self._active = False
+        self._saving: set[asyncio.Task] = set()
+
+    def configure(
+        self,
+        auto_enabled: Optional[bool] = None,
+        slow_threshold: Optional[float] = None,
+        sample_rate: Optional[float] = None,
+        capture_next: Optional[int] = None
+    ) -> dict:
+        if auto_enabled is not None:
+            self.auto_enabled = auto_enabled
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if capture_next is not None:
+            self.capture_next = capture_next
+        logger.info(
+            "프로파일링 설정 변경 - 자동 수집: %s (%.1f초 이상, 표본 %.2f), 예약: %s",
+            self.auto_enabled, self.slow_threshold, self.sample_rate, self.capture_next
+        )
+        return self.status()
+
+    def trigger(self, header_requested: bool) -> Optional[str]:
+        """이번 요청을 프로파일링할 이유 (header, admin, slow) - 다른 요청을 프로파일링 중이면 None"""
+        if self._active:
+            return None
+        if header_requested:
+            return "header"
+        if self.capture_next > 0:
+            self.capture_next -= 1
+            return "admin"
+        if self.auto_enabled and random.random() < self.sample_rate:
+            return "slow"
+        return None
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """cProfile 시작 - 다른 프로파일러(coverage 등)가 켜져 있으면 None"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            logger.warning("프로파일링을 시작할 수 없습니다: %s", e)
+            return None
+        self._active = True
+        return profile
+
+    def finish(self, profile_id: str, profile: cProfile.Profile, trigger: str, meta: dict) -> bool:
+        """cProfile 중지 - 보관 대상이면 백그라운드에서 저장하고 True 반환"""
+        profile.disable()
+        self._active = False
+        if trigger == "slow" and meta["elapsed_ms"] < self.slow_threshold * 1000:
+            return False
+
+        metrics.increment(f"profiling.captured.{trigger}")
+        meta = {"id": profile_id, "trigger": trigger, "created_at": time.time(), **meta}
+        task = asyncio.create_task(asyncio.to_thread(self.store.save, profile_id, profile, meta))
+        self._saving.add(task)
+        task.add_done_callback(self._saved)
+        return True
+
+    def _saved(self, task: asyncio.Task) -> None:
+        self._saving.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            metrics.increment("profiling.save_failures")
+            logger.error("프로파일 저장 실패: %s", task.exception())
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    def status(self) -> dict:
+        return {
+            "auto_enabled": self.auto_enabled,
+            "slow_threshold": self.slow_threshold,
+            "sample_rate": self.sample_rate,
+            "capture_next": self.capture_next,
+            "active": self._active,
+            "directory": self.store.directory,
+            "max_files": self.store.max_files
+        }
+
+
+_profiler: Optional[RequestProfiler] = None
+
+
+def get_profiler() -> RequestProfiler:
+    """요청 프로파일러 (첫 호출 시 설정으로 생성)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = RequestProfiler()
+    return _profiler
@@ -1,38 +1,88 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.schema import HumanMessage, SystemMessage
-from langchain.prompts import ChatPromptTemplate
 from src.config import settings
 from src.models import (
     QuizRequest, 
     EasyQuizResponse, 
     MediumQuizResponse, 
     HardQuizResponse,
-    QuizResponse,
-    DifficultyLevel
+    DifficultyLevel,
+    TrafficClass,
+    QuizBundleRequest
 )
+from src.services.quiz_validator import (
+    validate_item,
+    validate_quiz,
+    CHOICE_COUNTS,
+    CHOICE_MAX_LENGTH,
+    EXPLANATION_MAX_LENGTH
+)
+from src.services.shared_state import get_upstream_limiter
+from src.services.quiz_pool import get_quiz_pool
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.scheduler import WeightedFairScheduler
+from src.services.errors import ServiceUnavailableError
+from src.services.metrics import metrics
+from src.services.cassette import get_cassette
+from src.services.model_router import ModelRoute, default_route, resolve_route
+from src.services.key_pool import ApiKeyPool, UpstreamKey, is_throttle_error
+from src.services.output_format import (
+    JSON,
+    COMPACT,
+    STRUCTURED,
+    OUTPUT_FORMATS,
+    output_format_for,
+    compact_format_section,
+    decode_compact,
+    structured_generation_config
+)
+from contextlib import AsyncExitStack, asynccontextmanager
+import hashlib
 import json
 import logging
 import asyncio
+import threading
+import time
 from typing import Optional, Union
-from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# 최근 생성 시간 지수 이동 평균 가중치
+LATENCY_EWMA_ALPHA = 0.2
+
 
 class QuizGeneratorService:
     """LLM을 사용한 퀴즈 생성 서비스 (비동기 처리)"""
     
     def __init__(self):
         """서비스 초기화"""
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.model_name,
-            google_api_key=settings.google_api_key,
-            temperature=settings.temperature,
-            max_tokens=settings.max_tokens
+        # Gemini 클라이언트는 첫 사용(또는 warmup) 시 생성 - langchain import 비용을 시작 경로에서 제외
+        self._llm = None
+        self._llm_lock = threading.Lock()
+        
+        # API 키(프로젝트)별 클라이언트/분당 한도/상태 - 호출마다 최소 부하 키 선택
+        self.keys = ApiKeyPool(settings.api_keys)
+        
+        # 업스트림 동시성 제한과 퀴즈 풀 (공유 상태 설정 시 워커 간 공유)
+        self._limiter = get_upstream_limiter()
+        self.pool = get_quiz_pool()
+        
+        # 트래픽 클래스(interactive/batch/background)별 가중치 공정 큐 - 업스트림 제한 앞단
+        # 워커가 여러 개면 각 워커는 전체 동시 호출 수 중 자기 몫만큼만 내보냄
+        # (한 워커의 batch가 공유 슬롯을 다 차지해 다른 워커의 interactive 요청이 밀리지 않도록)
+        self.scheduler = WeightedFairScheduler(
+            capacity=settings.worker_capacity,
+            weights=settings.traffic_class_weights,
+            high_watermark=settings.queue_high_watermark,
+            low_watermark=settings.queue_low_watermark
         )
         
-        # 동시성 제한을 위한 세마포어 (설정에서 가져옴)
-        self._semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        # 업스트림 장애 시 빠른 실패를 위한 서킷 브레이커
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_timeout
+        )
+        self.last_success_at: Optional[float] = None  # 마지막 LLM 호출 성공 시각 (epoch)
+        self._latency_ewma: Optional[float] = None  # 최근 생성 소요 시간 평균 (초)
+        self._detached_tasks: set[asyncio.Task] = set()  # 요청자가 떠난 뒤 풀로 보낼 생성 작업
         
         # 난이도별 설명
         self.difficulty_descriptions = {
@@ -41,7 +91,72 @@ class QuizGeneratorService:
             DifficultyLevel.HARD: "어려운 수준으로, 10세 어린이가 도전할 수 있는"
         }
     
-    def _create_easy_prompt(self, request: QuizRequest) -> str:
+    @staticmethod
+    def _create_client(route: ModelRoute, api_key: str):
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        
+        return ChatGoogleGenerativeAI(
+            model=route.model,
+            google_api_key=api_key,
+            temperature=route.temperature,
+            max_tokens=route.max_tokens
+        )
+    
+    @property
+    def llm(self):
+        """기본 경로 Gemini LLM 클라이언트 (지연 생성)"""
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    self._llm = self._create_client(default_route(), settings.google_api_key)
+        return self._llm
+    
+    @llm.setter
+    def llm(self, value):
+        self._llm = value
+    
+    def client_for(self, route: ModelRoute, key: UpstreamKey):
+        """API 키/경로별 LLM 클라이언트 (조합마다 한 번만 생성)"""
+        if route.is_default and key.index == 0:
+            return self.llm
+        client = key.clients.get(route)
+        if client is None:
+            with self._llm_lock:
+                client = key.clients.get(route)
+                if client is None:
+                    client = key.clients[route] = self._create_client(route, key.api_key)
+        return client
+    
+    @property
+    def llm_ready(self) -> bool:
+        """LLM 클라이언트가 이미 생성되었는지 여부"""
+        return self._llm is not None
+    
+    def warmup(self) -> None:
+        """LLM 클라이언트와 메시지 모듈을 미리 로드 (블로킹 - 스레드에서 호출)"""
+        import langchain_core.messages  # noqa: F401
+        
+        self.llm
+    
+    def prompt_template_hash(self) -> str:
+        """세트 생성 프롬프트 템플릿 해시 - 프롬프트가 바뀌면 이전에 만든 세트(풀 스냅샷 등)를 버리는 기준
+
+        모든 응답 형식의 프롬프트(structured는 응답 스키마 포함)와 난이도별로 설정된 응답 형식을 함께 해시하므로
+        형식 템플릿이나 QUIZ_OUTPUT_FORMATS가 바뀌어도 값이 달라집니다.
+        """
+        digest = hashlib.sha256()
+        builders = (self._create_easy_prompt, self._create_medium_prompt, self._create_hard_prompt)
+        for difficulty, build in zip(DifficultyLevel, builders):
+            digest.update(f"{difficulty.name}:{output_format_for(difficulty)}".encode("utf-8"))
+            for output_format in OUTPUT_FORMATS:
+                for topic in (None, "{topic}"):
+                    request = QuizRequest(difficulty=difficulty, quiz_count=3, topic=topic)
+                    digest.update(build(request, output_format).encode("utf-8"))
+            schema = json.dumps(structured_generation_config(difficulty), ensure_ascii=False, sort_keys=True, default=str)
+            digest.update(schema.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _create_easy_prompt(self, request: QuizRequest, output_format: str = JSON) -> str:
         """쉬운 난이도(OX 퀴즈) 프롬프트 생성"""
         topic_instruction = ""
         if request.topic:
@@ -58,6 +173,25 @@ class QuizGeneratorService:
 - 현명한 소비
 - 간단한 경제 활동 (사고팔기 등)"""
         
+        if output_format != COMPACT:
+            response_format = """**응답 형식:**
+반드시 아래 JSON 형식으로만 응답해주세요. 다른 설명이나 텍스트는 포함하지 마세요.
+
+{
+"difficulty": 0,
+"Q1": "첫 번째 퀴즈 문제",
+"A1": "O",
+"D1": "첫 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)",
+"Q2": "두 번째 퀴즈 문제", 
+"A2": "X",
+"D2": "두 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)",
+"Q3": "세 번째 퀴즈 문제",
+"A3": "O",
+"D3": "세 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)"
+}"""
+        else:
+            response_format = compact_format_section(DifficultyLevel.EASY)
+        
         prompt = f"""
 당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
 
@@ -71,21 +205,7 @@ class QuizGeneratorService:
 
 {topic_instruction}
 
-**응답 형식:**
-반드시 아래 JSON 형식으로만 응답해주세요. 다른 설명이나 텍스트는 포함하지 마세요.
-
-{{
-"difficulty": 0,
-"Q1": "첫 번째 퀴즈 문제",
-"A1": "O",
-"D1": "첫 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)",
-"Q2": "두 번째 퀴즈 문제", 
-"A2": "X",
-"D2": "두 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)",
-"Q3": "세 번째 퀴즈 문제",
-"A3": "O",
-"D3": "세 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)"
-}}
+{response_format}
 
 **중요 주의사항:**
 - 문제는 어린이가 이해하기 쉬운 단어로 작성
@@ -94,11 +214,11 @@ class QuizGeneratorService:
 - 애매모호한 표현이나 해석이 여러 가지 가능한 문제는 절대 만들지 마세요
 - 해설은 어린이가 쉽게 이해할 수 있도록 간단명료하게 작성 (공백 포함 150자 이내)
 - 지정된 주제가 있다면 반드시 그 주제에만 집중하세요
-- JSON 형식을 정확히 지켜주세요
+- 응답 형식을 정확히 지켜주세요
 """
         return prompt
     
-    def _create_medium_prompt(self, request: QuizRequest) -> str:
+    def _create_medium_prompt(self, request: QuizRequest, output_format: str = JSON) -> str:
         """보통 난이도(3지선다) 프롬프트 생성"""
         topic_instruction = ""
         if request.topic:
@@ -115,23 +235,11 @@ class QuizGeneratorService:
 - 소비의 우선순위
 - 경제 활동의 기본 원리"""
         
-        prompt = f"""
-당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
-
-다음 조건에 맞는 3지선다 퀴즈 3개를 생성해주세요:
-
-**조건:**
-- 난이도: 보통 수준으로, 8-9세 어린이가 이해할 수 있는 경제 개념
-- 대상: 8-9세 어린이
-- 형식: 3지선다 (선택지 3개 중 정답 1개)
-- 개수: 정확히 3개
-
-{topic_instruction}
-
-**응답 형식:**
+        if output_format != COMPACT:
+            response_format = """**응답 형식:**
 반드시 아래 JSON 형식으로만 응답해주세요. 다른 설명이나 텍스트는 포함하지 마세요.
 
-{{
+{
 "difficulty": 1,
 "Q1": "첫 번째 퀴즈 문제",
 "Q1_choices": ["선택지 1", "선택지 2", "선택지 3"],
@@ -145,7 +253,24 @@ class QuizGeneratorService:
 "Q3_choices": ["선택지 1", "선택지 2", "선택지 3"],
 "A3": 3,
 "D3": "세 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)"
-}}
+}"""
+        else:
+            response_format = compact_format_section(DifficultyLevel.MEDIUM)
+        
+        prompt = f"""
+당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
+
+다음 조건에 맞는 3지선다 퀴즈 3개를 생성해주세요:
+
+**조건:**
+- 난이도: 보통 수준으로, 8-9세 어린이가 이해할 수 있는 경제 개념
+- 대상: 8-9세 어린이
+- 형식: 3지선다 (선택지 3개 중 정답 1개)
+- 개수: 정확히 3개
+
+{topic_instruction}
+
+{response_format}
 
 **중요 주의사항:**
 - 문제는 8-9세 어린이가 이해할 수 있는 수준으로 작성
@@ -156,11 +281,11 @@ class QuizGeneratorService:
 - 해설은 어린이가 쉽게 이해할 수 있도록 간단명료하게 작성 (공백 포함 150자 이내)
 - 지정된 주제가 있다면 반드시 그 주제에만 집중하세요
 - 선택지 간 혼동을 최소화하고 정답이 명확하게 구분되도록 하세요
-- JSON 형식을 정확히 지켜주세요
+- 응답 형식을 정확히 지켜주세요
 """
         return prompt
     
-    def _create_hard_prompt(self, request: QuizRequest) -> str:
+    def _create_hard_prompt(self, request: QuizRequest, output_format: str = JSON) -> str:
         """어려운 난이도(4지선다) 프롬프트 생성"""
         topic_instruction = ""
         if request.topic:
@@ -178,23 +303,11 @@ class QuizGeneratorService:
 - 경제 활동의 원인과 결과
 - 돈의 가치와 물가 개념"""
         
-        prompt = f"""
-당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
-
-다음 조건에 맞는 4지선다 퀴즈 3개를 생성해주세요:
-
-**조건:**
-- 난이도: 어려운 수준으로, 10세 어린이가 도전할 수 있는 경제 개념
-- 대상: 10세 어린이
-- 형식: 4지선다 (선택지 4개 중 정답 1개)
-- 개수: 정확히 3개
-
-{topic_instruction}
-
-**응답 형식:**
+        if output_format != COMPACT:
+            response_format = """**응답 형식:**
 반드시 아래 JSON 형식으로만 응답해주세요. 다른 설명이나 텍스트는 포함하지 마세요.
 
-{{
+{
 "difficulty": 2,
 "Q1": "첫 번째 퀴즈 문제",
 "Q1_choices": ["선택지 1", "선택지 2", "선택지 3", "선택지 4"],
@@ -208,7 +321,24 @@ class QuizGeneratorService:
 "Q3_choices": ["선택지 1", "선택지 2", "선택지 3", "선택지 4"],
 "A3": 3,
 "D3": "세 번째 퀴즈 해설 (왜 이 답이 맞는지 어린이가 이해하기 쉽게 설명)"
-}}
+}"""
+        else:
+            response_format = compact_format_section(DifficultyLevel.HARD)
+        
+        prompt = f"""
+당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
+
+다음 조건에 맞는 4지선다 퀴즈 3개를 생성해주세요:
+
+**조건:**
+- 난이도: 어려운 수준으로, 10세 어린이가 도전할 수 있는 경제 개념
+- 대상: 10세 어린이
+- 형식: 4지선다 (선택지 4개 중 정답 1개)
+- 개수: 정확히 3개
+
+{topic_instruction}
+
+{response_format}
 
 **중요 주의사항:**
 - 문제는 10세 어린이가 충분히 고민할 수 있는 수준으로 작성
@@ -220,67 +350,459 @@ class QuizGeneratorService:
 - 지정된 주제가 있다면 반드시 그 주제에만 집중하세요
 - 정답이 논란의 여지없이 명확해야 하며, 오답이 확실히 틀린 내용이어야 합니다
 - 선택지 간 혼동을 최소화하고 구분을 명확히 하세요
-- JSON 형식을 정확히 지켜주세요
+- 응답 형식을 정확히 지켜주세요
 """
         return prompt
     
     async def generate_quiz(
         self, 
         request: QuizRequest, 
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        use_pool: bool = True
     ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
-        """비동기 퀴즈 생성 (타임아웃 및 동시성 제한 포함)"""
+        """비동기 퀴즈 생성 (타임아웃 및 동시성 제한 포함)
+        
+        timeout은 대기열에서 기다리는 시간까지 포함한 요청 전체의 마감 시간입니다.
+        use_pool=False면 풀을 거치지 않고 항상 새로 생성합니다 (풀 예열용).
+        """
         if timeout is None:
             timeout = settings.default_timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        # 풀에 미리 생성된 세트가 있으면 LLM 호출 없이 반환
+        pooled = await self.pool.take(request.difficulty, request.topic) if use_pool else None
+        if pooled is not None:
+            logger.info("퀴즈 풀에서 제공 - 난이도: %s, 주제: %s", request.difficulty, request.topic)
+            return self._build_response(pooled, request.difficulty)
+        
+        # 대기열이 watermark를 넘은 과부하 상태면 새 생성 요청은 받지 않음 (가능하면 풀 세트로 대체)
+        if self.scheduler.overloaded():
+            return await self._shed(request)
+        
+        # 마감 안에 끝날 가능성이 없으면 대기열에 넣지 않고 바로 거절
+        self._admit(request, deadline - loop.time())
+        
+        # 우선순위 클래스별 공정 큐를 거친 뒤 (워커 간 공유될 수 있는) 업스트림 슬롯 획득
+        async with AsyncExitStack() as stack:
+            try:
+                await asyncio.wait_for(
+                    stack.enter_async_context(self._upstream_slot(request)),
+                    timeout=max(0.0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                metrics.increment(f"admission.queue_timeout.{request.traffic_class.value}")
+                logger.error("퀴즈 생성 타임아웃: 대기열에서 %s초 초과", timeout)
+                raise ValueError(f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
             
-        async with self._semaphore:  # 동시성 제한
+            started = loop.time()
             try:
-                return await asyncio.wait_for(
+                quiz = await asyncio.wait_for(
                     self._generate_quiz_internal(request),
-                    timeout=timeout
+                    timeout=max(0.0, deadline - started)
                 )
             except asyncio.TimeoutError:
-                logger.error(f"퀴즈 생성 타임아웃: {timeout}초 초과")
+                # 응답 지연도 업스트림 이상 신호로 취급
+                self.breaker.record_failure()
+                logger.error("퀴즈 생성 타임아웃: %s초 초과", timeout)
                 raise ValueError(f"퀴즈 생성에 너무 많은 시간이 걸렸습니다 ({timeout}초 초과)")
             except Exception as e:
-                logger.error(f"퀴즈 생성 실패: {str(e)}")
+                logger.error("퀴즈 생성 실패: %s", e)
                 raise
+            
+            self._record_latency(loop.time() - started)
+            return quiz
+    
+    async def generate_bundle(self, request: QuizBundleRequest) -> dict:
+        """여러 난이도/주제의 퀴즈 세트 묶음 - 풀에 있는 세트를 먼저 채우고 부족한 세트만 병렬 생성
+        
+        일부 세트 생성에 실패해도 받은 세트는 반환하고 실패 내역은 failed에 담습니다.
+        한 세트도 받지 못하면 첫 번째 오류를 그대로 발생시킵니다.
+        """
+        sets = []
+        shortfall: list[QuizRequest] = []
+        for item in request.items:
+            for _ in range(item.count):
+                pooled = await self.pool.take(item.difficulty, item.topic)
+                if pooled is not None:
+                    sets.append({"difficulty": int(item.difficulty), "topic": item.topic, "source": "pool", "quiz": pooled})
+                else:
+                    shortfall.append(QuizRequest(
+                        difficulty=item.difficulty,
+                        quiz_count=3,
+                        topic=item.topic,
+                        traffic_class=request.traffic_class
+                    ))
+        
+        requested = len(sets) + len(shortfall)
+        metrics.increment("bundle.requests")
+        metrics.increment("bundle.from_pool", len(sets))
+        logger.info("퀴즈 묶음 요청 - 요청: %s세트, 풀: %s세트, 생성: %s세트", requested, len(sets), len(shortfall))
+        
+        results = await asyncio.gather(
+            *(self.generate_quiz(quiz_request, timeout=request.timeout) for quiz_request in shortfall),
+            return_exceptions=True
+        )
+        failed = []
+        errors = []
+        for quiz_request, result in zip(shortfall, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                errors.append(result)
+                failed.append({"difficulty": int(quiz_request.difficulty), "topic": quiz_request.topic, "error": str(result)})
+            else:
+                sets.append({
+                    "difficulty": int(quiz_request.difficulty),
+                    "topic": quiz_request.topic,
+                    "source": "generated",
+                    "quiz": result.model_dump()
+                })
+        
+        metrics.increment("bundle.generated", len(shortfall) - len(failed))
+        metrics.increment("bundle.failed", len(failed))
+        if not sets and errors:
+            raise errors[0]
+        
+        return {"requested": requested, "delivered": len(sets), "sets": sets, "failed": failed}
+    
+    def finish_into_pool(self, task: asyncio.Task, request: QuizRequest) -> None:
+        """요청자가 떠난 생성 작업을 끝까지 진행시키고 결과를 퀴즈 풀에 보관"""
+        self._detached_tasks.add(task)
+        
+        def store(done: asyncio.Task) -> None:
+            self._detached_tasks.discard(done)
+            if done.cancelled() or done.exception() is not None:
+                return
+            put = asyncio.ensure_future(
+                self.pool.put(request.difficulty, request.topic, done.result().model_dump())
+            )
+            self._detached_tasks.add(put)
+            put.add_done_callback(self._detached_tasks.discard)
+        
+        task.add_done_callback(store)
+    
+    @asynccontextmanager
+    async def _upstream_slot(self, request: QuizRequest):
+        """공정 큐 슬롯 + 업스트림 동시 호출 슬롯"""
+        async with self.scheduler.slot(request.traffic_class), self._limiter.slot():
+            yield
+    
+    def _record_latency(self, seconds: float) -> None:
+        """생성 소요 시간 기록 (입장 제어의 대기 시간 추정에 사용)"""
+        metrics.observe("generation.latency_ms", seconds * 1000)
+        if self._latency_ewma is None:
+            self._latency_ewma = seconds
+        else:
+            self._latency_ewma += LATENCY_EWMA_ALPHA * (seconds - self._latency_ewma)
+    
+    def estimate_wait(self, request: QuizRequest) -> Optional[float]:
+        """대기열 길이와 최근 생성 시간으로 예상 대기 시간(초) 추정 - 데이터가 없으면 None"""
+        if self._latency_ewma is None:
+            return None
+        ahead = self.scheduler.queued_ahead(request.traffic_class)
+        if ahead == 0 and self.scheduler.active < self.scheduler.capacity:
+            return 0.0
+        return (ahead + 1) / self.scheduler.capacity * self._latency_ewma
+    
+    def _admit(self, request: QuizRequest, remaining: float) -> None:
+        """입장 제어 - 예상 대기 + 생성 시간이 남은 시간을 넘으면 ServiceUnavailableError"""
+        if not settings.admission_control:
+            return
+        expected_wait = self.estimate_wait(request)
+        if expected_wait is None:
+            return
+        if expected_wait + self._latency_ewma > remaining:
+            metrics.increment(f"admission.rejected.{request.traffic_class.value}")
+            logger.warning(
+                "입장 거절 - 예상 대기 %.1f초 + 생성 %.1f초 > 남은 시간 %.1f초", expected_wait, self._latency_ewma, remaining
+            )
+            raise ServiceUnavailableError(
+                "지금은 요청이 많아 제한 시간 안에 퀴즈를 만들 수 없습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=max(1.0, expected_wait)
+            )
+    
+    async def _shed(self, request: QuizRequest) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
+        """과부하 시 요청 처리 - 주제 지정 요청은 같은 난이도의 주제 없는 풀 세트로 대체, 없으면 ServiceUnavailableError"""
+        if settings.shed_fallback_to_pool and request.topic and request.traffic_class != TrafficClass.BACKGROUND:
+            fallback = await self.pool.take(request.difficulty, None)
+            if fallback is not None:
+                metrics.increment(f"shed.downgraded.{request.traffic_class.value}")
+                logger.info("과부하 - 주제 없는 풀 세트로 대체 (난이도: %s, 요청 주제: %s)", request.difficulty, request.topic)
+                return self._build_response(fallback, request.difficulty)
+        
+        metrics.increment(f"shed.rejected.{request.traffic_class.value}")
+        depth = self.scheduler.waiting()
+        # 대기열이 low watermark까지 줄어드는 데 걸릴 시간을 재시도 간격으로 안내
+        drain = (depth - self.scheduler.low_watermark) / self.scheduler.capacity * (self._latency_ewma or 1.0)
+        logger.warning("과부하로 요청 거절 - 대기열 %s (high %s)", depth, self.scheduler.high_watermark)
+        raise ServiceUnavailableError(
+            "지금은 요청이 너무 많아 퀴즈를 만들 수 없습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=max(1.0, drain)
+        )
+    
+    def _create_item_prompt(
+        self,
+        request: QuizRequest,
+        quiz_data: dict,
+        index: int,
+        issues: list[str]
+    ) -> str:
+        """검증에 실패한 단일 문항 재생성 프롬프트 생성"""
+        difficulty = request.difficulty
+        topic_line = f"- 주제: 반드시 '{request.topic}' 주제와 직접 관련된 내용" if request.topic else ""
+        
+        # 같은 세트의 다른 문제와 겹치지 않도록 안내
+        other_questions = "\n".join(
+            f"- {quiz_data.get(f'Q{i}')}"
+            for i in range(1, 4)
+            if i != index and isinstance(quiz_data.get(f"Q{i}"), str)
+        )
+        issue_lines = "\n".join(f"- {issue}" for issue in issues)
+        
+        if difficulty == DifficultyLevel.EASY:
+            quiz_format = "OX 퀴즈 (정답은 반드시 'O' 또는 'X')"
+            response_format = '{"Q": "퀴즈 문제", "A": "O", "D": "해설"}'
+        else:
+            choice_count = CHOICE_COUNTS[difficulty]
+            sample_choices = ", ".join(f'"선택지 {n}"' for n in range(1, choice_count + 1))
+            quiz_format = (
+                f"{choice_count}지선다 (선택지 {choice_count}개, 각 선택지는 공백 포함 "
+                f"{CHOICE_MAX_LENGTH}자 이내, 정답은 1~{choice_count} 중 하나)"
+            )
+            response_format = f'{{"Q": "퀴즈 문제", "choices": [{sample_choices}], "A": 1, "D": "해설"}}'
+        
+        return f"""
+당신은 10세 이하 어린이를 위한 경제 교육 퀴즈를 만드는 전문가입니다.
+
+아래 조건에 맞는 퀴즈 문제 1개만 새로 만들어주세요.
+
+**조건:**
+- 난이도: {self.difficulty_descriptions[difficulty]} 경제 개념
+- 형식: {quiz_format}
+- 해설은 공백 포함 {EXPLANATION_MAX_LENGTH}자 이내
+{topic_line}
+
+**이전 문제에서 고쳐야 할 점:**
+{issue_lines}
+
+**이미 출제된 문제 (중복 금지):**
+{other_questions}
+
+**응답 형식:**
+반드시 아래 JSON 형식으로만 응답해주세요.
+{response_format}
+"""
+    
+    async def _invoke_llm(
+        self,
+        prompt: str,
+        difficulty: DifficultyLevel,
+        kind: str = "set",
+        output_format: str = JSON,
+        route: Optional[ModelRoute] = None
+    ) -> str:
+        """LLM 비동기 호출 - 응답 텍스트 반환
+        
+        kind는 호출 종류("set": 퀴즈 세트, "item": 단일 문항 재생성)이며 cassette 기록/재생과
+        응답 형식별 출력 토큰/지연 시간 메트릭에 사용됩니다. route가 없으면 기본 모델을 사용합니다.
+        """
+        route = route or default_route()
+        self.breaker.before_call()
+        cassette = get_cassette()
+        started = time.monotonic()
+        try:
+            if cassette.replaying:
+                response_text, usage = await cassette.replay(prompt, difficulty, kind, output_format)
+            else:
+                response_text, usage = await self._call_upstream(prompt, difficulty, output_format, route)
+        except (asyncio.CancelledError, ServiceUnavailableError):
+            # 취소, 또는 모든 키가 할당량 초과/제외 상태 - 업스트림 장애로 세지 않음
+            self.breaker.record_cancelled()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        
+        self.breaker.record_success()
+        self.last_success_at = time.time()
+        latency_ms = (time.monotonic() - started) * 1000
+        metrics.observe(f"llm.latency_ms.{kind}.{output_format}", latency_ms)
+        metrics.observe(f"llm.route_latency_ms.{route.name}", latency_ms)
+        if usage and usage.get("output_tokens") is not None:
+            metrics.observe(f"llm.output_tokens.{kind}.{output_format}", usage["output_tokens"])
+        if cassette.recording:
+            await cassette.record(
+                prompt, response_text, difficulty, kind,
+                latency_ms=latency_ms,
+                usage=dict(usage) if usage else None,
+                model=route.model,
+                output_format=output_format
+            )
+        return response_text
+    
+    async def _call_upstream(
+        self,
+        prompt: str,
+        difficulty: DifficultyLevel,
+        output_format: str,
+        route: ModelRoute
+    ) -> tuple[str, Optional[dict]]:
+        """API 키를 골라 Gemini 호출 - 할당량 초과 키는 제외하고 다른 키로 다시 시도"""
+        from langchain_core.messages import HumanMessage
+        
+        # structured 형식은 응답 스키마를 함께 전달해 파싱 가능한 JSON만 받음
+        extra = {}
+        if output_format == STRUCTURED:
+            extra["generation_config"] = structured_generation_config(difficulty)
+        
+        tried: set[int] = set()
+        while True:
+            key = await self.keys.acquire(exclude=tried)
+            try:
+                response = await self.client_for(route, key).ainvoke([HumanMessage(content=prompt)], **extra)
+            except asyncio.CancelledError:
+                key.breaker.record_cancelled()
+                raise
+            except Exception as e:
+                if not is_throttle_error(e):
+                    key.breaker.record_failure()
+                    raise
+                key.breaker.record_cancelled()
+                key.throttle()
+                tried.add(key.index)
+                logger.warning("API 키 %s 할당량 초과 - %s초 동안 제외", key.label, settings.key_throttle_cooldown)
+                continue
+            finally:
+                self.keys.release(key)
+            
+            key.breaker.record_success()
+            return response.content, getattr(response, "usage_metadata", None)
     
     async def _generate_quiz_internal(
         self, 
         request: QuizRequest
     ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
-        """내부 퀴즈 생성 로직"""
+        """내부 퀴즈 생성 로직 - 라우팅된 모델의 결과가 파싱/검증에 실패하면 기본 모델로 승격"""
+        route = resolve_route(request.difficulty, request.topic)
+        metrics.increment(f"llm.route_requests.{route.name}")
+        if route.is_default or not settings.model_escalation:
+            return await self._generate_with_route(request, route, settings.max_item_regenerations)
+        
+        try:
+            # 승격할 수 있으면 가벼운 모델로 문항을 고치지 않고 바로 기본 모델로 다시 생성
+            return await self._generate_with_route(request, route, max_regenerations=0)
+        except ValueError as e:
+            metrics.increment(f"llm.route_escalations.{route.name}")
+            logger.warning("모델 승격 - 경로: %s (%s) → %s, 사유: %s", route.name, route.model, settings.model_name, e)
+            return await self._generate_with_route(request, default_route(), settings.max_item_regenerations)
+    
+    async def _generate_with_route(
+        self,
+        request: QuizRequest,
+        route: ModelRoute,
+        max_regenerations: int
+    ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
+        """지정한 경로의 모델로 퀴즈 세트 생성"""
         try:
-            # 난이도별 프롬프트 선택
+            # 난이도별 프롬프트 선택 (응답 형식은 난이도별 설정)
+            output_format = output_format_for(request.difficulty)
             if request.difficulty == DifficultyLevel.EASY:
-                prompt = self._create_easy_prompt(request)
+                prompt = self._create_easy_prompt(request, output_format)
             elif request.difficulty == DifficultyLevel.MEDIUM:
-                prompt = self._create_medium_prompt(request)
+                prompt = self._create_medium_prompt(request, output_format)
             elif request.difficulty == DifficultyLevel.HARD:
-                prompt = self._create_hard_prompt(request)
+                prompt = self._create_hard_prompt(request, output_format)
             else:
                 raise ValueError(f"지원하지 않는 난이도입니다: {request.difficulty}")
             
             # LLM 비동기 호출
-            messages = [HumanMessage(content=prompt)]
-            response = await self.llm.ainvoke(messages)
+            response_text = await self._invoke_llm(
+                prompt, request.difficulty, output_format=output_format, route=route
+            )
             
-            # 응답 처리
-            return self._parse_response(response, request.difficulty)
+            # 응답 처리 (검증 실패 문항은 개별 재생성)
+            quiz_data = self._parse_quiz(response_text, request.difficulty, output_format)
+            quiz_data = await self._repair_invalid_items(request, quiz_data, output_format, max_regenerations)
+            return self._build_response(quiz_data, request.difficulty)
             
         except Exception as e:
-            logger.error(f"퀴즈 생성 실패: {str(e)}")
+            logger.error("퀴즈 생성 실패: %s", e)
             raise
     
-    def _parse_response(
-        self, 
-        response, 
-        difficulty: DifficultyLevel
-    ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
-        """LLM 응답 파싱"""
+    async def _repair_invalid_items(
+        self,
+        request: QuizRequest,
+        quiz_data: dict,
+        output_format: str = JSON,
+        max_regenerations: Optional[int] = None
+    ) -> dict:
+        """검증 실패 문항만 재생성하여 기존 세트에 다시 끼워넣기"""
+        if max_regenerations is None:
+            max_regenerations = settings.max_item_regenerations
+        failures = validate_quiz(quiz_data, request.difficulty)
+        if not failures:
+            return quiz_data
+        
+        metrics.increment(f"llm.invalid_sets.{output_format}")
+        logger.warning("퀴즈 검증 실패 - 난이도: %s, 문항: %s", request.difficulty, failures)
+        if len(failures) > max_regenerations:
+            raise ValueError(
+                f"생성된 퀴즈가 검증 규칙을 통과하지 못했습니다 (실패 문항: {sorted(failures)})"
+            )
+        
+        repaired_items = await asyncio.gather(*(
+            self._regenerate_item(request, quiz_data, index, issues)
+            for index, issues in failures.items()
+        ))
+        repaired = dict(quiz_data)
+        for item in repaired_items:
+            repaired.update(item)
+        return repaired
+    
+    async def _regenerate_item(
+        self,
+        request: QuizRequest,
+        quiz_data: dict,
+        index: int,
+        issues: list[str]
+    ) -> dict:
+        """단일 문항 재생성 - 검증을 통과한 Q/A/D(/choices) 필드 반환"""
+        prompt = self._create_item_prompt(request, quiz_data, index, issues)
+        item_data = self._extract_json(await self._invoke_llm(prompt, request.difficulty, kind="item"))
+        
+        item = {
+            f"Q{index}": item_data.get("Q"),
+            f"A{index}": item_data.get("A"),
+            f"D{index}": item_data.get("D")
+        }
+        if request.difficulty != DifficultyLevel.EASY:
+            item[f"Q{index}_choices"] = item_data.get("choices")
+        
+        remaining_issues = validate_item(item, index, request.difficulty)
+        if remaining_issues:
+            raise ValueError(
+                f"{index}번 문항 재생성 결과가 검증 규칙을 통과하지 못했습니다: {', '.join(remaining_issues)}"
+            )
+        
+        logger.info("%s번 문항 재생성 성공 - 난이도: %s", index, request.difficulty)
+        return item
+    
+    def _parse_quiz(self, response_text: str, difficulty: DifficultyLevel, output_format: str) -> dict:
+        """응답 형식에 맞게 퀴즈 세트 파싱 (형식별 파싱 실패율 기록)"""
+        metrics.increment(f"llm.responses.{output_format}")
+        try:
+            if output_format == COMPACT:
+                return decode_compact(response_text, difficulty)
+            return self._extract_json(response_text)
+        except ValueError:
+            metrics.increment(f"llm.parse_failures.{output_format}")
+            raise
+    
+    def _extract_json(self, response_text: str) -> dict:
+        """LLM 응답 텍스트에서 JSON 객체 추출"""
         # 응답 텍스트 정리
-        response_text = response.content.strip()
+        response_text = response_text.strip()
         
         # JSON 블록이 있다면 추출
         if "```json" in response_text:
@@ -296,10 +818,21 @@ class QuizGeneratorService:
         try:
             quiz_data = json.loads(response_text)
         except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}, 응답: {response_text}")
+            logger.error("JSON 파싱 실패: %s", e, extra={"payload": response_text})
             raise ValueError("LLM 응답을 JSON으로 파싱할 수 없습니다.")
         
-        # 난이도별 응답 모델로 변환
+        if not isinstance(quiz_data, dict):
+            raise ValueError("LLM 응답이 JSON 객체 형식이 아닙니다.")
+        return quiz_data
+    
+    def _build_response(
+        self, 
+        quiz_data: dict, 
+        difficulty: DifficultyLevel
+    ) -> Union[EasyQuizResponse, MediumQuizResponse, HardQuizResponse]:
+        """검증된 퀴즈 데이터를 난이도별 응답 모델로 변환"""
+        quiz_data.setdefault("difficulty", int(difficulty))
+        
         if difficulty == DifficultyLevel.EASY:
             quiz_response = EasyQuizResponse(**quiz_data)
         elif difficulty == DifficultyLevel.MEDIUM:
@@ -307,5 +840,21 @@ class QuizGeneratorService:
         else:  # HARD
             quiz_response = HardQuizResponse(**quiz_data)
         
-        logger.info(f"퀴즈 생성 성공 - 난이도: {difficulty}")
+        logger.info("퀴즈 생성 성공 - 난이도: %s", difficulty)
         return quiz_response
+
+
+_quiz_service: Optional[QuizGeneratorService] = None
+
+
+def get_quiz_service() -> QuizGeneratorService:
+    """프로세스 단위 QuizGeneratorService (LLM 클라이언트와 동시성 제한을 공유)"""
+    global _quiz_service
+    if _quiz_service is None:
+        _quiz_service = QuizGeneratorService()
+    return _quiz_service
+
+
+def peek_quiz_service() -> Optional[QuizGeneratorService]:
+    """이미 생성된 서비스만 반환 (상태 확인용 - 새로 생성하지 않음)"""
+    return _quiz_service
@@ -0,0 +1,180 @@
+"""
+미리 생성된 퀴즈 세트 풀
+
+난이도/주제별로 검증을 통과한 퀴즈 데이터를 보관했다가 요청 시 LLM 호출 없이 꺼내 씁니다.
+프로세스 내 풀은 세트를 QuizRecord(압축 표현)로 보관하고 꺼낼 때 dict로 복원합니다.
+공유 상태 경로가 설정되면 SQLite에 저장하여 모든 워커가 같은 풀을 사용합니다.
+
+주제는 클라이언트가 정하므로 보관하는 난이도/주제 수를 max_keys로 제한하고,
+넘으면 가장 오래 쓰이지 않은 키의 세트를 버립니다. 세트를 다 꺼낸 키는 바로 삭제합니다.
+"""
+
+from src.config import settings
+from src.services.shared_state import SharedStateStore, get_shared_store
+from src.services.quiz_record import compact, materialize
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import json
+import time
+
+
+def pool_key(difficulty: int, topic: Optional[str]) -> tuple[int, str]:
+    """풀 키 (난이도, 정규화된 주제) - 주제 없음은 빈 문자열"""
+    return int(difficulty), (topic or "").strip()
+
+
+class QuizPool:
+    """프로세스 내 퀴즈 풀"""
+
+    def __init__(self, max_per_key: int, max_keys: int):
+        self.max_per_key = max_per_key
+        self.max_keys = max_keys
+        self._sets: OrderedDict[tuple[int, str], deque] = OrderedDict()  # 최근에 쓴 키가 뒤쪽
+        self.evicted = 0
+
+    def _queue(self, key: tuple[int, str]) -> deque:
+        """키의 세트 큐 (없으면 만들고, 키 수가 넘치면 가장 오래 쓰이지 않은 키 삭제)"""
+        queue = self._sets.get(key)
+        if queue is None:
+            while len(self._sets) >= self.max_keys:
+                self._sets.popitem(last=False)
+                self.evicted += 1
+            queue = self._sets[key] = deque()
+        else:
+            self._sets.move_to_end(key)
+        return queue
+
+    async def put(self, difficulty: int, topic: Optional[str], quiz_data: dict) -> bool:
+        """퀴즈 세트 추가 - 해당 키가 가득 찼으면 False"""
+        key = pool_key(difficulty, topic)
+        queue = self._sets.get(key)
+        if queue is not None and len(queue) >= self.max_per_key:
+            return False
+        self._queue(key).append(compact(quiz_data, topic))
+        return True
+
+    async def take(self, difficulty: int, topic: Optional[str]) -> Optional[dict]:
+        """가장 오래된 퀴즈 세트를 꺼냄 (한 번 제공된 세트는 다시 나가지 않음)"""
+        key = pool_key(difficulty, topic)
+        queue = self._sets.get(key)
+        if not queue:
+            return None
+        item = queue.popleft()
+        if not queue:
+            del self._sets[key]
+        return materialize(item)
+
+    async def peek(self, difficulty: int, topic: Optional[str]) -> Optional[dict]:
+        """가장 오래된 퀴즈 세트를 꺼내지 않고 조회 (GET 조회용)"""
+        queue = self._sets.get(pool_key(difficulty, topic))
+        return materialize(queue[0]) if queue else None
+    
+    async def depths(self) -> dict[tuple[int, str], int]:
+        """키별 보유 세트 수"""
+        return {key: len(queue) for key, queue in self._sets.items() if queue}
+
+    def contents(self) -> dict[tuple[int, str], list]:
+        """키별 보관 중인 세트 (보관 형식 그대로 복사 - 스냅샷 저장용)"""
+        return {key: list(queue) for key, queue in self._sets.items() if queue}
+
+    def restore(self, key: tuple[int, str], items: list) -> int:
+        """스냅샷 세트를 키의 최대 보관 수까지 추가 - 추가한 수 반환"""
+        queue = self._sets.get(key)
+        added = items[:max(0, self.max_per_key - (len(queue) if queue is not None else 0))]
+        if added:
+            self._queue(key).extend(added)
+        return len(added)
+
+
+class SharedQuizPool:
+    """워커 간 공유되는 퀴즈 풀 (SQLite)"""
+
+    def __init__(self, store: SharedStateStore, max_per_key: int, max_keys: int):
+        self.max_per_key = max_per_key
+        self.max_keys = max_keys
+        self._store = store
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS quiz_pool (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                difficulty INTEGER NOT NULL,
+                topic TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_quiz_pool_key ON quiz_pool (difficulty, topic, id);
+        """)
+
+    def _put(self, key: tuple[int, str], payload: str) -> bool:
+        with self._store.transaction() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM quiz_pool WHERE difficulty = ? AND topic = ?", key
+            ).fetchone()
+            if count >= self.max_per_key:
+                return False
+            if count == 0:
+                self._evict_keys(conn)
+            conn.execute(
+                "INSERT INTO quiz_pool (difficulty, topic, payload, created_at) VALUES (?, ?, ?, ?)",
+                (*key, payload, time.time())
+            )
+            return True
+
+    def _evict_keys(self, conn) -> None:
+        """새 키를 넣기 전 키 수가 max_keys 이상이면 가장 최근 세트가 오래된 키부터 삭제"""
+        rows = conn.execute(
+            "SELECT difficulty, topic FROM quiz_pool GROUP BY difficulty, topic ORDER BY MAX(id)"
+        ).fetchall()
+        for evict_key in rows[:max(0, len(rows) - self.max_keys + 1)]:
+            conn.execute("DELETE FROM quiz_pool WHERE difficulty = ? AND topic = ?", evict_key)
+
+    def _take(self, key: tuple[int, str]) -> Optional[str]:
+        with self._store.transaction() as conn:
+            row = conn.execute(
+                "SELECT id, payload FROM quiz_pool WHERE difficulty = ? AND topic = ? ORDER BY id LIMIT 1",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM quiz_pool WHERE id = ?", (row[0],))
+            return row[1]
+
+    def _peek(self, key: tuple[int, str]) -> Optional[str]:
+        with self._store.transaction() as conn:
+            row = conn.execute(
+                "SELECT payload FROM quiz_pool WHERE difficulty = ? AND topic = ? ORDER BY id LIMIT 1", key
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def _depths(self) -> dict[tuple[int, str], int]:
+        with self._store.transaction() as conn:
+            rows = conn.execute(
+                "SELECT difficulty, topic, COUNT(*) FROM quiz_pool GROUP BY difficulty, topic"
+            ).fetchall()
+        return {(difficulty, topic): count for difficulty, topic, count in rows}
+
+    async def put(self, difficulty: int, topic: Optional[str], quiz_data: dict) -> bool:
+        payload = json.dumps(quiz_data, ensure_ascii=False)
+        return await asyncio.to_thread(self._put, pool_key(difficulty, topic), payload)
+
+    async def take(self, difficulty: int, topic: Optional[str]) -> Optional[dict]:
+        payload = await asyncio.to_thread(self._take, pool_key(difficulty, topic))
+        return json.loads(payload) if payload is not None else None
+
+    async def peek(self, difficulty: int, topic: Optional[str]) -> Optional[dict]:
+        payload = await asyncio.to_thread(self._peek, pool_key(difficulty, topic))
+        return json.loads(payload) if payload is not None else None
+
+    async def depths(self) -> dict[tuple[int, str], int]:
+        return await asyncio.to_thread(self._depths)
+
+
+@lru_cache(maxsize=1)
+def get_quiz_pool():
+    """퀴즈 풀 (공유 상태 경로가 설정되면 워커 간 공유)"""
+    if settings.shared_state_path:
+        return SharedQuizPool(
+            get_shared_store(settings.shared_state_path), settings.pool_max_per_key, settings.pool_max_keys
+        )
+    return QuizPool(settings.pool_max_per_key, settings.pool_max_keys)
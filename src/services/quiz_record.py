@@ -0,0 +1,99 @@
+"""
+퀴즈 세트의 압축 저장 형식
+
+풀에 대량으로 보관하는 세트는 키마다 dict/list/str 객체를 따로 두지 않고,
+문제/선택지/해설 문자열을 구분자로 이어 붙인 문자열 1개와 비트로 묶은 정답, 인턴된 주제로 보관합니다.
+dict(응답 모델과 같은 키 순서)는 풀에서 꺼낼 때만 만들고, pydantic 응답 모델은 응답 직전에만 만듭니다.
+"""
+
+from src.models import DifficultyLevel
+from src.services.quiz_validator import QUIZ_ITEM_COUNT, CHOICE_COUNTS, OX_ANSWERS
+from typing import Optional
+import sys
+
+FIELD_SEPARATOR = "\x1f"  # 퀴즈 본문에 나오지 않는 단위 구분 문자
+ANSWER_BITS = 3
+
+
+def _key_count(choice_count: int) -> int:
+    """난이도 필드 + 문제별 Q/A/D (+ 선택지)"""
+    return 1 + QUIZ_ITEM_COUNT * (4 if choice_count else 3)
+
+
+class QuizRecord:
+    """검증된 퀴즈 세트 1개의 압축 표현"""
+
+    __slots__ = ("difficulty", "topic", "answers", "text")
+
+    def __init__(self, difficulty: int, topic: str, answers: int, text: str):
+        self.difficulty = difficulty
+        self.topic = topic
+        self.answers = answers
+        self.text = text
+
+    @classmethod
+    def from_quiz(cls, quiz_data: dict, topic: Optional[str] = None) -> "QuizRecord":
+        """퀴즈 데이터 압축 - 응답 모델과 다른 형태(추가 키, 구분 문자 포함 등)면 ValueError"""
+        try:
+            difficulty = DifficultyLevel(quiz_data["difficulty"])
+        except (KeyError, ValueError):
+            raise ValueError("난이도를 알 수 없는 퀴즈 데이터입니다.")
+        choice_count = CHOICE_COUNTS.get(difficulty, 0)
+        if len(quiz_data) != _key_count(choice_count):
+            raise ValueError("응답 모델과 다른 키를 가진 퀴즈 데이터입니다.")
+
+        texts = []
+        answers = 0
+        try:
+            for i in range(1, QUIZ_ITEM_COUNT + 1):
+                texts.append(quiz_data[f"Q{i}"])
+                texts.append(quiz_data[f"D{i}"])
+                answer = quiz_data[f"A{i}"]
+                if choice_count:
+                    choices = quiz_data[f"Q{i}_choices"]
+                    if len(choices) != choice_count:
+                        raise ValueError(f"Q{i} 선택지 수가 {choice_count}개가 아닙니다.")
+                    texts.extend(choices)
+                    index = answer - 1
+                    if not 0 <= index < choice_count:
+                        raise ValueError(f"A{i} 정답 번호가 범위를 벗어났습니다.")
+                else:
+                    index = OX_ANSWERS.index(answer)
+                answers |= index << (ANSWER_BITS * (i - 1))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"퀴즈 데이터 형식 오류: {e}")
+
+        if any(not isinstance(text, str) or FIELD_SEPARATOR in text for text in texts):
+            raise ValueError("문자열이 아니거나 구분 문자를 포함한 필드가 있습니다.")
+        return cls(int(difficulty), sys.intern((topic or "").strip()), answers, FIELD_SEPARATOR.join(texts))
+
+    def to_quiz(self) -> dict:
+        """응답 모델과 같은 키 순서의 퀴즈 데이터로 복원"""
+        choice_count = CHOICE_COUNTS.get(DifficultyLevel(self.difficulty), 0)
+        texts = self.text.split(FIELD_SEPARATOR)
+        per_question = 2 + choice_count
+        quiz_data = {"difficulty": self.difficulty}
+        for i in range(1, QUIZ_ITEM_COUNT + 1):
+            offset = per_question * (i - 1)
+            index = (self.answers >> (ANSWER_BITS * (i - 1))) & ((1 << ANSWER_BITS) - 1)
+            quiz_data[f"Q{i}"] = texts[offset]
+            if choice_count:
+                quiz_data[f"Q{i}_choices"] = texts[offset + 2:offset + per_question]
+                quiz_data[f"A{i}"] = index + 1
+            else:
+                quiz_data[f"A{i}"] = OX_ANSWERS[index]
+            quiz_data[f"D{i}"] = texts[offset + 1]
+        return quiz_data
+
+
+def compact(quiz_data: dict, topic: Optional[str] = None):
+    """풀 보관용 표현 - 압축할 수 없는 데이터는 dict 그대로"""
+    try:
+        return QuizRecord.from_quiz(quiz_data, topic)
+    except ValueError:
+        return quiz_data
+
+
+def materialize(stored) -> dict:
+    """풀 보관용 표현(dict, QuizRecord, 스냅샷 항목)을 퀴즈 데이터로 복원"""
+    return stored if isinstance(stored, dict) else stored.to_quiz()
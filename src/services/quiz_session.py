@@ -0,0 +1,186 @@
+"""
+실시간 퀴즈 세션 (라운드 미리 생성)
+
+세션은 라운드별 난이도/주제 진행(주제 순환, 결과에 따른 난이도 조정)을 서버에서 관리하고,
+진행 중인 라운드를 푸는 동안 다음 lookahead개 라운드의 세트를 풀에서 꺼내거나 생성해 미리 보냅니다.
+따라서 라운드 사이에 생성 지연이 거의 보이지 않습니다.
+
+전송은 send 콜백(WebSocket 등)으로 하며, 세션이 끝날 때 보냈지만 아직 시작하지 않은 세트는 풀에 돌려놓습니다.
+"""
+
+from src.config import settings
+from src.models import QuizRequest, DifficultyLevel, TrafficClass
+from src.services.errors import ServiceUnavailableError
+from src.services.metrics import metrics
+from src.services.popularity import popularity
+from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+QUIZ_COUNT = 3
+
+
+class QuizSession:
+    """퀴즈 세션 1개의 라운드 진행과 미리 생성"""
+
+    def __init__(
+        self,
+        quiz_service,
+        send: Callable[[dict], Awaitable[None]],
+        difficulty: DifficultyLevel,
+        topics: list[Optional[str]],
+        adaptive: bool = True,
+        lookahead: Optional[int] = None,
+        max_rounds: Optional[int] = None,
+        client: Optional[str] = None
+    ):
+        self.quiz_service = quiz_service
+        self._send = send
+        self.level = DifficultyLevel(difficulty)
+        self.topics = topics or [None]
+        self.adaptive = adaptive
+        self.lookahead = settings.session_lookahead if lookahead is None else lookahead
+        self.max_rounds = max_rounds or settings.session_max_rounds
+        self.client = client  # 인기도 집계용 클라이언트 구분 값
+        self.completed = 0  # 결과를 받은 라운드 수
+        self.produced = 0   # 클라이언트에 보낸 라운드 수
+        self._sent: dict[int, tuple[QuizRequest, dict]] = {}  # 보냈지만 결과를 받지 않은 라운드
+        self._wake = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._in_flight: Optional[tuple[asyncio.Task, QuizRequest]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.completed >= self.max_rounds
+
+    async def send(self, message: dict) -> None:
+        async with self._send_lock:
+            await self._send(message)
+
+    def _plan(self, round_no: int) -> QuizRequest:
+        """라운드의 난이도/주제 - 난이도는 세트를 만드는 시점의 수준을 따름"""
+        # 클라이언트가 기다리는 라운드만 interactive, 미리 만드는 라운드는 batch로 예약
+        traffic_class = TrafficClass.INTERACTIVE if round_no == self.completed + 1 else TrafficClass.BATCH
+        return QuizRequest(
+            difficulty=self.level,
+            quiz_count=QUIZ_COUNT,
+            topic=self.topics[(round_no - 1) % len(self.topics)],
+            traffic_class=traffic_class
+        )
+
+    def record_result(self, round_no: int, correct: int) -> None:
+        """라운드 결과 반영 - 다 맞히면 난이도를 올리고 1개 이하로 맞히면 내림"""
+        if round_no != self.completed + 1 or round_no > self.produced:
+            raise ValueError(f"진행 중인 라운드가 아닙니다 (현재 라운드: {self.completed + 1}).")
+        if not 0 <= correct <= QUIZ_COUNT:
+            raise ValueError(f"correct는 0~{QUIZ_COUNT} 사이여야 합니다.")
+
+        self._sent.pop(round_no, None)
+        self.completed = round_no
+        metrics.increment("session.rounds")
+        # 다음 라운드가 이미 도착해 있으면 라운드 사이 대기 없음
+        if self.produced > self.completed or self.finished:
+            metrics.increment("session.lookahead_hits")
+        else:
+            metrics.increment("session.lookahead_misses")
+
+        if self.adaptive:
+            if correct == QUIZ_COUNT and self.level < DifficultyLevel.HARD:
+                self.level = DifficultyLevel(self.level + 1)
+            elif correct <= 1 and self.level > DifficultyLevel.EASY:
+                self.level = DifficultyLevel(self.level - 1)
+        self._wake.set()
+
+    def retry(self) -> None:
+        """생성 실패 후 다시 시도"""
+        self._wake.set()
+
+    async def _produce(self, request: QuizRequest) -> tuple[str, dict]:
+        """풀에 있는 세트를 먼저 쓰고 없으면 생성"""
+        pooled = await self.quiz_service.pool.take(request.difficulty, request.topic)
+        if pooled is not None:
+            return "pool", pooled
+
+        task = asyncio.create_task(
+            self.quiz_service.generate_quiz(request, timeout=settings.session_round_timeout)
+        )
+        self._in_flight = (task, request)
+        try:
+            quiz = await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._in_flight = None
+        return "generated", quiz.model_dump()
+
+    async def run(self) -> None:
+        """클라이언트보다 lookahead 라운드 앞서도록 세트를 만들어 보냄 (세션이 끝날 때까지 실행)"""
+        while self.produced < self.max_rounds:
+            if self.produced > self.completed + self.lookahead:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            round_no = self.produced + 1
+            request = self._plan(round_no)
+            try:
+                source, quiz_data = await self._produce(request)
+            except Exception as e:
+                if isinstance(e, ServiceUnavailableError):
+                    status = 503
+                elif isinstance(e, asyncio.TimeoutError) or "시간이 걸렸습니다" in str(e):
+                    status = 408
+                elif isinstance(e, ValueError):
+                    status = 400
+                else:
+                    # HTTP 경로와 같이 예상하지 못한 업스트림 오류는 500으로 알림 (retry로 다시 시도 가능)
+                    status = 500
+                retry_after = getattr(e, "retry_after", None)
+                if status == 500:
+                    logger.error("세션 라운드 %s 생성 중 서버 오류: %s", round_no, e)
+                else:
+                    logger.warning("세션 라운드 %s 생성 실패: %s", round_no, e)
+                metrics.increment("session.round_failures")
+                self._wake.clear()
+                await self.send({
+                    "type": "error",
+                    "round": round_no,
+                    "status": status,
+                    "detail": "퀴즈 생성 중 오류가 발생했습니다." if status == 500 else (str(e) or "퀴즈 생성에 실패했습니다."),
+                    "retry_after": math.ceil(retry_after) if retry_after else None
+                })
+                # 클라이언트가 retry 메시지를 보낼 때까지 대기
+                await self._wake.wait()
+                continue
+
+            self.produced = round_no
+            self._sent[round_no] = (request, quiz_data)
+            popularity.record(request.difficulty, request.topic, client=self.client)
+            await self.send({
+                "type": "quiz",
+                "round": round_no,
+                "difficulty": int(request.difficulty),
+                "topic": request.topic,
+                "source": source,
+                "quiz": quiz_data
+            })
+
+    async def close(self) -> None:
+        """세션 종료 - 진행 중인 생성은 설정에 따라 풀로 마무리하거나 취소하고, 시작하지 않은 세트는 풀에 반환"""
+        if self._in_flight is not None:
+            task, request = self._in_flight
+            self._in_flight = None
+            if not task.done():
+                if settings.finish_into_pool_on_disconnect:
+                    self.quiz_service.finish_into_pool(task, request)
+                else:
+                    task.cancel()
+
+        # 진행 중이던 라운드(completed + 1)는 이미 화면에 보였을 수 있으므로 그 다음 라운드부터 반환
+        for round_no, (request, quiz_data) in sorted(self._sent.items()):
+            if round_no > self.completed + 1:
+                await self.quiz_service.pool.put(request.difficulty, request.topic, quiz_data)
+                metrics.increment("session.returned_to_pool")
+        self._sent.clear()
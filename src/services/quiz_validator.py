@@ -0,0 +1,82 @@
+from src.models import DifficultyLevel
+from typing import Any
+
+
+# 프롬프트에서 요구하는 규칙과 동일하게 유지
+QUIZ_ITEM_COUNT = 3
+CHOICE_MAX_LENGTH = 36
+EXPLANATION_MAX_LENGTH = 150
+
+# 난이도별 선택지 개수 (OX 퀴즈는 선택지 없음)
+CHOICE_COUNTS = {
+    DifficultyLevel.MEDIUM: 3,
+    DifficultyLevel.HARD: 4
+}
+
+OX_ANSWERS = ("O", "X")
+
+
+def _is_blank(value: Any) -> bool:
+    return not isinstance(value, str) or not value.strip()
+
+
+def _normalize_answer(quiz_data: dict, index: int) -> Any:
+    """숫자 문자열 정답("1", " 2 ")을 정수로 바꿔 세트에 반영 (응답 모델도 정수로 받음)"""
+    key = f"A{index}"
+    answer = quiz_data.get(key)
+    if isinstance(answer, str) and answer.strip().isdecimal():
+        answer = quiz_data[key] = int(answer.strip())
+    return answer
+
+
+def validate_item(
+    quiz_data: dict,
+    index: int,
+    difficulty: DifficultyLevel
+) -> list[str]:
+    """단일 문항 검증 - 위반 사항 목록 반환 (빈 목록이면 통과)"""
+    issues = []
+
+    if _is_blank(quiz_data.get(f"Q{index}")):
+        issues.append("문제가 비어 있습니다")
+
+    explanation = quiz_data.get(f"D{index}")
+    if _is_blank(explanation):
+        issues.append("해설이 비어 있습니다")
+    elif len(explanation) > EXPLANATION_MAX_LENGTH:
+        issues.append(f"해설이 {EXPLANATION_MAX_LENGTH}자를 초과합니다 ({len(explanation)}자)")
+
+    if difficulty == DifficultyLevel.EASY:
+        if quiz_data.get(f"A{index}") not in OX_ANSWERS:
+            issues.append("정답은 'O' 또는 'X'여야 합니다")
+        return issues
+
+    choice_count = CHOICE_COUNTS[difficulty]
+    choices = quiz_data.get(f"Q{index}_choices")
+    if not isinstance(choices, list) or len(choices) != choice_count:
+        issues.append(f"선택지는 정확히 {choice_count}개여야 합니다")
+    else:
+        for number, choice in enumerate(choices, 1):
+            if _is_blank(choice):
+                issues.append(f"{number}번 선택지가 비어 있습니다")
+            elif len(choice) > CHOICE_MAX_LENGTH:
+                issues.append(f"{number}번 선택지가 {CHOICE_MAX_LENGTH}자를 초과합니다 ({len(choice)}자)")
+        if len(set(map(str, choices))) != len(choices):
+            issues.append("중복된 선택지가 있습니다")
+
+    answer = _normalize_answer(quiz_data, index)
+    # bool은 int의 하위 타입이므로 별도로 제외
+    if isinstance(answer, bool) or not isinstance(answer, int) or not 1 <= answer <= choice_count:
+        issues.append(f"정답 번호는 1부터 {choice_count} 사이여야 합니다")
+
+    return issues
+
+
+def validate_quiz(quiz_data: dict, difficulty: DifficultyLevel) -> dict[int, list[str]]:
+    """퀴즈 세트 전체 검증 - 실패한 문항 번호별 위반 사항 반환"""
+    failures = {}
+    for index in range(1, QUIZ_ITEM_COUNT + 1):
+        issues = validate_item(quiz_data, index, difficulty)
+        if issues:
+            failures[index] = issues
+    return failures
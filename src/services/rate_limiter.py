@@ -0,0 +1,183 @@
+"""
+클라이언트별 요청 빈도 제한 (토큰 버킷)
+
+클라이언트(발급한 클라이언트 키로 요청하면 키, 아니면 IP)와 경로 종류(read: 조회, generate: LLM 생성)마다 토큰 버킷 1개를 둡니다.
+버킷 상태는 (토큰 수, 갱신 시각)뿐이며 요청마다 O(1)로 보충/차감합니다.
+
+버킷은 마지막 요청 후 가득 찰 시간(burst / 초당 보충량)이 지나면 새 버킷과 같으므로 그때 지워도 동작이 바뀌지 않습니다.
+프로세스 내 저장소는 갱신 순서(LRU)로 만료된 버킷을 앞에서부터 지우고, rate_limit_max_buckets를 넘으면 가장 오래된 버킷을 지웁니다.
+공유 상태(SHARED_STATE_PATH)를 쓰면 SQLite 테이블에 저장해 워커 간에 같은 버킷을 사용합니다.
+"""
+
+from src.config import settings
+from src.services.metrics import metrics
+from src.services.shared_state import SharedStateStore, get_shared_store
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import time
+
+# 공유 저장소에서 만료/초과 버킷을 정리하는 쓰기 간격
+PRUNE_EVERY = 256
+
+
+class RateLimitRule:
+    """경로 종류 하나의 제한 (분당 보충량, 순간 허용량)"""
+
+    __slots__ = ("per_minute", "per_second", "burst")
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        if per_minute <= 0:
+            raise ValueError("per_minute는 0보다 커야 합니다.")
+        self.per_minute = per_minute
+        self.per_second = per_minute / 60
+        self.burst = max(1.0, burst if burst is not None else self.per_second)
+
+    @property
+    def ttl(self) -> float:
+        """빈 버킷이 가득 찰 때까지 걸리는 시간 (초)"""
+        return self.burst / self.per_second
+
+    def consume(self, tokens: float, updated: float, now: float) -> tuple[float, float]:
+        """토큰 보충 후 1개 차감 - (남은 토큰, 재시도까지 남은 시간), 허용되면 재시도 시간 0"""
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.per_second)
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) / self.per_second
+
+
+class LocalBucketStore:
+    """프로세스 내 버킷 저장소 (크기 제한 LRU)"""
+
+    def __init__(self, max_buckets: int):
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[tuple[str, str], list] = OrderedDict()  # 키 → [토큰, 갱신 시각, 만료 시각]
+        self.evicted = 0
+
+    def _consume(self, key: tuple[str, str], rule: RateLimitRule, now: float) -> float:
+        buckets = self._buckets
+        # 가장 오래 전에 갱신된 버킷부터 만료된 것 정리 (각 버킷은 한 번만 지워지므로 요청당 평균 O(1))
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if oldest[2] > now:
+                break
+            buckets.popitem(last=False)
+
+        bucket = buckets.get(key)
+        if bucket is None:
+            tokens, retry_after = rule.consume(rule.burst, now, now)
+            buckets[key] = [tokens, now, now + rule.ttl]
+            if len(buckets) > self.max_buckets:
+                buckets.popitem(last=False)
+                self.evicted += 1
+        else:
+            tokens, retry_after = rule.consume(bucket[0], bucket[1], now)
+            bucket[0], bucket[1], bucket[2] = tokens, now, now + rule.ttl
+            buckets.move_to_end(key)
+        return retry_after
+
+    async def consume(self, key: tuple[str, str], rule: RateLimitRule) -> float:
+        return self._consume(key, rule, time.monotonic())
+
+    def size(self) -> Optional[int]:
+        return len(self._buckets)
+
+
+class SharedBucketStore:
+    """워커 간 공유되는 버킷 저장소 (SQLite 테이블, 주기적으로 만료/초과분 정리)"""
+
+    def __init__(self, store: SharedStateStore, max_buckets: int):
+        self.max_buckets = max_buckets
+        self.evicted = 0
+        self._store = store
+        self._writes = 0
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                client TEXT NOT NULL,
+                route_class TEXT NOT NULL,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (client, route_class)
+            );
+            CREATE INDEX IF NOT EXISTS rate_buckets_expires ON rate_buckets (expires_at);
+        """)
+
+    def _consume(self, key: tuple[str, str], rule: RateLimitRule) -> float:
+        now = time.time()
+        with self._store.transaction() as conn:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_buckets WHERE client = ? AND route_class = ?", key
+            ).fetchone()
+            tokens, updated = row if row is not None else (rule.burst, now)
+            tokens, retry_after = rule.consume(tokens, updated, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_buckets (client, route_class, tokens, updated_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, tokens, now, now + rule.ttl)
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                conn.execute("DELETE FROM rate_buckets WHERE expires_at < ?", (now,))
+                cursor = conn.execute(
+                    "DELETE FROM rate_buckets WHERE rowid IN "
+                    "(SELECT rowid FROM rate_buckets ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_buckets,)
+                )
+                self.evicted += cursor.rowcount
+        return retry_after
+
+    async def consume(self, key: tuple[str, str], rule: RateLimitRule) -> float:
+        return await asyncio.to_thread(self._consume, key, rule)
+
+    def size(self) -> Optional[int]:
+        return None  # 공유 테이블 크기는 요청 경로에서 세지 않음
+
+
+class RateLimiter:
+    """경로 종류별 클라이언트 토큰 버킷 검사"""
+
+    def __init__(self, store, rules: dict[str, RateLimitRule]):
+        self.store = store
+        self.rules = rules
+
+    async def check(self, client: str, route_class: str) -> float:
+        """요청 1개 허용 여부 - 허용되면 0, 거절되면 재시도까지 남은 시간 (초)"""
+        rule = self.rules.get(route_class)
+        if rule is None:
+            return 0.0
+        retry_after = await self.store.consume((client, route_class), rule)
+        if retry_after:
+            metrics.increment(f"rate_limit.rejected.{route_class}")
+        return retry_after
+
+    def stats(self) -> dict:
+        return {
+            "enabled": True,
+            "shared": isinstance(self.store, SharedBucketStore),
+            "rules": {
+                route_class: {"per_minute": rule.per_minute, "burst": rule.burst}
+                for route_class, rule in self.rules.items()
+            },
+            "buckets": self.store.size(),
+            "max_buckets": self.store.max_buckets,
+            "evicted": self.store.evicted
+        }
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """요청 빈도 제한기 (비활성화 시 None, 공유 상태 경로가 설정되면 워커 간 공유)"""
+    if not settings.rate_limit_enabled:
+        return None
+    rules = {
+        route_class: RateLimitRule(limit["per_minute"], limit.get("burst"))
+        for route_class, limit in settings.rate_limits.items()
+        if limit.get("per_minute")
+    }
+    if settings.shared_state_path:
+        store = SharedBucketStore(get_shared_store(settings.shared_state_path), settings.rate_limit_max_buckets)
+    else:
+        store = LocalBucketStore(settings.rate_limit_max_buckets)
+    return RateLimiter(store, rules)
@@ -0,0 +1,70 @@
+from src.config import settings
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.quiz_generator import peek_quiz_service
+from typing import Optional
+import asyncio
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessProber:
+    """readiness 상태를 주기적으로 계산해 캐시 (프로브 요청은 캐시만 읽음, LLM 호출 없음)"""
+
+    def __init__(self):
+        self.ready = False
+        self.snapshot: dict = {"status": "starting"}
+        self.body: bytes = json.dumps(self.snapshot).encode()
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> None:
+        """현재 서비스 상태로 스냅샷 갱신"""
+        service = peek_quiz_service()
+        initialized = service is not None and service.llm_ready
+        breaker_state = service.breaker.state if service is not None else CircuitBreaker.CLOSED
+
+        pool_depth = 0
+        last_success_age = None
+        if service is not None:
+            pool_depth = sum((await service.pool.depths()).values())
+            if service.last_success_at is not None:
+                last_success_age = round(time.time() - service.last_success_at, 1)
+
+        # 시작 시 warmup을 하지 않는 설정이면 첫 요청에서 초기화되므로 준비 조건에서 제외
+        warmed = initialized or not settings.warmup_on_startup
+        self.ready = warmed and breaker_state != CircuitBreaker.OPEN
+        self.snapshot = {
+            "status": "ready" if self.ready else "not_ready",
+            "service_initialized": initialized,
+            "breaker_state": breaker_state,
+            "pool_depth": pool_depth,
+            "last_llm_success_age": last_success_age,
+            "checked_at": round(time.time(), 3)
+        }
+        self.body = json.dumps(self.snapshot, ensure_ascii=False).encode()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("readiness 상태 갱신 실패: %s", e)
+            await asyncio.sleep(settings.readiness_probe_interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+readiness_prober = ReadinessProber()
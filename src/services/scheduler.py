@@ -0,0 +1,168 @@
+"""
+LLM 호출 앞단의 가중치 기반 공정 큐 (weighted fair queueing)
+
+interactive/batch 클래스는 가중치 비율대로 슬롯을 나눠 받아 batch가 몰려도 interactive 몫이 보장되고,
+background 클래스는 다른 클래스 대기열이 비어 있을 때만, 그리고 슬롯 하나를 비워 둔 채로만 실행됩니다.
+
+대기열 길이가 high watermark에 닿으면 과부하 상태가 되어 low watermark 아래로 내려갈 때까지 유지됩니다
+(과부하 상태에서 새 요청을 받지 않는 처리는 호출자가 overloaded()로 판단).
+"""
+
+from src.models import TrafficClass
+from src.services.metrics import metrics
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional
+import asyncio
+import time
+
+
+FOREGROUND_CLASSES = (TrafficClass.INTERACTIVE, TrafficClass.BATCH)
+
+
+class WeightedFairScheduler:
+    """트래픽 클래스별 대기열과 가중치 기반 슬롯 배분"""
+    
+    def __init__(
+        self,
+        capacity: int,
+        weights: dict[str, float],
+        high_watermark: Optional[int] = None,
+        low_watermark: Optional[int] = None
+    ):
+        self.capacity = capacity
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark if low_watermark is not None else (high_watermark or 0) // 2
+        self._overloaded = False
+        self.weights = {cls: float(weights.get(cls.value, 1.0)) for cls in FOREGROUND_CLASSES}
+        self._queues: dict[TrafficClass, deque] = {cls: deque() for cls in TrafficClass}
+        self._in_flight: dict[TrafficClass, int] = {cls: 0 for cls in TrafficClass}
+        # 클래스별 가상 시간 (처리될 때마다 1/가중치만큼 증가, 가장 작은 클래스가 다음 차례)
+        self._pass: dict[TrafficClass, float] = {cls: 0.0 for cls in FOREGROUND_CLASSES}
+    
+    @property
+    def active(self) -> int:
+        return sum(self._in_flight.values())
+    
+    def _has_waiters(self, cls: TrafficClass) -> bool:
+        queue = self._queues[cls]
+        while queue and queue[0][0].cancelled():
+            queue.popleft()
+        return bool(queue)
+    
+    def _background_limit(self) -> int:
+        # 새로 도착하는 interactive 요청을 위해 슬롯 하나는 비워 둠
+        return max(1, self.capacity - 1)
+    
+    def _pick(self):
+        if self.active >= self.capacity:
+            return None
+        candidates = [cls for cls in FOREGROUND_CLASSES if self._has_waiters(cls)]
+        if candidates:
+            cls = min(candidates, key=self._pass.__getitem__)
+            self._pass[cls] += 1.0 / self.weights[cls]
+            return cls
+        if self._has_waiters(TrafficClass.BACKGROUND) and self.active < self._background_limit():
+            return TrafficClass.BACKGROUND
+        return None
+    
+    def _dispatch(self) -> None:
+        while True:
+            cls = self._pick()
+            if cls is None:
+                return
+            future, enqueued_at = self._queues[cls].popleft()
+            self._grant(cls, enqueued_at)
+            future.set_result(None)
+    
+    def _grant(self, cls: TrafficClass, enqueued_at: float) -> None:
+        self._in_flight[cls] += 1
+        metrics.increment(f"scheduler.admitted.{cls.value}")
+        metrics.observe(f"scheduler.wait_ms.{cls.value}", (time.monotonic() - enqueued_at) * 1000)
+    
+    def _can_start_now(self, cls: TrafficClass) -> bool:
+        if any(self._has_waiters(c) for c in TrafficClass):
+            return False
+        if cls == TrafficClass.BACKGROUND:
+            return self.active < self._background_limit()
+        return self.active < self.capacity
+    
+    async def acquire(self, cls: TrafficClass) -> None:
+        enqueued_at = time.monotonic()
+        if self._can_start_now(cls):
+            if cls in self._pass:
+                self._pass[cls] += 1.0 / self.weights[cls]
+            self._grant(cls, enqueued_at)
+            return
+        
+        if cls in self._pass and not self._has_waiters(cls):
+            # 쉬다가 돌아온 클래스가 밀린 몫을 한꺼번에 가져가지 않도록 가상 시간 보정
+            active_passes = [self._pass[c] for c in FOREGROUND_CLASSES if c != cls and self._has_waiters(c)]
+            if active_passes:
+                self._pass[cls] = max(self._pass[cls], min(active_passes))
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queues[cls].append((future, enqueued_at))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 반납
+                self.release(cls)
+            else:
+                future.cancel()
+            raise
+    
+    def release(self, cls: TrafficClass) -> None:
+        self._in_flight[cls] -= 1
+        self._dispatch()
+    
+    @asynccontextmanager
+    async def slot(self, cls: TrafficClass):
+        await self.acquire(cls)
+        try:
+            yield
+        finally:
+            self.release(cls)
+    
+    def queued_ahead(self, cls: TrafficClass) -> int:
+        """새 요청보다 먼저 처리될 대기 요청 수 (background는 모든 대기 요청 뒤)"""
+        classes = TrafficClass if cls == TrafficClass.BACKGROUND else FOREGROUND_CLASSES
+        return sum(len(self._queues[c]) for c in classes)
+    
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+    
+    def waiting(self) -> int:
+        """취소되지 않은 대기 요청 수"""
+        return sum(1 for queue in self._queues.values() for future, _ in queue if not future.cancelled())
+    
+    def overloaded(self) -> bool:
+        """과부하 여부 (high watermark 이상에서 진입, low watermark 이하에서 해제)"""
+        if self.high_watermark is None:
+            return False
+        depth = self.waiting()
+        if self._overloaded and depth <= self.low_watermark:
+            self._overloaded = False
+            metrics.increment("scheduler.overload_exited")
+        elif not self._overloaded and depth >= self.high_watermark:
+            self._overloaded = True
+            metrics.increment("scheduler.overload_entered")
+        return self._overloaded
+    
+    def stats(self) -> dict:
+        """클래스별 대기/실행 현황"""
+        return {
+            "capacity": self.capacity,
+            "queue_depth": self.waiting(),
+            "overloaded": self._overloaded,
+            "watermarks": {"high": self.high_watermark, "low": self.low_watermark},
+            "classes": {
+                cls.value: {
+                    "queued": sum(1 for future, _ in self._queues[cls] if not future.cancelled()),
+                    "in_flight": self._in_flight[cls],
+                    "weight": self.weights.get(cls)
+                }
+                for cls in TrafficClass
+            }
+        }
@@ -0,0 +1,224 @@
+"""
+워커 프로세스 간 공유 상태 (SQLite 코디네이터)
+
+여러 uvicorn 워커가 같은 SQLite 파일을 바라보게 하여
+업스트림 동시 호출 제한 등을 프로세스 수와 무관하게 전역으로 유지합니다.
+"""
+
+from src.config import settings
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+
+# 임대(lease) 만료 시간 - 최대 요청 타임아웃(120초)보다 길게 유지
+LEASE_SECONDS = 150.0
+
+# 슬롯 대기 시 폴링 간격 (초)
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.5
+
+
+class SharedStateStore:
+    """프로세스 간 공유되는 SQLite 저장소 (연결 하나를 스레드 락으로 보호)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=5.0,
+            isolation_level=None,  # 트랜잭션은 직접 관리
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 워커 간 직렬화)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+
+    def execute_script(self, script: str) -> None:
+        """스키마 초기화 등 단순 스크립트 실행"""
+        with self._lock:
+            self._conn.executescript(script)
+
+
+@lru_cache(maxsize=None)
+def get_shared_store(path: str) -> SharedStateStore:
+    """경로별 공유 저장소 (프로세스 내 단일 인스턴스)"""
+    return SharedStateStore(path)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # 다른 사용자의 프로세스
+    return True
+
+
+class UpstreamLimiter:
+    """프로세스 내 업스트림 동시 호출 제한"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            yield
+
+    async def in_use(self) -> int:
+        return self.limit - self._semaphore._value
+
+
+class SharedUpstreamLimiter:
+    """워커 간 공유되는 업스트림 동시 호출 제한 (SQLite 임대 테이블)"""
+
+    def __init__(self, store: SharedStateStore, limit: int, lease_seconds: float = LEASE_SECONDS):
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self._store = store
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS upstream_leases (
+                lease_id TEXT PRIMARY KEY,
+                pid INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            );
+        """)
+        self._purge_dead_leases()
+
+    def _purge_dead_leases(self) -> None:
+        """이 호스트에서 이미 종료된 프로세스의 임대 회수 (강제 종료된 워커가 만료 전까지 용량을 잡고 있지 않도록)"""
+        with self._store.transaction() as conn:
+            pids = [pid for (pid,) in conn.execute("SELECT DISTINCT pid FROM upstream_leases")]
+            dead = [pid for pid in pids if not _process_alive(pid)]
+            for pid in dead:
+                conn.execute("DELETE FROM upstream_leases WHERE pid = ?", (pid,))
+
+    def _try_acquire(self) -> Optional[str]:
+        now = time.time()
+        with self._store.transaction() as conn:
+            # 비정상 종료된 워커의 임대는 만료 시 회수
+            conn.execute("DELETE FROM upstream_leases WHERE expires_at < ?", (now,))
+            (count,) = conn.execute("SELECT COUNT(*) FROM upstream_leases").fetchone()
+            if count >= self.limit:
+                return None
+            lease_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO upstream_leases (lease_id, pid, expires_at) VALUES (?, ?, ?)",
+                (lease_id, os.getpid(), now + self.lease_seconds)
+            )
+            return lease_id
+
+    def _release(self, lease_id: str) -> None:
+        with self._store.transaction() as conn:
+            conn.execute("DELETE FROM upstream_leases WHERE lease_id = ?", (lease_id,))
+
+    def _release_later(self, task: "asyncio.Future") -> None:
+        """취소된 획득 시도가 뒤늦게 임대를 얻은 경우 반납"""
+        if not task.cancelled() and task.exception() is None and task.result():
+            asyncio.get_running_loop().run_in_executor(None, self._release, task.result())
+
+    async def _acquire(self) -> str:
+        interval = POLL_INTERVAL
+        while True:
+            attempt = asyncio.ensure_future(asyncio.to_thread(self._try_acquire))
+            try:
+                lease_id = await asyncio.shield(attempt)
+            except asyncio.CancelledError:
+                attempt.add_done_callback(self._release_later)
+                raise
+            if lease_id:
+                return lease_id
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    @asynccontextmanager
+    async def slot(self):
+        lease_id = await self._acquire()
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self._release, lease_id)
+
+    async def in_use(self) -> int:
+        def count() -> int:
+            with self._store.transaction() as conn:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM upstream_leases WHERE expires_at >= ?", (time.time(),)
+                ).fetchone()[0]
+        return await asyncio.to_thread(count)
+
+
+class LeaderLease:
+    """워커 중 한 곳에서만 실행할 작업의 리더 임대 (SQLite, 만료 시 다른 워커가 인수)"""
+
+    def __init__(self, store: SharedStateStore, name: str):
+        self.name = name
+        self.holder = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._store = store
+        self._store.execute_script("""
+            CREATE TABLE IF NOT EXISTS leader_leases (
+                name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+        """)
+
+    def _try_acquire(self, ttl: float) -> bool:
+        now = time.time()
+        with self._store.transaction() as conn:
+            row = conn.execute("SELECT holder, expires_at FROM leader_leases WHERE name = ?", (self.name,)).fetchone()
+            if row is not None and row[0] != self.holder and row[1] >= now:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leader_leases (name, holder, expires_at) VALUES (?, ?, ?)",
+                (self.name, self.holder, now + ttl)
+            )
+            return True
+
+    def _release(self) -> None:
+        with self._store.transaction() as conn:
+            conn.execute("DELETE FROM leader_leases WHERE name = ? AND holder = ?", (self.name, self.holder))
+
+    async def acquire(self, ttl: float) -> bool:
+        """리더 임대 획득/연장 - 다른 워커가 유효한 임대를 가지고 있으면 False"""
+        return await asyncio.to_thread(self._try_acquire, ttl)
+
+    async def release(self) -> None:
+        await asyncio.to_thread(self._release)
+
+
+@lru_cache(maxsize=1)
+def get_upstream_limiter():
+    """업스트림 동시 호출 제한기 (공유 상태 경로가 설정되면 워커 간 공유)"""
+    if settings.shared_state_path:
+        return SharedUpstreamLimiter(
+            get_shared_store(settings.shared_state_path),
+            settings.upstream_capacity
+        )
+    return UpstreamLimiter(settings.upstream_capacity)